@@ -0,0 +1,119 @@
+"""واجهة HTTP غير متزامنة لحاسبات الكتاب (دون واجهة Streamlit) لخدمات أخرى وعملاء الدفعات
+
+تستخدم tornado (يُثبَّت مع streamlit) ونفس صيغ econ_app.formulas التي تستخدمها الواجهة.
+
+أمثلة:
+    python api_server.py --port 8600
+    python api_server.py --port 8600 --processes 4      # عملية لكل نواة على نفس المنفذ
+
+    curl -X POST localhost:8600/v1/calculators/gdp \\
+         -d '{"consumption": [1500, 1600], "investment": 400, "government": 500, "exports": 600, "imports": 550}'
+    curl localhost:8600/v1/calculators            # الحاسبات ومدخلاتها
+    curl localhost:8600/metrics                   # عدادات الطلبات والذاكرة المؤقتة والتجميع
+
+كل طلب يقبل دفعة: كائن أعمدة أو قائمة صفوف بصيغة JSON، أو جدول Arrow IPC
+(Content-Type: application/vnd.apache.arrow.stream). النتيجة JSON، أو Arrow إذا طلبها العميل
+عبر Accept.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+import tornado.httpserver
+import tornado.netutil
+import tornado.process
+import tornado.web
+
+from econ_app import calculator_api, profiler
+from econ_app.calculator_api import ARROW_MEDIA_TYPE, CALCULATORS, InputError
+
+
+# ========== المعالجات ==========
+class BaseHandler(tornado.web.RequestHandler):
+    def write_json(self, payload, status=200):
+        self.set_status(status)
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+        self.finish(payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False))
+
+
+class CalculatorsHandler(BaseHandler):
+    def get(self):
+        self.write_json(calculator_api.calculators_info())
+
+
+class CalculatorHandler(BaseHandler):
+    async def post(self, name):
+        if name not in CALCULATORS:
+            self.write_json({"error": f"حاسبة غير معروفة: {name}", "available": list(CALCULATORS)}, 404)
+            return
+
+        content_type = self.request.headers.get("Content-Type", "")
+        try:
+            result = await calculator_api.compute(name, self.request.body, content_type)
+        except InputError as e:
+            self.write_json({"error": str(e)}, 400)
+            return
+
+        if ARROW_MEDIA_TYPE in self.request.headers.get("Accept", ""):
+            self.set_header("Content-Type", ARROW_MEDIA_TYPE)
+            self.finish(calculator_api.arrow_response(result))
+        else:
+            self.write_json(calculator_api.json_response(name, result))
+
+
+class HealthHandler(BaseHandler):
+    def get(self):
+        self.write_json({"status": "ok", "calculators": len(CALCULATORS)})
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.finish(calculator_api.api_metrics_text() + profiler.prometheus_text())
+
+
+def make_app():
+    """تطبيق tornado بمسارات الحاسبات والصحة والمقاييس"""
+    return tornado.web.Application([
+        (r"/v1/calculators", CalculatorsHandler),
+        (r"/v1/calculators/([a-z_0-9]+)", CalculatorHandler),
+        (r"/health", HealthHandler),
+        (r"/metrics", MetricsHandler)
+    ])
+
+
+# ========== التشغيل ==========
+async def serve(sockets):
+    server = tornado.httpserver.HTTPServer(make_app(), xheaders=True)
+    server.add_sockets(sockets)
+    await asyncio.Event().wait()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="واجهة HTTP لحاسبات الاقتصاد الكلي (JSON/Arrow)")
+    parser.add_argument("--host", default="127.0.0.1", help="عنوان الاستماع")
+    parser.add_argument("--port", type=int, default=8600, help="منفذ الاستماع")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="عدد العمليات على نفس المنفذ (0 = عملية لكل نواة)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # المقبس يُفتح قبل إنشاء العمليات فتتقاسمه (كل عملية لها ذاكرتها المؤقتة وحلقة أحداثها)
+    sockets = tornado.netutil.bind_sockets(args.port, args.host)
+    print(f"✅ الواجهة تعمل على http://{args.host}:{args.port}/v1/calculators", flush=True)
+    if args.processes != 1:
+        tornado.process.fork_processes(args.processes)
+
+    try:
+        asyncio.run(serve(sockets))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""تشغيل تحليلات الفصول على عدة مجموعات بيانات دون واجهة Streamlit
+
+أمثلة:
+    python batch_reports.py data/ --output reports --workers 8
+    python batch_reports.py --panel countries.csv --country-col البلد --countries فرنسا ألمانيا
+
+الملف المجمّع يُنشر مرة واحدة في الذاكرة المشتركة، وكل عملية تقرأ صفوف بلدها دون نسخ.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from econ_app import analytics, shared_columns
+from econ_app.data_export import EXPORT_FORMATS
+from econ_app.datasets import read_dataset, find_datasets
+from econ_app.report_export import build_excel_report
+
+# صيغ التصدير المتاحة في سطر الأوامر: xlsx + الصيغ العمودية
+EXPORT_KINDS = {"xlsx": (".xlsx", None)}
+EXPORT_KINDS.update({spec["kind"]: (spec["suffix"], spec["writer"]) for spec in EXPORT_FORMATS.values()})
+
+
+def _safe_name(name):
+    """اسم صالح كمجلد على القرص"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(name)).strip("_") or "dataset"
+
+
+def _write_table(df, path, index=False):
+    # utf-8-sig حتى يفتح Excel الأعمدة العربية بشكل صحيح
+    df.to_csv(path, index=index, encoding="utf-8-sig")
+
+
+def _write_figure(fig, path):
+    fig.write_html(path, include_plotlyjs="cdn")
+
+
+# ========== تحليل مجموعة بيانات واحدة ==========
+def run_dataset(name, source, output_dir, columns, export_kinds, figures=True):
+    """تشغيل جميع التحليلات الممكنة على مجموعة بيانات وكتابة النتائج في مجلدها"""
+    started = time.perf_counter()
+    summary = {"dataset": name, "status": "ok", "rows": 0, "analyses": []}
+
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            df = read_dataset(source)
+        elif shared_columns.is_descriptor(source):
+            df = shared_columns.attach(source)
+        else:
+            df = source
+        summary["rows"] = len(df)
+
+        dataset_dir = os.path.join(output_dir, _safe_name(name))
+        os.makedirs(dataset_dir, exist_ok=True)
+
+        if figures:
+            from econ_app import charts
+
+        year_col = columns["year"]
+        gdp_col = columns["gdp"]
+        growth_col = columns["growth"]
+        inflation_col = columns["inflation"]
+        unemployment_col = columns["unemployment"]
+
+        # الاتجاه العام للناتج
+        if gdp_col in df.columns and len(df) > 1:
+            gdp = df[gdp_col]
+            trend = analytics.trend_regression(gdp)
+            years = df[year_col] if year_col in df.columns else np.arange(len(df))
+
+            _write_table(pd.DataFrame({
+                year_col: years,
+                gdp_col: gdp,
+                "الاتجاه_العام": trend["trend_line"]
+            }), os.path.join(dataset_dir, "trend.csv"))
+
+            summary.update({
+                "trend_slope": trend["slope"],
+                "trend_r2": trend["r_squared"],
+                "avg_growth": trend["avg_growth"]
+            })
+            summary["analyses"].append("trend")
+
+            if figures:
+                _write_figure(charts.trend_figure(years, gdp, trend["trend_line"]),
+                              os.path.join(dataset_dir, "trend.html"))
+
+        # قانون أوكون
+        if growth_col in df.columns and unemployment_col in df.columns:
+            okun = analytics.okun_fit(df, growth_col, unemployment_col)
+            if okun is not None:
+                _write_table(pd.DataFrame([okun]), os.path.join(dataset_dir, "okun.csv"))
+                summary.update({
+                    "okun_coefficient": okun["okun_coefficient"],
+                    "okun_r2": okun["r_squared"],
+                    "natural_growth": okun["natural_growth"]
+                })
+                summary["analyses"].append("okun")
+
+                if figures:
+                    df_analysis = analytics.okun_data(df, growth_col, unemployment_col)
+                    _write_figure(charts.okun_scatter_figure(df_analysis, growth_col, year_col),
+                                  os.path.join(dataset_dir, "okun.html"))
+
+        # منحنى فيليبس
+        if inflation_col in df.columns and unemployment_col in df.columns:
+            phillips = analytics.phillips_fit(df, inflation_col, unemployment_col)
+            if phillips is not None:
+                _write_table(pd.DataFrame([phillips]), os.path.join(dataset_dir, "phillips.csv"))
+                summary.update({
+                    "phillips_slope": phillips["slope"],
+                    "phillips_r2": phillips["r_squared"]
+                })
+                summary["analyses"].append("phillips")
+
+                if figures:
+                    phillips_data = df[[unemployment_col, inflation_col]].dropna().rename(columns={
+                        unemployment_col: analytics.UNEMPLOYMENT_COL,
+                        inflation_col: analytics.INFLATION_COL
+                    })
+                    _write_figure(
+                        charts.phillips_figure(phillips_data, round(phillips["avg_unemployment"], 1),
+                                               title="منحنى فيليبس - بيانات حقيقية"),
+                        os.path.join(dataset_dir, "phillips.html")
+                    )
+
+        # الإحصائيات الوصفية والتصدير
+        statistics = analytics.dataset_statistics(df)
+        _write_table(statistics["describe"], os.path.join(dataset_dir, "describe.csv"), index=True)
+
+        if len(statistics["corr"].columns) >= 2:
+            _write_table(statistics["corr"], os.path.join(dataset_dir, "correlation.csv"), index=True)
+
+        for kind in export_kinds:
+            suffix, writer = EXPORT_KINDS[kind]
+            path = os.path.join(dataset_dir, f"data{suffix}")
+            if writer is None:
+                build_excel_report(df, path, describe=statistics["describe"], corr=statistics["corr"])
+            else:
+                writer(df, path)
+        summary["analyses"].append("export")
+
+    except Exception as e:
+        summary["status"] = f"error: {e}"
+
+    summary["analyses"] = ",".join(summary["analyses"])
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+# ========== تحديد المهام ==========
+def build_jobs(args):
+    """قائمة (الاسم، المصدر) لكل مجموعة بيانات مطلوبة"""
+    jobs = []
+
+    for path in find_datasets(args.inputs):
+        jobs.append((os.path.splitext(os.path.basename(path))[0], path))
+
+    if args.panel:
+        panel = read_dataset(args.panel)
+        if args.country_col not in panel.columns:
+            raise SystemExit(f"العمود '{args.country_col}' غير موجود في {args.panel}")
+
+        # ترتيب ثابت حسب البلد يجعل صفوف كل بلد متجاورة، فتكفي المهمة حدود نطاقها في الملف المنشور
+        panel = panel.sort_values(args.country_col, kind="stable").reset_index(drop=True)
+        descriptor = shared_columns.publish(panel, key=f"panel:{args.panel}")
+
+        wanted = set(args.countries) if args.countries else None
+        for country, positions in panel.groupby(args.country_col, sort=True).indices.items():
+            if wanted is None or str(country) in wanted:
+                source = shared_columns.rows(descriptor, int(positions[0]), int(positions[-1]) + 1)
+                jobs.append((str(country), source))
+
+        if wanted:
+            missing = wanted - set(panel[args.country_col].astype(str))
+            for country in sorted(missing):
+                print(f"⚠️ لا توجد بيانات للبلد: {country}", file=sys.stderr)
+
+    return jobs
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="تشغيل تحليلات الاقتصاد الكلي (الاتجاه، أوكون، فيليبس، السياسات، التصدير) على دفعة من البيانات"
+    )
+    parser.add_argument("inputs", nargs="*", help="ملفات أو مجلدات بيانات (CSV/Excel/Parquet/Arrow)")
+    parser.add_argument("--panel", help="ملف بيانات مجمّع لعدة دول يُقسَّم حسب عمود البلد")
+    parser.add_argument("--country-col", default="البلد", help="عمود البلد في الملف المجمّع")
+    parser.add_argument("--countries", nargs="+", help="الدول المطلوبة فقط (افتراضياً: جميع الدول)")
+    parser.add_argument("--output", default="reports", help="مجلد كتابة النتائج")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="عدد العمليات المتوازية")
+    parser.add_argument("--formats", nargs="+", default=["xlsx"], choices=sorted(EXPORT_KINDS),
+                        help="صيغ تصدير البيانات لكل مجموعة")
+    parser.add_argument("--no-figures", action="store_true", help="عدم كتابة الرسوم البيانية (HTML)")
+
+    parser.add_argument("--year-col", default=analytics.YEAR_COL)
+    parser.add_argument("--gdp-col", default=analytics.REAL_GDP_COL)
+    parser.add_argument("--growth-col", default=analytics.GROWTH_COL)
+    parser.add_argument("--inflation-col", default=analytics.INFLATION_COL)
+    parser.add_argument("--unemployment-col", default=analytics.UNEMPLOYMENT_COL)
+
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.panel:
+        parser.error("يجب تحديد ملفات/مجلدات بيانات أو --panel")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output, exist_ok=True)
+
+    columns = {
+        "year": args.year_col,
+        "gdp": args.gdp_col,
+        "growth": args.growth_col,
+        "inflation": args.inflation_col,
+        "unemployment": args.unemployment_col
+    }
+
+    jobs = build_jobs(args)
+    if not jobs:
+        print("لا توجد مجموعات بيانات للمعالجة", file=sys.stderr)
+        return 1
+
+    # جدول تأثيرات السياسات لا يعتمد على البيانات فيُكتب مرة واحدة
+    _write_table(analytics.policy_effects_table(), os.path.join(args.output, "policy_effects.csv"))
+
+    started = time.perf_counter()
+    summaries = []
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(run_dataset, name, source, args.output, columns, args.formats, not args.no_figures): name
+            for name, source in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            summary = future.result()
+            summaries.append(summary)
+            print(f"[{done}/{len(jobs)}] {summary['dataset']}: {summary['status']} ({summary['seconds']}s)")
+
+    summary_df = pd.DataFrame(summaries).sort_values("dataset")
+    _write_table(summary_df, os.path.join(args.output, "summary.csv"))
+
+    failed = (summary_df["status"] != "ok").sum()
+    print(f"✅ {len(jobs) - failed}/{len(jobs)} مجموعة بيانات في {time.perf_counter() - started:.1f} ثانية → {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
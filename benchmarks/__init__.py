@@ -0,0 +1,6 @@
+"""قياسات أداء مصغرة لصيغ الكتاب وقراءة الملفات المرفوعة وتصدير التقارير
+
+التشغيل من جذر المستودع:
+    python -m benchmarks.run
+    python -m benchmarks.run --suites formulas --max-rows 10000000
+"""
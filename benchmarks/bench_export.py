@@ -0,0 +1,40 @@
+"""قياس تصدير التمرين 5: تقرير Excel (متدفق وعبر ExcelWriter) والصيغ العمودية"""
+import os
+
+from econ_app.report_export import build_excel_report
+from benchmarks.harness import synthetic_frame
+from benchmarks.bench_ingestion import XLSX_MAX_ROWS
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def cases(max_rows, data_dir):
+    """حالات القياس: كل صيغة تصدير يعرضها التمرين 5 لكل حجم بيانات"""
+    from econ_app.data_export import EXPORT_FORMATS
+
+    os.makedirs(data_dir, exist_ok=True)
+
+    for rows in SIZES:
+        if rows > min(max_rows, XLSX_MAX_ROWS):
+            continue
+
+        df = synthetic_frame(rows)
+        describe = df.describe()
+        xlsx_path = os.path.join(data_dir, f"export_{rows}.xlsx")
+
+        for mode, streaming in (("streaming", True), ("excelwriter", False)):
+            yield (
+                f"export/xlsx_{mode}/{rows}", rows,
+                lambda df=df, path=xlsx_path, describe=describe, streaming=streaming: build_excel_report(
+                    df, path, describe=describe, streaming=streaming
+                ),
+                None
+            )
+
+        for spec in EXPORT_FORMATS.values():
+            path = os.path.join(data_dir, f"export_{rows}{spec['suffix']}")
+            yield (
+                f"export/{spec['kind']}/{rows}", rows,
+                lambda df=df, path=path, writer=spec["writer"]: writer(df, path),
+                None
+            )
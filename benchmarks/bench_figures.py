@@ -0,0 +1,40 @@
+"""قياس ذاكرة الرسوم المؤقتة: بناء رسم العلاقة (التمرين 5) مقابل إصابة الذاكرة المؤقتة"""
+import numpy as np
+
+from econ_app.figure_cache import cached_figure, clear_figure_cache
+from econ_app.charts import relationship_figure
+from benchmarks.harness import synthetic_frame, GROWTH_COL, UNEMPLOYMENT_COL
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def _render(fig):
+    """نفس تحويل st.plotly_chart: التحقق من الرسم (إن لم يكن Figure) ثم تسلسله إلى JSON"""
+    import plotly.io as pio
+    import plotly.tools
+
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def cases(max_rows, data_dir=None):
+    """حالات القياس: بناء الرسم (ذاكرة فارغة) وإصابة الذاكرة المؤقتة، مع التسلسل وبدونه"""
+    for rows in SIZES:
+        if rows > max_rows:
+            continue
+
+        df = synthetic_frame(rows)
+        trendline_line = (np.array([df[GROWTH_COL].min(), df[GROWTH_COL].max()]), np.array([7.5, 6.5]))
+        args = (relationship_figure, df, GROWTH_COL, UNEMPLOYMENT_COL, "ols", trendline_line)
+
+        def warm(args=args):
+            clear_figure_cache()
+            cached_figure(*args)
+
+        yield f"figures/relationship/build/{rows}", rows, lambda args=args: cached_figure(*args), clear_figure_cache
+        yield f"figures/relationship/hit/{rows}", rows, lambda args=args: cached_figure(*args), warm
+        yield (
+            f"figures/relationship/build_render/{rows}", rows,
+            lambda args=args: _render(cached_figure(*args)), clear_figure_cache
+        )
+        yield f"figures/relationship/hit_render/{rows}", rows, lambda args=args: _render(cached_figure(*args)), warm
@@ -0,0 +1,53 @@
+"""قياس صيغ الكتاب: الحاسبات (قيم مفردة) والحساب المتجه على سلاسل طويلة"""
+import numpy as np
+
+from econ_app import analytics, formulas
+from benchmarks.harness import synthetic_frame, REAL_GDP_COL, NOMINAL_GDP_COL, GROWTH_COL, UNEMPLOYMENT_COL
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+
+# عدد سلع سلة IPC في الحساب المتجه (سنوات × سلع)
+CPI_GOODS = 12
+
+
+def _scalar_cases():
+    """نفس الاستدعاءات التي تنفذها الحاسبات في كل تفاعل"""
+    yield "gdp_expenditure", lambda: formulas.gdp_expenditure(1268.5, 537.9, 550.9, 737.4, 755.6)
+    yield "growth_rate", lambda: formulas.growth_rate(2285.9, 2247.2)
+    yield "deflator", lambda: formulas.deflator(2353.1, 2285.9)
+    yield "cpi_laspeyres", lambda: formulas.cpi_laspeyres([1.2, 2.5, 12.0], [1.0, 2.0, 10.0], [100.0, 50.0, 20.0])
+    yield "okun_scenarios", lambda: analytics.okun_scenarios(2.2, 0.5, 7.5)
+    yield "doubling_time", lambda: formulas.doubling_time(3.0)
+
+
+def _vector_cases(rows):
+    df = synthetic_frame(rows)
+    real = df[REAL_GDP_COL].to_numpy()
+    nominal = df[NOMINAL_GDP_COL].to_numpy()
+    growth = df[GROWTH_COL].to_numpy()
+
+    rng = np.random.default_rng(1)
+    components = rng.uniform(100, 1500, (5, rows))
+    base_prices = rng.uniform(1, 20, CPI_GOODS)
+    base_quantities = rng.uniform(1, 100, CPI_GOODS)
+    prices = base_prices * np.cumprod(1 + rng.normal(0.002, 0.01, (rows, CPI_GOODS)), axis=0)
+
+    yield "gdp_expenditure", lambda: formulas.gdp_expenditure(*components)
+    yield "growth_rates", lambda: formulas.growth_rates(real)
+    yield "deflator", lambda: formulas.deflator(nominal, real)
+    yield "cpi_laspeyres", lambda: formulas.cpi_laspeyres(prices, base_prices, base_quantities)
+    yield "okun_unemployment_change", lambda: formulas.okun_unemployment_change(growth, 2.2, 0.5)
+    yield "okun_fit", lambda: analytics.okun_fit(df[[GROWTH_COL, UNEMPLOYMENT_COL]])
+    yield "doubling_time", lambda: formulas.doubling_time(np.clip(growth, 0.5, None))
+
+
+def cases(max_rows, data_dir=None):
+    """حالات القياس: (الاسم، عدد الصفوف، الدالة، التهيئة)"""
+    for name, func in _scalar_cases():
+        yield f"formulas/scalar/{name}", 1, func, None
+
+    for rows in SIZES:
+        if rows > max_rows:
+            continue
+        for name, func in _vector_cases(rows):
+            yield f"formulas/vector/{name}/{rows}", rows, func, None
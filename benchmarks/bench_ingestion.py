@@ -0,0 +1,60 @@
+"""قياس قراءة الملفات المرفوعة عبر handle_uploaded_file (CSV و Excel)"""
+import io
+import os
+
+from benchmarks.harness import synthetic_frame
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+
+# حد صفوف ورقة Excel (1,048,576 مع سطر العناوين)
+XLSX_MAX_ROWS = 1_048_575
+
+FILE_TYPES = {"CSV": ".csv", "Excel": ".xlsx"}
+
+
+def synthetic_file(rows, file_type, data_dir):
+    """ملف اصطناعي على القرص يُولَّد مرة واحدة ويُعاد استخدامه بين التشغيلات"""
+    path = os.path.join(data_dir, f"synthetic_{rows}{FILE_TYPES[file_type]}")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        df = synthetic_frame(rows)
+        part_path = path + ".part"
+        if file_type == "Excel":
+            from econ_app.report_export import write_excel_report_streaming
+            write_excel_report_streaming(df, part_path)
+        else:
+            df.to_csv(part_path, index=False, encoding="utf-8")
+        os.replace(part_path, path)
+
+    with open(path, "rb") as synthetic:
+        return synthetic.read()
+
+
+def cases(max_rows, data_dir):
+    """حالات القياس: التحليل البارد (أول رفع) والمخزن مؤقتاً (نفس الملف من جلسة أخرى)"""
+    from econ_app.data_sources import handle_uploaded_file
+    from econ_app.shared_data import parse_upload, clear_shared_uploads
+
+    for file_type in FILE_TYPES:
+        for rows in SIZES:
+            if rows > max_rows or (file_type == "Excel" and rows > XLSX_MAX_ROWS):
+                continue
+
+            content = synthetic_file(rows, file_type, data_dir)
+            suffix = FILE_TYPES[file_type].lstrip(".")
+
+            yield (
+                f"ingestion/{suffix}/parse/{rows}", rows,
+                lambda content=content, file_type=file_type: parse_upload(content, file_type),
+                None
+            )
+            yield (
+                f"ingestion/{suffix}/handle_uploaded_file_cold/{rows}", rows,
+                lambda content=content, file_type=file_type: handle_uploaded_file(io.BytesIO(content), file_type),
+                clear_shared_uploads
+            )
+            yield (
+                f"ingestion/{suffix}/handle_uploaded_file_cached/{rows}", rows,
+                lambda content=content, file_type=file_type: handle_uploaded_file(io.BytesIO(content), file_type),
+                None
+            )
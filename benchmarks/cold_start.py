@@ -0,0 +1,167 @@
+"""قياس التشغيل البارد: بدء المفسر، زمن استيراد كل مكتبة، وزمن أول صفحة لكل سكربت
+
+كل قياس في عملية Python جديدة حتى لا تؤثر الوحدات المحملة مسبقاً. تُقارن النتائج
+بالحدود المخزنة في startup_thresholds.json وتُضاف إلى سجل القياسات.
+
+أمثلة:
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --write-thresholds --margin 1.5   # حدود جديدة من أداء هذا الجهاز
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from econ_app.startup import HEAVY_MODULES, STARTUP_BUDGET_S
+from benchmarks.harness import run_metadata, append_history, load_history, previous_results, print_result
+from benchmarks.load_test import SCRIPTS
+from benchmarks.run import DEFAULT_HISTORY
+
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_thresholds.json")
+
+# المكتبات التي يُقاس استيرادها (المكتبات الثقيلة من econ_app.startup + الأساسية)
+DEPENDENCIES = ("numpy", "pandas", "requests", "streamlit") + HEAVY_MODULES
+
+# أول عرض للسكربت في عملية جديدة (يشمل استيراد streamlit كما في خادم يبدأ للتو)
+FIRST_PAGE_CODE = """
+import sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2])).run()
+print(time.perf_counter() - started, len(at.exception))
+"""
+
+
+# ========== القياسات ==========
+def _python(*args, **kwargs):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, **kwargs)
+
+
+def interpreter_seconds():
+    """زمن بدء المفسر وإغلاقه دون أي استيراد"""
+    started = time.perf_counter()
+    _python("-c", "pass")
+    return time.perf_counter() - started
+
+
+def _top_level_imports(stderr):
+    """الزمن التراكمي (ثوانٍ) لكل استيراد من المستوى الأعلى في مخرجات -X importtime"""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative) / 1e6
+    return imports
+
+
+def import_seconds(module):
+    """زمن استيراد الوحدة مع كل ما تجره معها، دون وحدات بدء المفسر"""
+    baseline = _top_level_imports(_python("-X", "importtime", "-c", "pass").stderr)
+    imports = _top_level_imports(_python("-X", "importtime", "-c", f"import {module}").stderr)
+    return sum(seconds for name, seconds in imports.items() if name not in baseline)
+
+
+def first_page_seconds(app, timeout=60):
+    """زمن أول عرض كامل للسكربت في عملية جديدة"""
+    output = _python("-c", FIRST_PAGE_CODE, SCRIPTS[app], str(timeout), cwd=os.path.dirname(SCRIPTS[app]))
+    seconds, exceptions = output.stdout.split()
+    if int(exceptions):
+        raise RuntimeError(f"{app}: السكربت رفع استثناءً أثناء أول عرض")
+    return float(seconds)
+
+
+def cases(apps):
+    """(الاسم، دالة القياس) لكل حالة"""
+    yield "interpreter", interpreter_seconds
+    for module in DEPENDENCIES:
+        yield f"import/{module}", lambda module=module: import_seconds(module)
+    for app in apps:
+        yield f"first_page/{app}", lambda app=app: first_page_seconds(app)
+
+
+# ========== الحدود ==========
+def load_thresholds(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as thresholds_file:
+        return json.load(thresholds_file)
+
+
+def write_thresholds(path, results, margin):
+    """حدود جديدة = الوسيط الحالي × الهامش (first_page لا يتجاوز ميزانية التشغيل البارد)"""
+    thresholds = {}
+    for result in results:
+        limit = result["seconds"] * margin
+        if result["case"].startswith("first_page/"):
+            limit = min(limit, STARTUP_BUDGET_S)
+        thresholds[result["case"]] = round(limit, 3)
+
+    with open(path, "w", encoding="utf-8") as thresholds_file:
+        json.dump(thresholds, thresholds_file, indent=2, ensure_ascii=False)
+        thresholds_file.write("\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="قياس التشغيل البارد وأزمنة الاستيراد")
+    parser.add_argument("--apps", nargs="+", default=list(SCRIPTS), choices=list(SCRIPTS))
+    parser.add_argument("--repeat", type=int, default=5, help="عدد العمليات الجديدة لكل حالة (يُؤخذ الوسيط)")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="ملف الحدود (JSON)")
+    parser.add_argument("--write-thresholds", action="store_true", help="كتابة الحدود من نتائج هذا التشغيل")
+    parser.add_argument("--margin", type=float, default=1.5, help="هامش الحدود الجديدة")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="ملف سجل النتائج (JSONL)")
+    parser.add_argument("--no-record", action="store_true", help="عرض النتائج دون إضافتها إلى السجل")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    metadata = run_metadata()
+    baseline = previous_results(load_history(args.history), metadata["commit"])
+    thresholds = load_thresholds(args.thresholds)
+
+    print(f"الإيداع {metadata['commit']} — Python {metadata['python']}")
+
+    results = []
+    exceeded = []
+    for case, func in cases(args.apps):
+        try:
+            rounds = [func() for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as e:
+            # مكتبة اختيارية غير مثبتة (مثل pyarrow) لا توقف بقية القياسات
+            print(f"{case:<48} {'تخطي':>12}   {e.stderr.strip().splitlines()[-1]}", file=sys.stderr)
+            continue
+
+        result = {
+            "suite": "cold_start",
+            "case": case,
+            "rows": 0,
+            "seconds": statistics.median(rounds),
+            "min": min(rounds),
+            "rounds": args.repeat,
+            "threshold": thresholds.get(case)
+        }
+        results.append(result)
+        print_result(result, baseline.get(case))
+
+        if result["threshold"] is not None and result["seconds"] > result["threshold"]:
+            exceeded.append(f"{case} ({result['seconds']:.3f}s > {result['threshold']:.3f}s)")
+
+    if args.write_thresholds:
+        write_thresholds(args.thresholds, results, args.margin)
+        print(f"📝 الحدود → {args.thresholds}")
+    if not args.no_record:
+        append_history(args.history, metadata, results)
+
+    if exceeded and not args.write_thresholds:
+        print("❌ تجاوز الحدود: " + "، ".join(exceeded), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
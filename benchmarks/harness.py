@@ -0,0 +1,140 @@
+"""أدوات القياس المشتركة: التوقيت، بيانات التشغيل، وسجل النتائج بصيغة JSONL"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from econ_app.analytics import YEAR_COL, REAL_GDP_COL, GROWTH_COL, INFLATION_COL, UNEMPLOYMENT_COL
+
+NOMINAL_GDP_COL = "الناتج_الاسمي_مليار_يورو"
+
+
+# ========== البيانات الاصطناعية ==========
+def synthetic_frame(rows, seed=0):
+    """جدول اقتصادي اصطناعي بأعمدة عينة فرنسا وعدد الصفوف المطلوب (نفس البذرة → نفس البيانات)"""
+    rng = np.random.default_rng(seed)
+    growth = rng.normal(1.8, 2.0, rows)
+    inflation = rng.normal(2.0, 1.2, rows)
+    real_gdp = 2000 * np.cumprod(1 + growth / 100 / 50)
+
+    return pd.DataFrame({
+        YEAR_COL: 1900 + np.arange(rows) % 125,
+        REAL_GDP_COL: real_gdp.round(1),
+        NOMINAL_GDP_COL: (real_gdp * np.cumprod(1 + inflation / 100 / 50)).round(1),
+        GROWTH_COL: growth.round(2),
+        INFLATION_COL: inflation.round(2),
+        UNEMPLOYMENT_COL: np.clip(8 - 0.4 * (growth - 2) + rng.normal(0, 0.5, rows), 1, 25).round(2)
+    })
+
+
+# ========== التوقيت ==========
+def measure(func, setup=None, repeat=5, min_time=0.05):
+    """زمن استدعاء واحد لـ func (الوسيط والأدنى على repeat جولات)
+
+    بدون setup: تُكرر الدالة داخل كل جولة حتى تتجاوز min_time (مثل timeit) لقياس الدوال السريعة.
+    مع setup: استدعاء واحد لكل جولة بعد setup() خارج التوقيت (مثلاً تفريغ ذاكرة مؤقتة).
+    """
+    number = 1
+    if setup is None:
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - started >= min_time or number >= 1_000_000:
+                break
+            number *= 10
+
+    rounds = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - started) / number)
+
+    return {
+        "seconds": statistics.median(rounds),
+        "min": min(rounds),
+        "stdev": statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+        "rounds": repeat,
+        "number": number
+    }
+
+
+# ========== بيانات التشغيل ==========
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_metadata():
+    """الإيداع الحالي والبيئة (يُسجل مع كل نتيجة)"""
+    commit = _git("rev-parse", "--short", "HEAD") or "unknown"
+    if _git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": f"{platform.system()}-{platform.machine()}",
+        "cpus": os.cpu_count()
+    }
+
+
+# ========== السجل ==========
+def append_history(path, metadata, results):
+    """إضافة سطر JSON لكل حالة إلى ملف السجل"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as history_file:
+        for result in results:
+            history_file.write(json.dumps({**metadata, **result}, ensure_ascii=False) + "\n")
+
+
+def load_history(path):
+    """قراءة جميع السطور السابقة من ملف السجل"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as history_file:
+        return [json.loads(line) for line in history_file if line.strip()]
+
+
+def previous_results(history, commit):
+    """آخر نتيجة لكل حالة من إيداع مختلف عن الحالي (أساس المقارنة)"""
+    baseline = {}
+    for entry in history:
+        if entry.get("commit") != commit:
+            baseline[entry["case"]] = entry
+    return baseline
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def print_result(result, baseline=None, stream=sys.stdout):
+    """سطر واحد لكل حالة مع النسبة إلى الإيداع السابق"""
+    line = f"{result['case']:<48} {format_seconds(result['seconds']):>12}"
+    if baseline is not None:
+        ratio = result["seconds"] / baseline["seconds"]
+        line += f"   ×{ratio:.2f} مقارنة بـ {baseline['commit']}"
+    print(line, file=stream, flush=True)
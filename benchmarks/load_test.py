@@ -0,0 +1,402 @@
+"""اختبار حمل: جلسات متزامنة على خادم Streamlit واحد تتبع مسارات نقر واقعية
+
+يُشغَّل التطبيق بـ `streamlit run` في عملية خادم واحدة، وتتصل كل جلسة محاكاة عبر WebSocket
+(/_stcore/stream) كما يفعل المتصفح: ترسل BackMsg لإعادة التشغيل بقيم المنزلقات والأزرار وتقرأ
+رسائل ForwardMsg حتى انتهاء السكربت. الجلسات تتقاسم حالة الخادم (cache_resource ومجمع المهام
+وذاكرة الرسوم المؤقتة)، وتُقاس ذاكرة الخادم قبل الجلسات وبعدها.
+
+أمثلة:
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --apps formulas --sessions 1 10 50 --rounds 2
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+from benchmarks.harness import run_metadata, append_history, format_seconds
+from benchmarks.run import DEFAULT_HISTORY
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPTS = {
+    "mgdp": os.path.join(REPO_DIR, "mgdp.py"),
+    "formulas": os.path.join(REPO_DIR, "economic_app_formulas.py")
+}
+
+# المسار لا يرفع ملفات، فتُستخدم العينة المضمنة التي تمر بنفس مسار البيانات المشتركة
+SAMPLE_SOURCE = "عينة بيانات فرنسا (مضمنة)"
+
+# عدد المواضع التي يمر بها كل منزلق (سحب من الحد الأدنى إلى الأعلى)
+SLIDER_POSITIONS = 3
+
+# الحاويات الجذرية في مسار العنصر (RootContainer: MAIN = 0، SIDEBAR = 1)
+MAIN, SIDEBAR = 0, 1
+
+# مهلة بدء الخادم (ثوانٍ)
+SERVER_START_TIMEOUT_S = 60
+
+
+# ========== الخادم ==========
+def _free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(app):
+    """تشغيل `streamlit run` للتطبيق على منفذ حر وانتظار جاهزيته"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", SCRIPTS[app],
+            "--server.port", str(port), "--server.address", "127.0.0.1",
+            "--server.headless", "true", "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false", "--global.developmentMode", "false",
+            "--logger.level", "error"
+        ],
+        cwd=REPO_DIR, stdout=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + SERVER_START_TIMEOUT_S
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"توقف خادم {app} قبل أن يصبح جاهزاً (رمز الخروج {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process, port
+        except OSError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError(f"لم يصبح خادم {app} جاهزاً خلال {SERVER_START_TIMEOUT_S} ث")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _rss_bytes(pid):
+    """الذاكرة المقيمة لعملية الخادم (None خارج Linux)"""
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+# ========== جلسة WebSocket ==========
+async def _connect(url):
+    """(إرسال، استقبال، إغلاق) لاتصال WebSocket ثنائي (websockets، أو tornado في إصدارات Streamlit الأقدم)"""
+    try:
+        import websockets
+    except ImportError:
+        import tornado.websocket
+
+        connection = await tornado.websocket.websocket_connect(
+            url, subprotocols=["streamlit"], max_message_size=1024 ** 3
+        )
+
+        async def receive():
+            message = await connection.read_message()
+            if message is None:
+                raise ConnectionError("أغلق الخادم الاتصال")
+            return message
+
+        async def close():
+            connection.close()
+
+        return (lambda data: connection.write_message(data, binary=True)), receive, close
+
+    connection = await websockets.connect(url, subprotocols=["streamlit"], max_size=None)
+    return connection.send, connection.recv, connection.close
+
+
+async def open_session(port):
+    """جلسة متصفح محاكاة: قيم الأدوات الحالية، عناصر آخر تشغيل، والرسائل المخزنة مؤقتاً حسب البصمة"""
+    send, receive, close = await _connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+    return {
+        "send": send, "receive": receive, "close": close,
+        "page_script_hash": "", "widgets": {}, "elements": {}, "cache": {}, "errors": []
+    }
+
+
+async def _read_run(session):
+    """قراءة رسائل الخادم حتى انتهاء تشغيل السكربت (مع التشغيلات التي يطلبها السكربت نفسه)"""
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    while True:
+        msg = ForwardMsg()
+        msg.ParseFromString(await session["receive"]())
+        path = tuple(msg.metadata.delta_path)
+
+        # رسالة مرجعية لعنصر أرسله الخادم سابقاً وأبلغت الجلسة أنها تحتفظ به
+        if msg.WhichOneof("type") == "ref_hash":
+            msg = session["cache"][msg.ref_hash]
+        elif msg.metadata.cacheable:
+            session["cache"][msg.hash] = msg
+
+        kind = msg.WhichOneof("type")
+        if kind == "new_session":
+            session["page_script_hash"] = msg.new_session.page_script_hash
+            session["elements"] = {}
+        elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = msg.delta.new_element
+            session["elements"][path] = element
+            if element.WhichOneof("type") == "exception":
+                session["errors"].append(element.exception.message)
+        elif kind == "script_finished" and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+            break
+
+    # المتصفح يرسل قيم الأدوات الظاهرة فقط
+    shown = {getattr(element, element.WhichOneof("type")).id for element in session["elements"].values()
+             if hasattr(getattr(element, element.WhichOneof("type")), "id")}
+    session["widgets"] = {widget_id: state for widget_id, state in session["widgets"].items() if widget_id in shown}
+
+
+async def rerun(session, trigger=None, timeout=60):
+    """إعادة تشغيل السكربت بقيم الأدوات الحالية (وزر مضغوط إن وُجد) وانتظار انتهائها"""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+
+    msg = BackMsg()
+    client_state = msg.rerun_script
+    client_state.page_script_hash = session["page_script_hash"]
+    for state in session["widgets"].values():
+        client_state.widget_states.widgets.add().CopyFrom(state)
+    if trigger is not None:
+        button = client_state.widget_states.widgets.add()
+        button.id = trigger
+        button.trigger_value = True
+    client_state.cached_message_hashes.extend(session["cache"])
+
+    await session["send"](msg.SerializeToString())
+    await asyncio.wait_for(_read_run(session), timeout)
+
+
+def widgets(session, kind, container=MAIN, key=None):
+    """أدوات من نوع kind في حاوية بترتيب الصفحة (key: المفتاح الذي مرره السكربت للأداة)"""
+    found = []
+    for path, element in sorted(session["elements"].items()):
+        if path[0] != container or element.WhichOneof("type") != kind:
+            continue
+        widget = getattr(element, kind)
+        if key is None or widget.id.endswith(f"-{key}"):
+            found.append(widget)
+    return found
+
+
+def set_value(session, widget, value):
+    """قيمة جديدة للأداة (تُرسل مع إعادة التشغيل التالية)"""
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    state = WidgetState(id=widget.id)
+    if isinstance(value, str):
+        # selectbox و radio يرسلان الخيار المعروض كنص
+        state.string_value = value
+    else:
+        state.double_array_value.data[:] = [value]
+    session["widgets"][widget.id] = state
+
+
+# ========== مسارات النقر ==========
+def _slider_values(slider, positions=SLIDER_POSITIONS):
+    low, high, step = slider.min, slider.max, slider.step
+    values = []
+    for k in range(positions):
+        value = low + (high - low) * k / (positions - 1)
+        values.append(round(low + round((value - low) / step) * step, 6))
+    return values
+
+
+def _single_sliders(session):
+    # منزلقات النطاق (تكبير السلاسل الطويلة) ومنزلقات الخيارات تُترك على قيمها
+    return [slider for slider in widgets(session, "slider") if len(slider.default) == 1 and slider.type != 2]
+
+
+async def _drag_sliders(session, step):
+    """سحب كل منزلق في الصفحة عبر عدة مواضع (إعادة تشغيل لكل موضع)"""
+    for i in range(len(_single_sliders(session))):
+        sliders = _single_sliders(session)
+        if i >= len(sliders):
+            break
+        for value in _slider_values(sliders[i]):
+            set_value(session, sliders[i], value)
+            await step("slider")
+
+
+async def _click_buttons(session, step):
+    """الضغط على أزرار الصفحة (أزرار النماذج والحساب والتصدير)"""
+    for i in range(len(widgets(session, "button"))):
+        buttons = widgets(session, "button")
+        if i < len(buttons):
+            await step("button", trigger=buttons[i].id)
+
+
+async def mgdp_clicks(session, step):
+    """فتح التطبيق، اختيار البيانات، ثم المرور على كل فصل مع المنزلقات والأزرار"""
+    await step("open")
+    set_value(session, widgets(session, "selectbox", SIDEBAR)[0], SAMPLE_SOURCE)
+    await step("data_source")
+
+    for chapter in list(widgets(session, "radio", SIDEBAR)[0].options):
+        set_value(session, widgets(session, "radio", SIDEBAR)[0], chapter)
+        await step("chapter")
+        await _drag_sliders(session, step)
+        await _click_buttons(session, step)
+
+
+async def formulas_clicks(session, step):
+    """المرور على كل قسم مع المنزلقات والأزرار، ثم إنشاء ملف تصدير بكل صيغة"""
+    await step("open")
+
+    for section in list(widgets(session, "radio", SIDEBAR)[0].options):
+        set_value(session, widgets(session, "radio", SIDEBAR)[0], section)
+        await step("section")
+        await _drag_sliders(session, step)
+        await _click_buttons(session, step)
+
+    # القسم الأخير هو تحميل البيانات: كل صيغة تُكتب مرة عند الطلب ثم تُخدم من الذاكرة المؤقتة على القرص
+    for export_format in list(widgets(session, "selectbox", key="export_format")[0].options):
+        set_value(session, widgets(session, "selectbox", key="export_format")[0], export_format)
+        await step("export")
+        build = widgets(session, "button", key="export_build")
+        if build:
+            await step("export", trigger=build[0].id)
+
+
+CLICK_PATHS = {"mgdp": mgdp_clicks, "formulas": formulas_clicks}
+
+
+async def run_session(app, port, rounds, timeout, start=None):
+    """جلسة محاكاة: الاتصال، انتظار بدء بقية الجلسات، ثم مسار النقر مع قياس كل إعادة تشغيل"""
+    session = await open_session(port)
+    latencies = []
+
+    async def step(name, trigger=None):
+        started = time.perf_counter()
+        await rerun(session, trigger, timeout)
+        latencies.append((name, time.perf_counter() - started))
+
+    try:
+        if start is not None:
+            await start.wait()
+        started = time.time()
+        for _ in range(rounds):
+            await CLICK_PATHS[app](session, step)
+        return {"started": started, "finished": time.time(), "latencies": latencies, "errors": session["errors"]}
+    finally:
+        await session["close"]()
+
+
+# ========== مستوى تزامن ==========
+async def _run_sessions(app, port, sessions, rounds, timeout):
+    start = asyncio.Event()
+    tasks = [asyncio.ensure_future(run_session(app, port, rounds, timeout, start)) for _ in range(sessions)]
+    # الجلسات تبدأ معاً بعد فتح جميع الاتصالات
+    await asyncio.sleep(0.5)
+    start.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_level(app, server, sessions, rounds, timeout):
+    """تشغيل sessions جلسة معاً على نفس الخادم وتجميع زمن الاستجابة والإنتاجية والذاكرة"""
+    process, port = server
+    rss_before = _rss_bytes(process.pid)
+    reports = asyncio.run(_run_sessions(app, port, sessions, rounds, timeout))
+    rss_after = _rss_bytes(process.pid)
+
+    failed = [report for report in reports if isinstance(report, BaseException)]
+    if failed:
+        raise RuntimeError(f"فشل {len(failed)} جلسة: {type(failed[0]).__name__}: {failed[0]}")
+
+    latencies = np.array([seconds for report in reports for _, seconds in report["latencies"]])
+    wall = max(r["finished"] for r in reports) - min(r["started"] for r in reports)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+
+    return {
+        "suite": "load",
+        "case": f"load/{app}/{sessions}",
+        "sessions": sessions,
+        "reruns": len(latencies),
+        # زمن الاستجابة p90 هو ما يُقارن بين الإيداعات
+        "seconds": float(p90),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(latencies.max()),
+        "throughput": len(latencies) / wall,
+        # زيادة ذاكرة الخادم مقسومة على عدد الجلسات (الجلسات المنتهية تبقى حتى ينظفها الخادم)
+        "session_bytes": None if rss_before is None else (rss_after - rss_before) / sessions,
+        "server_bytes": rss_after,
+        "errors": sum(len(r["errors"]) for r in reports),
+        "first_error": next((r["errors"][0] for r in reports if r["errors"]), None)
+    }
+
+
+def print_level(result):
+    session_mb = "-" if result["session_bytes"] is None else f"{result['session_bytes'] / 1024 ** 2:.1f}"
+    print(
+        f"{result['case']:<22} {result['reruns']:>6} "
+        f"{format_seconds(result['p50']):>10} {format_seconds(result['p90']):>10} {format_seconds(result['p99']):>10} "
+        f"{result['throughput']:>10.1f} {session_mb:>10} {result['errors']:>6}",
+        flush=True
+    )
+    if result["first_error"]:
+        print(f"    ⚠️ {result['first_error']}", file=sys.stderr)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="اختبار حمل بجلسات متزامنة على خادم Streamlit واحد")
+    parser.add_argument("--apps", nargs="+", default=list(SCRIPTS), choices=list(SCRIPTS))
+    parser.add_argument("--sessions", nargs="+", type=int, default=[1, 5, 10, 25],
+                        help="مستويات التزامن (عدد الجلسات المتزامنة)")
+    parser.add_argument("--rounds", type=int, default=1, help="عدد مرات تكرار مسار النقر في كل جلسة")
+    parser.add_argument("--timeout", type=float, default=60, help="المهلة القصوى لإعادة تشغيل واحدة (ثوانٍ)")
+    parser.add_argument("--no-warmup", action="store_true", help="قياس الجلسات على خادم بارد")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="ملف سجل النتائج (JSONL)")
+    parser.add_argument("--no-record", action="store_true", help="عرض النتائج دون إضافتها إلى السجل")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    metadata = run_metadata()
+
+    print(f"الإيداع {metadata['commit']} — {metadata['cpus']} معالج")
+    print(f"{'الحالة':<22} {'تشغيل':>6} {'p50':>10} {'p90':>10} {'p99':>10} {'تشغيل/ث':>10} {'م.ب/جلسة':>10} {'أخطاء':>6}")
+
+    results = []
+    for app in args.apps:
+        # خادم واحد لكل تطبيق تتقاسمه جميع مستويات التزامن، كخادم إنتاج يعمل منذ مدة
+        server = start_server(app)
+        try:
+            if not args.no_warmup:
+                # جلسة أولى غير مقاسة تحمّل الوحدات والذاكرة المؤقتة
+                asyncio.run(run_session(app, server[1], 1, args.timeout))
+            for sessions in args.sessions:
+                result = run_level(app, server, sessions, args.rounds, args.timeout)
+                results.append(result)
+                print_level(result)
+        finally:
+            stop_server(server[0])
+
+    if not args.no_record:
+        append_history(args.history, metadata, results)
+        print(f"✅ {len(results)} نتيجة → {args.history}")
+
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""تشغيل قياسات الأداء وإضافة النتائج إلى سجل JSONL مع المقارنة بالإيداع السابق
+
+أمثلة:
+    python -m benchmarks.run
+    python -m benchmarks.run --suites ingestion --max-rows 10000000
+    python -m benchmarks.run --max-regression 1.25   # فشل عند تباطؤ أي حالة بأكثر من 25%
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+
+from benchmarks.harness import (
+    measure, run_metadata, append_history, load_history, previous_results, print_result
+)
+
+SUITES = {
+    "formulas": "benchmarks.bench_formulas",
+    "ingestion": "benchmarks.bench_ingestion",
+    "export": "benchmarks.bench_export",
+    "figures": "benchmarks.bench_figures"
+}
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="قياسات أداء الصيغ وقراءة الملفات والتصدير والرسوم")
+    parser.add_argument("--suites", nargs="+", default=list(SUITES), choices=list(SUITES))
+    parser.add_argument("--max-rows", type=int, default=100_000,
+                        help="أكبر حجم بيانات يُقاس (حتى 10000000؛ Excel محدود بـ 1048575 صفاً)")
+    parser.add_argument("--repeat", type=int, default=5, help="عدد الجولات لكل حالة")
+    parser.add_argument("--filter", default="", help="قياس الحالات التي يحتوي اسمها هذا النص فقط")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="ملف سجل النتائج (JSONL)")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "econ_app_bench"),
+                        help="مجلد الملفات الاصطناعية (تُولَّد مرة واحدة)")
+    parser.add_argument("--no-record", action="store_true", help="عرض النتائج دون إضافتها إلى السجل")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="نسبة التباطؤ القصوى المسموحة مقارنة بالإيداع السابق")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    metadata = run_metadata()
+    baseline = previous_results(load_history(args.history), metadata["commit"])
+
+    print(f"الإيداع {metadata['commit']} — Python {metadata['python']}, pandas {metadata['pandas']}")
+
+    results = []
+    regressions = []
+    for suite in args.suites:
+        module = importlib.import_module(SUITES[suite])
+        for case, rows, func, setup in module.cases(args.max_rows, args.data_dir):
+            if args.filter not in case:
+                continue
+
+            result = {"suite": suite, "case": case, "rows": rows, **measure(func, setup, args.repeat)}
+            results.append(result)
+
+            previous = baseline.get(case)
+            print_result(result, previous)
+            if (args.max_regression is not None and previous is not None
+                    and result["seconds"] > previous["seconds"] * args.max_regression):
+                regressions.append(case)
+
+    if not args.no_record:
+        append_history(args.history, metadata, results)
+        print(f"✅ {len(results)} نتيجة → {args.history}")
+
+    if regressions:
+        print(f"❌ تباطؤ أكبر من ×{args.max_regression}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""أدوات مشتركة لتطبيقات الاقتصاد الكلي (mgdp.py و economic_app_formulas.py)"""
@@ -0,0 +1,248 @@
+"""تحليلات الفصول (الاتجاه العام، قانون أوكون، منحنى فيليبس، تأثير السياسات) كدوال مستقلة عن الواجهة"""
+import numpy as np
+import pandas as pd
+
+from econ_app.formulas import okun_unemployment_change
+from econ_app.trendlines import linear_fit
+
+# أسماء الأعمدة كما في عينة بيانات فرنسا
+YEAR_COL = "السنة"
+REAL_GDP_COL = "الناتج_الحقيقي_مليار_يورو"
+GROWTH_COL = "معدل_النمو_٪"
+INFLATION_COL = "التضخم_٪"
+UNEMPLOYMENT_COL = "البطالة_٪"
+UNEMPLOYMENT_CHANGE_COL = "التغير_في_البطالة"
+
+# مؤشرات يكون فيها التأثير الموجب سلبياً
+INVERSE_INDICATORS = ["البطالة", "العجز الحكومي"]
+
+# تعريف تأثيرات كل سياسة
+POLICY_EFFECTS = {
+    "سياسة مالية توسعية": {
+        "description": "زيادة الإنفاق الحكومي أو خفض الضرائب",
+        "effects": {
+            "النمو الاقتصادي": 1.5,
+            "التضخم": 0.8,
+            "البطالة": -0.7,
+            "العجز الحكومي": 1.2,
+            "سعر الفائدة": 0.3
+        }
+    },
+    "سياسة مالية انكماشية": {
+        "description": "خفض الإنفاق الحكومي أو زيادة الضرائب",
+        "effects": {
+            "النمو الاقتصادي": -1.2,
+            "التضخم": -0.6,
+            "البطالة": 0.6,
+            "العجز الحكومي": -1.0,
+            "سعر الفائدة": -0.2
+        }
+    },
+    "سياسة نقدية توسعية": {
+        "description": "خفض سعر الفائدة أو زيادة المعروض النقدي",
+        "effects": {
+            "النمو الاقتصادي": 1.0,
+            "التضخم": 0.5,
+            "البطالة": -0.4,
+            "العجز الحكومي": 0.0,
+            "سعر الفائدة": -0.5
+        }
+    },
+    "سياسة نقدية انكماشية": {
+        "description": "رفع سعر الفائدة أو خفض المعروض النقدي",
+        "effects": {
+            "النمو الاقتصادي": -0.8,
+            "التضخم": -0.4,
+            "البطالة": 0.3,
+            "العجز الحكومي": 0.0,
+            "سعر الفائدة": 0.6
+        }
+    },
+    "سياسة تجارية توسعية": {
+        "description": "تحفيز الصادرات أو خفض الحواجز التجارية",
+        "effects": {
+            "النمو الاقتصادي": 0.7,
+            "التضخم": 0.2,
+            "البطالة": -0.3,
+            "العجز الحكومي": 0.1,
+            "سعر الفائدة": 0.0
+        }
+    },
+    "سياسة إصلاح سوق العمل": {
+        "description": "إصلاحات لزيادة مرونة سوق العمل",
+        "effects": {
+            "النمو الاقتصادي": 0.5,
+            "التضخم": 0.0,
+            "البطالة": -0.8,
+            "العجز الحكومي": -0.2,
+            "سعر الفائدة": 0.0
+        }
+    }
+}
+
+
+# ========== الاتجاه العام للناتج ==========
+def trend_regression(values):
+    """انحدار خطي للسلسلة على الزمن مع متوسط النمو السنوي"""
+    y = np.asarray(values, dtype=float)
+    x = np.arange(len(y))
+
+    fit = linear_fit(x, y, p_value=True)
+
+    return {
+        "slope": fit["slope"],
+        "intercept": fit["intercept"],
+        "r_squared": fit["r_squared"],
+        "p_value": fit["p_value"],
+        "trend_line": fit["intercept"] + fit["slope"] * x,
+        "avg_growth": ((y[-1] / y[0]) ** (1 / len(y)) - 1) * 100
+    }
+
+
+# ========== قانون أوكون ==========
+def okun_data(df, growth_col=GROWTH_COL, unemployment_col=UNEMPLOYMENT_COL):
+    """إضافة عمود التغير في البطالة والاحتفاظ بالسنوات المكتملة فقط"""
+    df_analysis = df.copy()
+    df_analysis[UNEMPLOYMENT_CHANGE_COL] = df_analysis[unemployment_col].diff()
+    return df_analysis.dropna(subset=[growth_col, UNEMPLOYMENT_CHANGE_COL])
+
+
+def okun_fit(df, growth_col=GROWTH_COL, unemployment_col=UNEMPLOYMENT_COL):
+    """تقدير معامل أوكون ومعدل النمو الطبيعي من بيانات النمو والبطالة"""
+    df_analysis = okun_data(df, growth_col, unemployment_col)
+
+    fit = linear_fit(
+        df_analysis[growth_col].values,
+        df_analysis[UNEMPLOYMENT_CHANGE_COL].values,
+        p_value=True
+    )
+    if fit is None:
+        return None
+
+    slope, intercept = fit["slope"], fit["intercept"]
+
+    return {
+        "slope": slope,
+        "intercept": intercept,
+        "okun_coefficient": abs(slope),
+        "r_squared": fit["r_squared"],
+        "p_value": fit["p_value"],
+        "natural_growth": -intercept / slope if slope != 0 else 0
+    }
+
+
+# سيناريوهات النمو في محاكاة أوكون (None = النمو الطبيعي g*)
+OKUN_SCENARIOS = {
+    "ركود شديد (-3%)": -3.0,
+    "ركود خفيف (-1%)": -1.0,
+    "نمو بطيء (1%)": 1.0,
+    "نمو طبيعي (2.2%)": None,
+    "نمو قوي (4%)": 4.0,
+    "نمو سريع (6%)": 6.0
+}
+
+# حدود معدل البطالة الجديد في السيناريوهات
+OKUN_UNEMPLOYMENT_BOUNDS = (1.0, 20.0)
+
+
+def okun_scenarios(g_star, beta, u0):
+    """سيناريوهات النمو وتأثيرها على البطالة (قيم رقمية)"""
+    low, high = OKUN_UNEMPLOYMENT_BOUNDS
+
+    rows = []
+    for name, growth in OKUN_SCENARIOS.items():
+        growth = g_star if growth is None else growth
+        delta_u = okun_unemployment_change(growth, g_star, beta)
+        rows.append({
+            "scenario": name,
+            "growth": growth,
+            "gap": growth - g_star,
+            "delta_u": delta_u,
+            "new_u": max(low, min(high, u0 + delta_u))
+        })
+
+    return pd.DataFrame(rows)
+
+
+def okun_scenarios_table(scenarios):
+    """جدول العرض لسيناريوهات أوكون"""
+    return pd.DataFrame({
+        "السيناريو": scenarios["scenario"],
+        "معدل النمو": [f"{g:.1f}%" for g in scenarios["growth"]],
+        "الفرق عن الطبيعي": [f"{gap:+.1f}%" for gap in scenarios["gap"]],
+        "التغير في البطالة": [f"{d:+.2f} نقطة" for d in scenarios["delta_u"]],
+        "البطالة الجديدة": [f"{u:.1f}%" for u in scenarios["new_u"]],
+        "اتجاه البطالة": [
+            "انخفاض" if d < 0 else "ارتفاع" if d > 0 else "استقرار"
+            for d in scenarios["delta_u"]
+        ]
+    })
+
+
+# ========== منحنى فيليبس ==========
+def phillips_curve(expected_inflation=2.0, natural_unemployment=6.0, beta=0.5):
+    """منحنى فيليبس قصير الأجل: π = πₑ - β(u - uₙ)"""
+    unemployment_range = np.linspace(3, 12, 20)
+
+    inflation_rates = expected_inflation - beta * (unemployment_range - natural_unemployment)
+    inflation_rates = np.maximum(0.5, inflation_rates)  # تضمن عدم وجود تضخم سلبي
+
+    return pd.DataFrame({
+        UNEMPLOYMENT_COL: unemployment_range,
+        INFLATION_COL: inflation_rates
+    })
+
+
+def phillips_fit(df, inflation_col=INFLATION_COL, unemployment_col=UNEMPLOYMENT_COL):
+    """تقدير منحنى فيليبس من البيانات: انحدار التضخم على البطالة"""
+    clean = df[[unemployment_col, inflation_col]].dropna()
+
+    fit = linear_fit(clean[unemployment_col].values, clean[inflation_col].values, p_value=True)
+    if fit is None:
+        return None
+
+    return {
+        "slope": fit["slope"],
+        "intercept": fit["intercept"],
+        "r_squared": fit["r_squared"],
+        "p_value": fit["p_value"],
+        "avg_inflation": clean[inflation_col].mean(),
+        "avg_unemployment": clean[unemployment_col].mean()
+    }
+
+
+# ========== إحصائيات البيانات المرفوعة ==========
+def dataset_statistics(df, progress=None):
+    """الإحصائيات الوصفية ومصفوفة الارتباطات (نقطتا تقدم وإلغاء: قبل كل منهما)"""
+    if progress is not None:
+        progress(0.0, "describe")
+    describe = df.describe()
+
+    if progress is not None:
+        progress(0.5, "corr")
+    corr = df.select_dtypes(include=[np.number]).corr()
+
+    return {"describe": describe, "corr": corr}
+
+
+# ========== تأثير السياسات ==========
+def is_favorable_effect(indicator, effect):
+    """هل التأثير في الاتجاه المرغوب لهذا المؤشر؟"""
+    if indicator in INVERSE_INDICATORS:
+        return effect < 0
+    return effect > 0
+
+
+def policy_effects_table():
+    """جدول تأثيرات جميع السياسات"""
+    rows = []
+    for policy, spec in POLICY_EFFECTS.items():
+        for indicator, effect in spec["effects"].items():
+            rows.append({
+                "السياسة": policy,
+                "الوصف": spec["description"],
+                "المؤشر": indicator,
+                "التأثير": effect,
+                "تأثير_مرغوب": is_favorable_effect(indicator, effect)
+            })
+    return pd.DataFrame(rows)
@@ -0,0 +1,127 @@
+"""ذاكرة تخزين مؤقت على القرص لملفات التقارير المُصدَّرة، مفتاحها بصمة البيانات وخيارات التحليل"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+# يمكن تغيير المجلد والحجم الأقصى عبر متغيرات البيئة
+CACHE_DIR = os.environ.get(
+    "ECON_APP_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "econ_app_artifacts")
+)
+CACHE_MAX_BYTES = int(float(os.environ.get("ECON_APP_CACHE_MAX_MB", "512")) * 1024 * 1024)
+
+_lock = threading.Lock()
+
+
+def artifact_key(dataset_key, kind, **options):
+    """مفتاح ثابت للملف: بصمة البيانات + نوع التقرير + خيارات التحليل"""
+    payload = json.dumps(
+        {"dataset": dataset_key, "kind": kind, "options": options},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _artifact_path(key, suffix):
+    return os.path.join(CACHE_DIR, f"{key}{suffix}")
+
+
+def lookup_artifact(key, suffix):
+    """مسار الملف الجاهز إن وُجد (مع تحديث وقت آخر استخدام)، وإلا None"""
+    path = _artifact_path(key, suffix)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def get_or_build_artifact(key, suffix, builder):
+    """إرجاع الملف من الذاكرة المؤقتة أو بناؤه عبر builder(path) ثم حفظه"""
+    path = lookup_artifact(key, suffix)
+    if path is not None:
+        return path
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # الكتابة في ملف مؤقت ثم نقله ذرياً حتى لا يرى مستخدم آخر ملفاً ناقصاً
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=suffix + ".part")
+    os.close(fd)
+
+    try:
+        builder(tmp_path)
+        path = _artifact_path(key, suffix)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    evict_artifacts(keep=path)
+    return path
+
+
+def load_artifact(key, suffix, builder=None):
+    """محتوى الملف (bytes) من الذاكرة المؤقتة، أو None إن لم يكن جاهزاً ولم يُمرر builder
+
+    مع builder يُبنى الملف إن لم يوجد. قد تحذف جلسة أخرى الملف بين إيجاده وقراءته
+    (evict_artifacts)، فيُعاد بناؤه بدل إرجاع FileNotFoundError.
+    """
+    for _ in range(2):
+        if builder is None:
+            path = lookup_artifact(key, suffix)
+        else:
+            path = get_or_build_artifact(key, suffix, builder)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as artifact_file:
+                return artifact_file.read()
+        except FileNotFoundError:
+            continue
+
+    if builder is None:
+        return None
+
+    # ملف أكبر من حد الذاكرة المؤقتة تحذفه الجلسات الأخرى فوراً: يُبنى في ملف خاص ثم يُحذف
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        builder(tmp_path)
+        with open(tmp_path, "rb") as artifact_file:
+            return artifact_file.read()
+    finally:
+        os.remove(tmp_path)
+
+
+def evict_artifacts(max_bytes=CACHE_MAX_BYTES, keep=None):
+    """حذف أقدم الملفات استخداماً حتى يعود حجم الذاكرة المؤقتة تحت الحد"""
+    with _lock:
+        try:
+            entries = []
+            for name in os.listdir(CACHE_DIR):
+                if name.endswith(".part"):
+                    continue
+                full = os.path.join(CACHE_DIR, name)
+                try:
+                    stat = os.stat(full)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, full))
+        except FileNotFoundError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, full in sorted(entries):
+            if total <= max_bytes:
+                break
+            if full == keep:
+                continue
+            try:
+                os.remove(full)
+            except FileNotFoundError:
+                pass
+            total -= size
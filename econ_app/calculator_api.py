@@ -0,0 +1,334 @@
+"""منطق واجهة HTTP للحاسبات: تحويل دفعات المدخلات (JSON/Arrow) إلى مصفوفات، وتجميع الطلبات، وذاكرة النتائج
+
+الحسابات نفسها هي دوال econ_app.formulas التي تستخدمها الواجهة التفاعلية. الطلبات المتزامنة لنفس
+الحاسبة تُجمع خلال نافذة قصيرة في استدعاء متجه واحد، والطلبات المتطابقة تنتظر نفس الحساب أو
+تُخدم من الذاكرة المؤقتة. لا تعتمد الوحدة على خادم بعينه (يستخدمها api_server.py).
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+
+from econ_app import formulas
+
+# نافذة تجميع الطلبات، وأكبر عدد صفوف في دفعة مجمّعة، وحجم ذاكرة النتائج
+API_COALESCE_WINDOW_S = float(os.environ.get("ECON_APP_API_COALESCE_MS", "2")) / 1000
+API_BATCH_MAX_ROWS = int(os.environ.get("ECON_APP_API_BATCH_MAX_ROWS", "100000"))
+API_CACHE_SIZE = int(os.environ.get("ECON_APP_API_CACHE_SIZE", "10000"))
+
+# الدفعات الأكبر من هذا تُحسب في خيط منفصل حتى لا تعطل حلقة الأحداث
+API_INLINE_ROWS = int(os.environ.get("ECON_APP_API_INLINE_ROWS", "200000"))
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _cpi_rows(prices, base_prices, base_quantities):
+    """formulas.cpi_laspeyres لكل صف (سلة) من مصفوفات (صفوف × سلع) في عمليتي einsum"""
+    cost_current = np.einsum("ij,ij->i", prices, base_quantities)
+    cost_base = np.einsum("ij,ij->i", base_prices, base_quantities)
+    return 100 * cost_current / cost_base
+
+# الحاسبات المتاحة: الدالة، أسماء المدخلات، والمدخلات التي هي قوائم لكل صف (سلة السلع)
+CALCULATORS = {
+    "gdp": {
+        "func": formulas.gdp_expenditure,
+        "inputs": ("consumption", "investment", "government", "exports", "imports"),
+        "description": "PIB بطريقة الطلب: C + I + G + (X - M)"
+    },
+    "growth": {
+        "func": formulas.growth_rate,
+        "inputs": ("current", "previous"),
+        "description": "معدل النمو (٪)"
+    },
+    "deflator": {
+        "func": formulas.deflator,
+        "inputs": ("nominal", "real"),
+        "description": "مخفض الناتج: PIB الاسمي / PIB الحقيقي"
+    },
+    "cpi": {
+        "func": _cpi_rows,
+        "inputs": ("prices", "base_prices", "base_quantities"),
+        "vector_inputs": ("prices", "base_prices", "base_quantities"),
+        "description": "مؤشر أسعار الاستهلاك (لاسبير) لسلة سلع في كل صف"
+    },
+    "inflation": {
+        "func": formulas.inflation_rate,
+        "inputs": ("cpi", "cpi_previous"),
+        "description": "معدل التضخم (٪)"
+    },
+    "purchasing_power": {
+        "func": formulas.purchasing_power,
+        "inputs": ("amount", "inflation", "years"),
+        "description": "القوة الشرائية بعد عدد من السنوات"
+    },
+    "unemployment": {
+        "func": formulas.unemployment_rate,
+        "inputs": ("unemployed", "employed"),
+        "description": "معدل البطالة (٪)"
+    },
+    "participation": {
+        "func": formulas.participation_rate,
+        "inputs": ("labor_force", "working_age_population"),
+        "description": "معدل المشاركة (٪)"
+    },
+    "okun": {
+        "func": formulas.okun_unemployment_change,
+        "inputs": ("growth", "natural_growth", "beta"),
+        "description": "قانون أوكون: التغير في البطالة"
+    },
+    "doubling_time": {
+        "func": formulas.doubling_time,
+        "inputs": ("growth",),
+        "description": "قاعدة 70: سنوات المضاعفة"
+    }
+}
+
+_results = OrderedDict()
+_inflight = {}
+_pending = defaultdict(list)
+_stats = {"requests": 0, "rows": 0, "cache_hits": 0, "coalesced": 0, "batches": 0, "errors": 0}
+
+
+class InputError(ValueError):
+    """مدخلات الطلب غير صالحة (تُعاد للعميل كخطأ 400)"""
+
+
+# ========== المدخلات ==========
+def calculators_info():
+    """وصف الحاسبات (للتوثيق عبر GET)"""
+    return {
+        name: {
+            "inputs": list(spec["inputs"]),
+            "vector_inputs": list(spec.get("vector_inputs", ())),
+            "description": spec["description"]
+        }
+        for name, spec in CALCULATORS.items()
+    }
+
+
+def _records_to_columns(records):
+    columns = defaultdict(list)
+    for record in records:
+        if not isinstance(record, dict):
+            raise InputError("كل عنصر في القائمة يجب أن يكون كائناً {اسم المدخل: قيمة}")
+        for name, value in record.items():
+            columns[name].append(value)
+    return columns
+
+
+def _arrow_columns(body):
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(body).read_all()
+    return {name: table.column(name).to_pylist() for name in table.column_names}
+
+
+def parse_inputs(name, body, content_type=""):
+    """أعمدة numpy بطول الدفعة لكل مدخل من جسم الطلب
+
+    JSON: كائن أعمدة {"consumption": [..], "investment": 10, ...} (القيم المفردة تُكرر لكل صف)
+    أو قائمة صفوف [{"consumption": .., ...}, ...]. Arrow: جدول IPC أعمدته أسماء المدخلات.
+    """
+    spec = CALCULATORS[name]
+
+    try:
+        if content_type.startswith(ARROW_MEDIA_TYPE):
+            columns = _arrow_columns(body)
+        else:
+            columns = json.loads(body or b"{}")
+    except ValueError as e:
+        raise InputError(f"تعذرت قراءة جسم الطلب: {e}") from e
+
+    if isinstance(columns, list):
+        columns = _records_to_columns(columns)
+    if not isinstance(columns, dict):
+        raise InputError("جسم الطلب يجب أن يكون كائن أعمدة أو قائمة صفوف")
+
+    missing = [input_name for input_name in spec["inputs"] if input_name not in columns]
+    if missing:
+        raise InputError(f"مدخلات ناقصة: {', '.join(missing)} (المطلوب: {', '.join(spec['inputs'])})")
+
+    arrays = {}
+    for input_name in spec["inputs"]:
+        vector = input_name in spec.get("vector_inputs", ())
+        try:
+            array = np.asarray(columns[input_name], dtype=float)
+        except (TypeError, ValueError) as e:
+            raise InputError(f"قيم غير رقمية في {input_name}: {e}") from e
+        if array.ndim > (2 if vector else 1) or (vector and array.ndim == 0):
+            raise InputError(f"شكل غير صالح للمدخل {input_name}: {array.shape}")
+        arrays[input_name] = array
+
+    return _broadcast(arrays, spec)
+
+
+def _broadcast(arrays, spec):
+    """مد القيم المفردة (أو السلة الواحدة) إلى طول الدفعة"""
+    vector_inputs = spec.get("vector_inputs", ())
+    lengths = {
+        len(array) for input_name, array in arrays.items()
+        if array.ndim == (2 if input_name in vector_inputs else 1)
+    }
+    if len(lengths) > 1:
+        raise InputError(f"أطوال المدخلات مختلفة: {sorted(lengths)}")
+    rows = lengths.pop() if lengths else 1
+
+    broadcast = {}
+    for input_name, array in arrays.items():
+        if input_name in vector_inputs:
+            broadcast[input_name] = array if array.ndim == 2 else np.broadcast_to(array, (rows, len(array)))
+        else:
+            broadcast[input_name] = array if array.ndim == 1 else np.full(rows, float(array))
+    return broadcast
+
+
+# ========== الحساب ==========
+def evaluate(name, columns):
+    """تطبيق صيغة الحاسبة على أعمدة الدفعة (مصفوفة نتائج بطول الدفعة)"""
+    spec = CALCULATORS[name]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = spec["func"](*(columns[input_name] for input_name in spec["inputs"]))
+    return np.asarray(result, dtype=float)
+
+
+def _rows(columns):
+    return len(next(iter(columns.values())))
+
+
+def _evaluate_one(name, columns):
+    try:
+        return evaluate(name, columns)
+    except ValueError as e:
+        return InputError(f"تعذر الحساب: {e}")
+
+
+def _evaluate_batch(name, batch):
+    """حساب طلبات مجمّعة في استدعاء متجه واحد ثم تقسيم النتائج حسب الطلب (نتيجة أو خطأ لكل طلب)"""
+    inputs = CALCULATORS[name]["inputs"]
+    try:
+        combined = {input_name: np.concatenate([columns[input_name] for columns in batch])
+                    for input_name in inputs}
+        result = evaluate(name, combined)
+    except ValueError:
+        # سلال بأحجام مختلفة (cpi) أو طلب بشكل غير صالح: كل طلب يُحسب على حدة
+        return [_evaluate_one(name, columns) for columns in batch]
+
+    return np.split(result, np.cumsum([_rows(columns) for columns in batch])[:-1])
+
+
+async def _run_batch(name, pending):
+    batch = [columns for columns, _ in pending]
+    _stats["batches"] += 1
+
+    try:
+        if sum(_rows(columns) for columns in batch) > API_INLINE_ROWS:
+            results = await asyncio.get_running_loop().run_in_executor(None, _evaluate_batch, name, batch)
+        else:
+            results = _evaluate_batch(name, batch)
+    except Exception as e:
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for (_, future), result in zip(pending, results):
+        if future.done():
+            continue
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _flush(name):
+    pending = _pending.pop(name, [])
+    if pending:
+        asyncio.ensure_future(_run_batch(name, pending))
+
+
+def request_key(name, body, content_type=""):
+    """مفتاح الطلب في الذاكرة المؤقتة: الحاسبة + نوع المحتوى + بصمة الجسم"""
+    digest = hashlib.sha1(f"{name}|{content_type}|".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+async def compute(name, body, content_type=""):
+    """نتيجة الطلب: من الذاكرة المؤقتة، أو من حساب جارٍ لنفس الطلب، أو ضمن الدفعة المجمّعة التالية"""
+    _stats["requests"] += 1
+    key = request_key(name, body, content_type)
+
+    result = _results.get(key)
+    if result is not None:
+        _results.move_to_end(key)
+        _stats["cache_hits"] += 1
+        return result
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(inflight)
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _inflight[key] = future
+    try:
+        columns = parse_inputs(name, body, content_type)
+        _stats["rows"] += _rows(columns)
+
+        pending = _pending[name]
+        pending.append((columns, future))
+        if len(pending) == 1:
+            loop.call_later(API_COALESCE_WINDOW_S, _flush, name)
+        elif sum(_rows(columns) for columns, _ in pending) >= API_BATCH_MAX_ROWS:
+            _flush(name)
+
+        result = await future
+    except Exception as e:
+        _stats["errors"] += 1
+        if not future.done():
+            future.set_exception(e)
+        # الطلبات المتطابقة المنتظرة تتلقى نفس الخطأ؛ هذا يمنع تحذير "استثناء لم يُقرأ"
+        future.exception()
+        raise
+    finally:
+        del _inflight[key]
+
+    # نسخة مستقلة حتى لا تُبقي الذاكرة المؤقتة مصفوفة الدفعة المجمّعة كاملة
+    result = _results[key] = result.copy()
+    while len(_results) > API_CACHE_SIZE:
+        _results.popitem(last=False)
+    return result
+
+
+# ========== المخرجات ==========
+def json_response(name, result):
+    """النتيجة كـ JSON (القيم غير المعرفة، مثل القسمة على صفر، تصبح null)"""
+    values = [value if math.isfinite(value) else None for value in result.tolist()]
+    return json.dumps({"calculator": name, "count": len(values), "result": values}, ensure_ascii=False)
+
+
+def arrow_response(result):
+    """النتيجة كجدول Arrow IPC بعمود واحد result"""
+    import pyarrow as pa
+
+    table = pa.table({"result": pa.array(result, type=pa.float64())})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def api_metrics_text():
+    """عدادات الواجهة بصيغة Prometheus النصية"""
+    lines = []
+    for name, value in _stats.items():
+        lines.append(f"# TYPE econ_app_api_{name}_total counter")
+        lines.append(f"econ_app_api_{name}_total {value}")
+    lines.append("# TYPE econ_app_api_cache_entries gauge")
+    lines.append(f"econ_app_api_cache_entries {len(_results)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,55 @@
+"""عناصر تحكم مشتركة للرسوم البيانية في الواجهة"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from econ_app.downsample import MAX_POINTS, axis_kind
+
+# تفعيل وضع المنزلقات داخل المتصفح افتراضياً لكل الرسوم التي تدعمه
+CLIENT_SLIDERS = os.environ.get("ECON_APP_CLIENT_SLIDERS", "0") == "1"
+
+
+def _slider_value(value):
+    """تحويل قيم numpy/pandas إلى أنواع يقبلها st.slider"""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value.item() if hasattr(value, "item") else value
+
+
+def zoom_range(x_values, key, max_points=MAX_POINTS):
+    """نطاق المحور الأفقي المطلوب تكبيره للسلاسل الطويلة (None = كامل السلسلة)
+
+    plotly_chart لا يعيد أحداث التكبير إلى الخادم، لذلك يُختار النطاق من شريط منزلق
+    ثم تُعاد قراءة النقاط داخله بدقة كاملة قبل تقليصها إلى عرض الرسم.
+    """
+    values = pd.Series(x_values).dropna()
+    kind = axis_kind(values)
+    if len(values) <= max_points or kind == "position":
+        # المحاور النصية لا نطاق لها في st.slider (تُقلَّص حسب ترتيب الصفوف)
+        return None
+    if kind == "numeric":
+        values = pd.to_numeric(values)
+
+    low, high = _slider_value(values.min()), _slider_value(values.max())
+    selected = st.slider(
+        "🔍 نطاق العرض (تكبير بدقة كاملة)",
+        min_value=low,
+        max_value=high,
+        value=(low, high),
+        key=key
+    )
+
+    if tuple(selected) == (low, high):
+        return None
+    return tuple(selected)
+
+
+def client_mode(key):
+    """وضع المنزلق داخل المتصفح: الرسم يحمل كل قيم المعامل فيُحرَّك دون إعادة تشغيل على الخادم"""
+    return st.toggle(
+        "⚡ تحريك فوري في المتصفح",
+        value=CLIENT_SLIDERS,
+        key=key,
+        help="كل قيم المنزلق مضمنة في الرسم، فلا يرسل التحريك أي طلب إلى الخادم"
+    )
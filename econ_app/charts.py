@@ -0,0 +1,297 @@
+"""الرسوم البيانية المشتركة بين الواجهة وسطر الأوامر"""
+import os
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from econ_app.analytics import (
+    YEAR_COL, GROWTH_COL, INFLATION_COL, UNEMPLOYMENT_COL, UNEMPLOYMENT_CHANGE_COL,
+    is_favorable_effect
+)
+from econ_app.downsample import MAX_POINTS, downsample_positions
+from econ_app.trendlines import trendline_points
+
+# فوق هذا العدد من النقاط تُرسم المخططات النقطية بـ WebGL (Scattergl) بدل SVG
+WEBGL_THRESHOLD = int(os.environ.get("ECON_APP_WEBGL_THRESHOLD", "5000"))
+
+
+def scatter_render_mode(n_points):
+    """webgl للمخططات النقطية الكبيرة و svg للصغيرة"""
+    return "webgl" if n_points > WEBGL_THRESHOLD else "svg"
+
+
+def _trim_hover(fig, x_label, y_label):
+    """تلميح مختصر (س، ص فقط) يخفف بيانات التلميح في المخططات الكبيرة"""
+    fig.update_traces(
+        hovertemplate=f"{x_label}: %{{x:.2f}}<br>{y_label}: %{{y:.2f}}<extra></extra>",
+        selector=dict(mode="markers")
+    )
+
+
+def add_trendline(fig, x, y, method="ols", color="red", points=None):
+    """إضافة خط الاتجاه كأثر خفيف (نقطتان للخط المستقيم) محسوب بصيغة مغلقة أو مسبقاً (points)"""
+    line_x, line_y = trendline_points(x, y, method) if points is None else points
+    if len(line_x) == 0:
+        return fig
+
+    fig.add_trace(go.Scatter(
+        x=line_x,
+        y=line_y,
+        mode="lines",
+        name="خط الاتجاه",
+        line=dict(color=color, width=2),
+        showlegend=False
+    ))
+    return fig
+
+
+def trend_figure(years, values, trend_line, title="الاتجاه العام للناتج المحلي الحقيقي",
+                 max_points=MAX_POINTS, x_range=None):
+    """السلسلة الفعلية مع خط الاتجاه العام (مقلّصة إلى max_points نقطة داخل x_range)"""
+    positions = downsample_positions(years, values, max_points, x_range)
+    years = np.asarray(years)[positions]
+    values = np.asarray(values)[positions]
+    trend_line = np.asarray(trend_line)[positions]
+
+    fig_trend = go.Figure()
+    fig_trend.add_trace(go.Scatter(
+        x=years,
+        y=values,
+        name="الناتج الحقيقي",
+        mode='lines+markers',
+        line=dict(color='blue', width=2)
+    ))
+    fig_trend.add_trace(go.Scatter(
+        x=years,
+        y=trend_line,
+        name="الاتجاه العام",
+        line=dict(color='red', width=2, dash='dash')
+    ))
+
+    fig_trend.update_layout(
+        title=title,
+        xaxis_title="السنة",
+        yaxis_title="مليار يورو",
+        height=400
+    )
+    return fig_trend
+
+
+def okun_scatter_figure(df_analysis, growth_col=GROWTH_COL, year_col=YEAR_COL):
+    """قانون أوكون من بيانات حقيقية مع خط الانحدار"""
+    render_mode = scatter_render_mode(len(df_analysis))
+
+    fig_real_okun = px.scatter(
+        df_analysis,
+        x=growth_col,
+        y=UNEMPLOYMENT_CHANGE_COL,
+        title="قانون أوكون - بيانات حقيقية",
+        render_mode=render_mode,
+        labels={
+            growth_col: "معدل النمو الاقتصادي (%)",
+            UNEMPLOYMENT_CHANGE_COL: "التغير في معدل البطالة (نقطة مئوية)"
+        }
+    )
+
+    if render_mode == "webgl":
+        # بدون تسميات نصية لكل نقطة: تلميح النمو والتغير فقط
+        _trim_hover(fig_real_okun, "النمو", "تغير البطالة")
+    elif year_col in df_analysis.columns:
+        # إضافة معلومات النقاط
+        fig_real_okun.update_traces(
+            text=df_analysis[year_col].astype(str),
+            textposition="top center"
+        )
+
+    add_trendline(fig_real_okun, df_analysis[growth_col], df_analysis[UNEMPLOYMENT_CHANGE_COL])
+    fig_real_okun.update_layout(height=400)
+    return fig_real_okun
+
+
+def relationship_figure(df, x_var, y_var, trendline="ols", trendline_line=None):
+    """العلاقة بين متغيرين مع خط الاتجاه (WebGL للبيانات الكبيرة)، ويمكن تمرير نقاط الخط محسوبة مسبقاً"""
+    render_mode = scatter_render_mode(len(df))
+
+    fig_scatter = px.scatter(
+        df,
+        x=x_var,
+        y=y_var,
+        title=f"العلاقة بين {x_var} و {y_var}",
+        render_mode=render_mode
+    )
+
+    if render_mode == "webgl":
+        _trim_hover(fig_scatter, x_var, y_var)
+    return add_trendline(fig_scatter, df[x_var], df[y_var], trendline, points=trendline_line)
+
+
+def okun_figure(g_star, beta, scenarios):
+    """منحنى أوكون النظري مع نقاط السيناريوهات"""
+    growth_values = np.linspace(-5, 7, 50)
+    unemployment_changes = -beta * (growth_values - g_star)
+
+    fig_okun = go.Figure()
+
+    # منحنى أوكون
+    fig_okun.add_trace(go.Scatter(
+        x=growth_values,
+        y=unemployment_changes,
+        name="قانون أوكون",
+        line=dict(color='blue', width=3),
+        hovertemplate="النمو: %{x:.1f}%<br>تغير البطالة: %{y:.2f} نقطة"
+    ))
+
+    # إضافة خطوط مرجعية
+    fig_okun.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig_okun.add_vline(x=g_star, line_dash="dash", line_color="green",
+                       annotation_text=f"النمو الطبيعي ({g_star}%)")
+
+    # إضافة نقاط السيناريوهات
+    fig_okun.add_trace(go.Scatter(
+        x=scenarios["growth"].round(1),
+        y=scenarios["delta_u"].round(2),
+        mode='markers+text',
+        name="السيناريوهات",
+        marker=dict(size=12, color='red'),
+        text=scenarios["scenario"].str.split('(').str[0],
+        textposition="top center"
+    ))
+
+    fig_okun.update_layout(
+        title="قانون أوكون: العلاقة بين النمو والتغير في البطالة",
+        xaxis_title="معدل النمو الاقتصادي (%)",
+        yaxis_title="التغير في معدل البطالة (نقطة مئوية)",
+        height=500,
+        hovermode="x unified"
+    )
+    return fig_okun
+
+
+def client_slider_figure(base_traces, steps, active=0, prefix="", **layout):
+    """رسم بمنزلق Plotly يعمل داخل المتصفح: كل خطوة إطار محسوب مسبقاً يُعرض دون الرجوع إلى الخادم
+
+    base_traces: مسارات ثابتة في كل الخطوات. steps: قائمة (التسمية، مسارات الخطوة، تحديثات التخطيط)؛
+    الإطارات تستبدل مسارات الخطوة فقط، فتبقى المسارات الثابتة مرة واحدة في الرسم.
+    """
+    step_traces = list(range(len(base_traces), len(base_traces) + len(steps[active][1])))
+
+    fig = go.Figure(
+        data=list(base_traces) + list(steps[active][1]),
+        frames=[
+            go.Frame(name=label, data=traces, layout=frame_layout, traces=step_traces)
+            for label, traces, frame_layout in steps
+        ]
+    )
+    fig.update_layout(**layout)
+    fig.update_layout(steps[active][2])
+
+    # انتقال فوري دون حركة: المنزلق يعمل كمنزلق الخادم لكن في المتصفح
+    fig.update_layout(sliders=[{
+        "active": active,
+        "currentvalue": {"prefix": prefix},
+        "pad": {"t": 50},
+        "steps": [
+            {
+                "label": label,
+                "method": "animate",
+                "args": [[label], {"mode": "immediate", "frame": {"duration": 0, "redraw": True},
+                                   "transition": {"duration": 0}}]
+            }
+            for label, _, _ in steps
+        ]
+    }])
+    return fig
+
+
+def okun_slider_figure(g_star, betas, scenarios_by_beta, active=0):
+    """منحنى أوكون مع منزلق β داخل المتصفح (سيناريوهات كل قيمة من β محسوبة مسبقاً)"""
+    growth_values = np.linspace(-5, 7, 50)
+
+    steps = []
+    for beta, scenarios in zip(betas, scenarios_by_beta):
+        steps.append((f"{beta:g}", [
+            go.Scatter(
+                x=growth_values,
+                y=-beta * (growth_values - g_star),
+                name="قانون أوكون",
+                line=dict(color='blue', width=3),
+                hovertemplate="النمو: %{x:.1f}%<br>تغير البطالة: %{y:.2f} نقطة"
+            ),
+            go.Scatter(
+                x=scenarios["growth"].round(1),
+                y=scenarios["delta_u"].round(2),
+                mode='markers+text',
+                name="السيناريوهات",
+                marker=dict(size=12, color='red'),
+                text=scenarios["scenario"].str.split('(').str[0],
+                textposition="top center"
+            )
+        ], {"title": f"قانون أوكون: العلاقة بين النمو والتغير في البطالة (β = {beta:g})"}))
+
+    # محور رأسي ثابت لكل قيم β حتى لا يقفز الرسم أثناء التحريك
+    extent = max(betas) * max(abs(growth_values - g_star)) * 1.1
+
+    fig = client_slider_figure(
+        [], steps, active,
+        prefix="معامل أوكون (β): ",
+        xaxis_title="معدل النمو الاقتصادي (%)",
+        yaxis_title="التغير في معدل البطالة (نقطة مئوية)",
+        yaxis_range=[-extent, extent],
+        height=550,
+        hovermode="x unified"
+    )
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.add_vline(x=g_star, line_dash="dash", line_color="green",
+                  annotation_text=f"النمو الطبيعي ({g_star}%)")
+    return fig
+
+
+def phillips_figure(phillips_data, natural_unemployment, title="منحنى فيليبس قصير الأجل"):
+    """منحنى فيليبس مع خط البطالة الطبيعية"""
+    fig_phillips = px.scatter(
+        phillips_data,
+        x=UNEMPLOYMENT_COL,
+        y=INFLATION_COL,
+        title=title
+    )
+    add_trendline(fig_phillips, phillips_data[UNEMPLOYMENT_COL], phillips_data[INFLATION_COL], "lowess")
+
+    fig_phillips.update_layout(
+        xaxis_title="معدل البطالة (%)",
+        yaxis_title="معدل التضخم (%)",
+        height=400
+    )
+
+    # إضافة خط البطالة الطبيعية
+    fig_phillips.add_vline(
+        x=natural_unemployment,
+        line_dash="dash",
+        line_color="green",
+        annotation_text=f"البطالة الطبيعية ({natural_unemployment}%)"
+    )
+    return fig_phillips
+
+
+def policy_figure(policy_type, effects):
+    """مخطط أعمدة لتأثيرات سياسة اقتصادية"""
+    indicators = list(effects.keys())
+    values = list(effects.values())
+
+    fig_policy = go.Figure(data=[
+        go.Bar(
+            x=indicators,
+            y=values,
+            marker_color=['#2ecc71' if is_favorable_effect(k, v) else '#e74c3c'
+                          for k, v in effects.items()],
+            text=[f"{v:+.2f}" for v in values],
+            textposition='auto'
+        )
+    ])
+
+    fig_policy.update_layout(
+        title=f"تأثيرات {policy_type}",
+        yaxis_title="التأثير (نقطة مئوية)",
+        height=400
+    )
+    return fig_policy
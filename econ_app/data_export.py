@@ -0,0 +1,75 @@
+"""تصدير سريع للبيانات بصيغ عمودية (Parquet و Arrow IPC و CSV مضغوط) عبر pyarrow"""
+
+
+def _to_arrow(df):
+    """تحويل DataFrame إلى جدول Arrow دون نسخ الأعمدة الرقمية"""
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_parquet(df, path):
+    """كتابة البيانات بصيغة Parquet (ضغط zstd)"""
+    import pyarrow.parquet as pq
+
+    pq.write_table(_to_arrow(df), path, compression="zstd")
+    return path
+
+
+def _write_compressed_csv(df, path, codec):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    with pa.CompressedOutputStream(path, codec) as sink:
+        pa_csv.write_csv(_to_arrow(df), sink)
+    return path
+
+
+def write_csv_gzip(df, path):
+    """كتابة البيانات بصيغة CSV مضغوطة بـ gzip"""
+    return _write_compressed_csv(df, path, "gzip")
+
+
+def write_csv_zstd(df, path):
+    """كتابة البيانات بصيغة CSV مضغوطة بـ zstd"""
+    return _write_compressed_csv(df, path, "zstd")
+
+
+def write_arrow_ipc(df, path):
+    """كتابة البيانات بصيغة Arrow IPC (ملف Feather v2)"""
+    import pyarrow as pa
+
+    table = _to_arrow(df)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return path
+
+
+# الصيغ المتاحة: التسمية المعروضة ← (نوع الملف، الامتداد، MIME، دالة الكتابة)
+EXPORT_FORMATS = {
+    "Parquet (.parquet)": {
+        "kind": "parquet",
+        "suffix": ".parquet",
+        "mime": "application/vnd.apache.parquet",
+        "writer": write_parquet
+    },
+    "CSV مضغوط gzip (.csv.gz)": {
+        "kind": "csv.gz",
+        "suffix": ".csv.gz",
+        "mime": "application/gzip",
+        "writer": write_csv_gzip
+    },
+    "CSV مضغوط zstd (.csv.zst)": {
+        "kind": "csv.zst",
+        "suffix": ".csv.zst",
+        "mime": "application/zstd",
+        "writer": write_csv_zstd
+    },
+    "Arrow IPC (.arrow)": {
+        "kind": "arrow",
+        "suffix": ".arrow",
+        "mime": "application/vnd.apache.arrow.file",
+        "writer": write_arrow_ipc
+    }
+}
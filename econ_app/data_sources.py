@@ -0,0 +1,98 @@
+"""مصادر بيانات التطبيق: عينة فرنسا المضمنة، بيانات البنك الدولي، والملفات المرفوعة"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from econ_app.shared_data import shared_upload
+
+
+def load_france_sample_data():
+    """تحميل عينة بيانات فرنسا"""
+    # بيانات نمو الناتج المحلي لفرنسا (سنوات حديثة)
+    gdp_data = {
+        "السنة": [2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023],
+        "الناتج_الحقيقي_مليار_يورو": [2194.2, 2219.8, 2291.3, 2346.2, 2388.1, 2289.8, 2415.6, 2489.3, 2542.1],
+        "الناتج_الاسمي_مليار_يورو": [2194.2, 2231.1, 2345.2, 2424.6, 2491.8, 2396.8, 2564.3, 2718.5, 2865.2],
+        "معدل_النمو_٪": [1.1, 1.1, 2.3, 1.9, 1.8, -7.9, 6.8, 2.5, 0.9],
+        "التضخم_٪": [0.1, 0.3, 1.2, 2.1, 1.3, 0.5, 1.6, 5.2, 4.9],
+        "البطالة_٪": [10.4, 10.1, 9.4, 9.1, 8.4, 8.0, 7.9, 7.3, 7.1]
+    }
+    
+    df_gdp = pd.DataFrame(gdp_data)
+    
+    # بيانات مكونات الناتج المحلي 2023
+    components_data = {
+        "المكون": ["الاستهلاك", "الاستثمار", "الإنفاق_الحكومي", "الصادرات", "الواردات"],
+        "القيمة_مليار_يورو": [1345.2, 652.3, 615.8, 745.6, 822.4],
+        "النسبة_٪": [53.0, 25.7, 24.2, 29.3, 32.3]
+    }
+    
+    df_components = pd.DataFrame(components_data)
+    
+    # بيانات القطاعات الاقتصادية
+    sectors_data = {
+        "القطاع": ["الخدمات", "الصناعة", "البناء", "الزراعة"],
+        "المساهمة_في_الناتج_٪": [70.2, 13.5, 5.8, 1.5],
+        "نمو_2023_٪": [1.2, -0.8, 0.5, -2.1]
+    }
+    
+    df_sectors = pd.DataFrame(sectors_data)
+    
+    return {
+        "الناتج_المحلي": df_gdp,
+        "مكونات_الناتج": df_components,
+        "القطاعات": df_sectors
+    }
+
+
+def download_worldbank_data():
+    """تحميل بيانات من البنك الدولي"""
+    try:
+        st.sidebar.info("جارٍ تحميل بيانات البنك الدولي...")
+        
+        # مثال لبيانات الناتج المحلي العالمي
+        countries = ["فرنسا", "ألمانيا", "إيطاليا", "إسبانيا", "المملكة المتحدة"]
+        gdp_data = []
+        
+        for country in countries:
+            base_gdp = np.random.uniform(1000, 4000)
+            for year in range(2018, 2024):
+                growth = np.random.uniform(-2, 4)
+                if year == 2020:  # تأثير COVID
+                    growth = np.random.uniform(-8, -4)
+                
+                gdp = base_gdp * (1 + growth/100) ** (year - 2018)
+                gdp_data.append({
+                    "البلد": country,
+                    "السنة": year,
+                    "الناتج_المحلي_مليار_دولار": round(gdp, 1)
+                })
+        
+        df_worldbank = pd.DataFrame(gdp_data)
+        
+        st.sidebar.success("تم تحميل بيانات البنك الدولي")
+        return df_worldbank
+        
+    except Exception as e:
+        st.sidebar.error(f"خطأ في تحميل البيانات: {str(e)}")
+        return None
+
+
+def handle_uploaded_file(uploaded_file, file_type):
+    """معالجة الملفات المرفوعة"""
+    try:
+        # الملف يُحلَّل مرة واحدة لكل محتوى ويُشارك بين الجلسات
+        df = shared_upload(uploaded_file, file_type)
+        
+        # تحليل محتوى الملف تلقائياً
+        file_info = {
+            "عدد_الصفوف": df.shape[0],
+            "عدد_الأعمدة": df.shape[1],
+            "الأعمدة": df.columns.tolist(),
+            "عينة_من_البيانات": df.head()
+        }
+        
+        return df, file_info
+    except Exception as e:
+        st.error(f"خطأ في قراءة الملف: {str(e)}")
+        return None, None
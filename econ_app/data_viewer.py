@@ -0,0 +1,164 @@
+"""عارض بيانات مُقسَّم إلى صفحات: لا يُرسَل إلى المتصفح إلا الصفوف المرئية"""
+import hashlib
+import math
+import weakref
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+DEFAULT_PAGE_SIZE = 100
+PAGE_SIZE_OPTIONS = [25, 50, 100, 250, 500]
+NO_SELECTION = "(بدون)"
+
+# بصمات البيانات محفوظة حسب هوية الكائن حتى لا نعيد حسابها في كل إعادة تشغيل
+_KEY_MEMO = {}
+
+
+# ========== بصمة البيانات ==========
+def dataset_key(df):
+    """بصمة (hash) لمحتوى DataFrame تُستخدم مفتاحاً للتخزين المؤقت"""
+    memo = _KEY_MEMO.get(id(df))
+    if memo is not None and memo[0]() is df:
+        return memo[1]
+
+    hashed = pd.util.hash_pandas_object(df, index=True).values
+    digest = hashlib.sha1(hashed.tobytes())
+    digest.update("|".join(map(str, df.columns)).encode("utf-8"))
+    key = digest.hexdigest()
+
+    obj_id = id(df)
+    _KEY_MEMO[obj_id] = (weakref.ref(df, lambda _: _KEY_MEMO.pop(obj_id, None)), key)
+    return key
+
+
+# ========== الفهارس والتصفية على الخادم ==========
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _sort_index(_df, ds_key, column, descending):
+    """ترتيب مواضع الصفوف حسب عمود (فهرس يُحسب مرة واحدة لكل عمود)"""
+    values = pd.Series(_df[column].to_numpy())
+    order = values.sort_values(
+        ascending=not descending, kind="stable", na_position="last"
+    ).index.to_numpy()
+    order.flags.writeable = False
+    return order
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _filter_mask(_df, ds_key, column, text=None, low=None, high=None):
+    """قناع منطقي للصفوف المطابقة لشرط التصفية"""
+    series = _df[column]
+    if text is not None:
+        mask = series.astype(str).str.contains(text, case=False, regex=False, na=False)
+    else:
+        mask = pd.Series(True, index=series.index)
+        if low is not None:
+            mask &= series >= low
+        if high is not None:
+            mask &= series <= high
+    mask = mask.to_numpy(dtype=bool)
+    mask.flags.writeable = False
+    return mask
+
+
+def _row_positions(df, ds_key, sort_col, descending, filter_spec):
+    """مواضع الصفوف بعد الفرز والتصفية"""
+    if sort_col is not None:
+        positions = _sort_index(df, ds_key, sort_col, descending)
+    else:
+        positions = np.arange(len(df))
+
+    if filter_spec is not None:
+        mask = _filter_mask(df, ds_key, *filter_spec)
+        positions = positions[mask[positions]]
+
+    return positions
+
+
+# ========== الإحصائيات الوصفية (حساب كسول) ==========
+@st.cache_data(show_spinner="جارٍ حساب الإحصائيات...", max_entries=16)
+def _describe(_df, ds_key):
+    return _df.describe()
+
+
+def describe_dataset(df):
+    """الإحصائيات الوصفية مخزنة مؤقتاً لكل مجموعة بيانات"""
+    return _describe(df, dataset_key(df))
+
+
+# ========== واجهة العرض ==========
+def _filter_controls(df, column, key):
+    """أدوات إدخال شرط التصفية حسب نوع العمود"""
+    series = df[column]
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        col_min, col_max = st.columns(2)
+        with col_min:
+            low = st.number_input("من", value=None, key=f"{key}_filter_low")
+        with col_max:
+            high = st.number_input("إلى", value=None, key=f"{key}_filter_high")
+        if low is None and high is None:
+            return None
+        return (column, None, low, high)
+
+    text = st.text_input("يحتوي على", key=f"{key}_filter_text")
+    if not text:
+        return None
+    return (column, text, None, None)
+
+
+def render_paged_dataframe(df, key, page_size=DEFAULT_PAGE_SIZE):
+    """عرض DataFrame كبير صفحةً صفحة مع فرز وتصفية على الخادم"""
+    if df is None or len(df) == 0:
+        st.info("لا توجد بيانات للعرض")
+        return
+
+    ds_key = dataset_key(df)
+    columns = [NO_SELECTION] + df.columns.tolist()
+
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+
+    with col1:
+        sort_choice = st.selectbox("ترتيب حسب", columns, key=f"{key}_sort")
+
+    with col2:
+        descending = st.checkbox("تنازلي", key=f"{key}_desc")
+
+    with col3:
+        filter_choice = st.selectbox("تصفية حسب", columns, key=f"{key}_filter_col")
+
+    with col4:
+        page_size = st.selectbox(
+            "عدد الصفوف",
+            PAGE_SIZE_OPTIONS,
+            index=PAGE_SIZE_OPTIONS.index(page_size) if page_size in PAGE_SIZE_OPTIONS else 0,
+            key=f"{key}_page_size"
+        )
+
+    filter_spec = None
+    if filter_choice != NO_SELECTION:
+        filter_spec = _filter_controls(df, filter_choice, key)
+
+    sort_col = None if sort_choice == NO_SELECTION else sort_choice
+    positions = _row_positions(df, ds_key, sort_col, descending, filter_spec)
+
+    total = len(positions)
+    n_pages = max(1, math.ceil(total / page_size))
+
+    # تصحيح رقم الصفحة إذا قلّ عدد الصفحات بعد التصفية
+    # القيمة الابتدائية تُوضع في session_state لا في value= حتى لا يتعارض التصحيح مع الافتراضي
+    page_key = f"{key}_page"
+    st.session_state.setdefault(page_key, 1)
+    if st.session_state[page_key] > n_pages:
+        st.session_state[page_key] = n_pages
+
+    page = st.number_input("الصفحة", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    start = (int(page) - 1) * page_size
+    stop = min(start + page_size, total)
+
+    st.dataframe(df.iloc[positions[start:stop]], use_container_width=True)
+
+    if total:
+        st.caption(f"الصفوف {start + 1:,}–{stop:,} من {total:,} (إجمالي البيانات: {len(df):,} صف) — الصفحة {int(page)} من {n_pages}")
+    else:
+        st.caption("لا توجد صفوف مطابقة لشرط التصفية")
@@ -0,0 +1,35 @@
+"""قراءة ملفات البيانات الاقتصادية حسب امتدادها"""
+import os
+
+import pandas as pd
+
+DATASET_SUFFIXES = (".csv", ".xlsx", ".xls", ".parquet", ".arrow", ".feather")
+
+
+def read_dataset(path):
+    """قراءة ملف بيانات (CSV أو Excel أو Parquet أو Arrow) إلى DataFrame"""
+    suffix = os.path.splitext(str(path))[1].lower()
+
+    if suffix == ".csv":
+        return pd.read_csv(path, encoding='utf-8')
+    if suffix in (".xlsx", ".xls"):
+        return pd.read_excel(path)
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix in (".arrow", ".feather"):
+        return pd.read_feather(path)
+
+    raise ValueError(f"صيغة ملف غير مدعومة: {suffix}")
+
+
+def find_datasets(paths):
+    """جمع ملفات البيانات من قائمة ملفات ومجلدات"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(DATASET_SUFFIXES):
+                    found.append(os.path.join(path, name))
+        else:
+            found.append(path)
+    return found
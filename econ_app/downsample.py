@@ -0,0 +1,116 @@
+"""تقليص السلاسل الزمنية الطويلة قبل الرسم بخوارزمية LTTB مع الحفاظ على القمم والقيعان"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# أقصى عدد نقاط لكل سلسلة ≈ عرض الرسم بالبكسل
+MAX_POINTS = int(os.environ.get("ECON_APP_MAX_POINTS", "1200"))
+
+
+def axis_kind(values):
+    """نوع المحور الأفقي: "datetime" أو "numeric" أو "position" (نصوص تُرسم بترتيب الصفوف)"""
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return "datetime"
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return "numeric"
+    # عمود نصي من CSV: رقمي فقط إذا تحولت كل قيمه غير الفارغة إلى أرقام
+    numeric = pd.to_numeric(values, errors="coerce")
+    return "numeric" if numeric.notna().sum() == values.notna().sum() else "position"
+
+
+def _datetime_ns(values):
+    """التواريخ كنانوثوانٍ (عشرية، NaN مكان NaT) بعد توحيد الوحدة والمنطقة الزمنية (UTC)
+
+    البيانات ونطاق المنزلق (datetime بالميكروثانية) يجب أن يصلا إلى نفس الوحدة قبل المقارنة.
+    """
+    values = pd.Series(pd.to_datetime(pd.Series(values)))
+    if values.dt.tz is not None:
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    array = values.to_numpy(dtype="datetime64[ns]")
+    return np.where(np.isnat(array), np.nan, array.astype(np.int64).astype(float))
+
+
+def _as_float(values):
+    """تحويل المحور (سنوات، تواريخ، أرقام، نصوص) إلى أعداد عشرية للحساب"""
+    kind = axis_kind(values)
+    if kind == "datetime":
+        return _datetime_ns(values)
+    if kind == "position":
+        return np.arange(len(values), dtype=float)
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+
+
+def lttb_indices(x, y, threshold=MAX_POINTS):
+    """مواقع النقاط المختارة (مرتبة) بخوارزمية Largest-Triangle-Three-Buckets، مع أدنى وأعلى قيمة دائماً"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # حدود الدلاء: الأولى والأخيرة نقطة واحدة، والبقية موزعة بالتساوي
+    every = (n - 2) / (threshold - 2)
+    edges = np.minimum(np.floor(np.arange(threshold) * every).astype(np.int64) + 1, n)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # مساحة المثلث (النقطة السابقة، المرشحة، متوسط الدلو التالي)
+        areas = np.abs(
+            (x[anchor] - avg_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (avg_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    # LTTB وحده لا يضمن اختيار أدنى وأعلى قيمة في السلسلة: كل منهما تحل محل النقطة المختارة من
+    # دلوها (وتُضاف نقطة واحدة إن وقعتا في نفس الدلو)
+    extremes = np.array([np.argmin(y), np.argmax(y)], dtype=np.int64)
+    for extreme in extremes:
+        if 0 < extreme < n - 1:
+            slot = min(int(np.searchsorted(edges, extreme, side="right")), threshold - 2)
+            selected[slot] = extreme
+
+    return np.union1d(selected, extremes)
+
+
+def downsample_positions(x, y, max_points=MAX_POINTS, x_range=None):
+    """مواقع الصفوف المعروضة: قصّ النطاق المطلوب بدقة كاملة ثم تقليصه إلى max_points
+
+    المحاور النصية (مثل "2020-01") تُقلَّص حسب ترتيب الصفوف ويُتجاهل x_range لها.
+    """
+    kind = axis_kind(x)
+    x_values = _as_float(x)
+    y_values = pd.to_numeric(pd.Series(y), errors="coerce").to_numpy(dtype=float)
+
+    keep = np.isfinite(x_values) & np.isfinite(y_values)
+    if x_range is not None and kind != "position":
+        # النطاق يُحوَّل بنفس نوع المحور (التواريخ إلى نانوثوانٍ UTC مثل البيانات)
+        bounds = _datetime_ns(list(x_range)) if kind == "datetime" else _as_float(list(x_range))
+        low, high = (float(bound) for bound in bounds)
+        keep &= (x_values >= low) & (x_values <= high)
+
+    positions = np.flatnonzero(keep)
+    if len(positions) <= max_points:
+        return positions
+
+    return positions[lttb_indices(x_values[positions], y_values[positions], max_points)]
+
+
+def downsample_frame(df, x_col, y_col, max_points=MAX_POINTS, x_range=None):
+    """صفوف DataFrame المختارة للرسم (مرتبة حسب المحور الأفقي)"""
+    ordered = df.sort_values(x_col, kind="stable")
+    positions = downsample_positions(ordered[x_col], ordered[y_col], max_points, x_range)
+    return ordered.iloc[positions]
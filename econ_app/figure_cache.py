@@ -0,0 +1,125 @@
+"""ذاكرة مؤقتة لرسوم Plotly المبنية، مفتاحها دالة البناء ومدخلاتها وبصمة البيانات"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from econ_app.data_viewer import dataset_key
+from econ_app.session_memory import object_size
+
+# عدد الرسوم المحفوظة في العملية (الأقدم استخداماً يُحذف أولاً)
+FIGURE_CACHE_SIZE = int(os.environ.get("ECON_APP_FIGURE_CACHE_SIZE", "256"))
+
+_lock = threading.Lock()
+_figures = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _fingerprint(value, digest):
+    """إضافة بصمة قيمة (بيانات أو معامل) إلى المفتاح"""
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"df:" + dataset_key(value).encode())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(b"series:" + str(value.name).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"array:{value.dtype}:{value.shape}:".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict{")
+        for item_key, item in value.items():
+            _fingerprint(item_key, digest)
+            _fingerprint(item, digest)
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"seq[")
+        for item in value:
+            _fingerprint(item, digest)
+        digest.update(b"]")
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def figure_key(builder, *args, **kwargs):
+    """مفتاح الرسم: اسم دالة البناء + المعاملات + بصمة البيانات"""
+    digest = hashlib.sha1(f"{builder.__module__}.{builder.__qualname__}".encode())
+    _fingerprint(args, digest)
+    _fingerprint(sorted(kwargs.items()), digest)
+    return digest.hexdigest()
+
+
+def _freeze(value):
+    """منع تعديل مصفوفات الرسم المحفوظ في مكانها"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    elif isinstance(value, list):
+        for item in value:
+            _freeze(item)
+
+
+def _copy_spec(value):
+    """نسخة من هيكل الرسم (القواميس والقوائم فقط؛ المصفوفات المجمدة تُشارك)"""
+    if isinstance(value, dict):
+        return {item_key: _copy_spec(item) for item_key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_spec(item) for item in value]
+    return value
+
+
+def cached_figure(builder, *args, **kwargs):
+    """رسم Plotly من الذاكرة المؤقتة، أو بناؤه مرة واحدة وحفظ مواصفاته (fig.to_dict())
+
+    عند الإصابة يُبنى Figure جديد من المواصفات المحفوظة دون إعادة التحقق: لا تحليل JSON ولا
+    تحقق من كل نقطة، وst.plotly_chart لا يعيد التحقق من كائن Figure. الرسم المعاد للعرض فقط:
+    مصفوفات آثاره قد تكون بصيغة Plotly المضغوطة (base64) كما حفظها to_dict.
+    """
+    import plotly.graph_objects as go
+
+    key = figure_key(builder, *args, **kwargs)
+
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None:
+            _figures.move_to_end(key)
+            _stats["hits"] += 1
+
+    if entry is None:
+        fig = builder(*args, **kwargs)
+        spec = fig.to_dict()
+        _freeze(spec)
+        entry = (spec, object_size(spec))
+
+        with _lock:
+            _stats["misses"] += 1
+            _figures[key] = entry
+            _figures.move_to_end(key)
+            while len(_figures) > FIGURE_CACHE_SIZE:
+                _figures.popitem(last=False)
+                _stats["evictions"] += 1
+        return fig
+
+    # نسخة جديدة في كل مرة حتى لا يُعدَّل الرسم المحفوظ (المواصفات تحققت منها Plotly عند البناء)
+    return go.Figure(_copy_spec(entry[0]), _validate=False)
+
+
+def figure_cache_info():
+    """إحصائيات الذاكرة المؤقتة للرسوم"""
+    with _lock:
+        return {
+            **_stats,
+            "size": len(_figures),
+            "max_size": FIGURE_CACHE_SIZE,
+            "bytes": sum(size for _, size in _figures.values())
+        }
+
+
+def clear_figure_cache():
+    """تفريغ الذاكرة المؤقتة للرسوم"""
+    with _lock:
+        _figures.clear()
@@ -0,0 +1,78 @@
+"""صيغ الكتاب كدوال متجهة: تعمل على الأرقام المفردة (الحاسبات) وعلى مصفوفات numpy و Series (البيانات)"""
+import numpy as np
+
+# ثابت قاعدة 70 (≈ 100 × ln 2)
+RULE_OF_70 = 70.0
+
+
+# ========== الناتج المحلي ==========
+def gdp_expenditure(consumption, investment, government, exports, imports):
+    """PIB بطريقة الطلب: C + I + G + (X - M)"""
+    return consumption + investment + government + (exports - imports)
+
+
+def growth_rate(current, previous):
+    """معدل النمو: [(Y_t - Y_t-1) / Y_t-1] × 100"""
+    return (current - previous) / previous * 100
+
+
+def growth_rates(values):
+    """معدلات النمو لسلسلة كاملة (الفترة الأولى NaN)"""
+    values = np.asarray(values, dtype=float)
+    rates = np.full(values.shape, np.nan)
+    rates[1:] = growth_rate(values[1:], values[:-1])
+    return rates
+
+
+def deflator(nominal, real):
+    """مخفض الناتج: PIB الاسمي / PIB الحقيقي"""
+    return nominal / real
+
+
+# ========== الأسعار والتضخم ==========
+def cpi_laspeyres(prices, base_prices, base_quantities):
+    """مؤشر أسعار الاستهلاك (لاسبير): Σ(P_t × Q_base) / Σ(P_base × Q_base) × 100
+
+    prices قد تكون مصفوفة (سنوات × سلع) فيُحسب المؤشر لكل سنة دفعة واحدة.
+    """
+    base_quantities = np.asarray(base_quantities, dtype=float)
+    cost_base = np.asarray(base_prices, dtype=float) @ base_quantities
+    cost_current = np.asarray(prices, dtype=float) @ base_quantities
+    return cost_current / cost_base * 100
+
+
+def inflation_rate(cpi, cpi_previous):
+    """معدل التضخم: [(IPC_t - IPC_t-1) / IPC_t-1] × 100"""
+    return growth_rate(cpi, cpi_previous)
+
+
+def purchasing_power(amount, inflation, years):
+    """القوة الشرائية بعد n سنة: المبلغ / (1 + π)^n"""
+    return amount / (1 + inflation / 100) ** years
+
+
+# ========== سوق العمل ==========
+def unemployment_rate(unemployed, employed):
+    """معدل البطالة: العاطلون / (العاملون + العاطلون) × 100"""
+    return unemployed / (employed + unemployed) * 100
+
+
+def participation_rate(labor_force, working_age_population):
+    """معدل المشاركة: القوى العاملة / السكان في سن العمل × 100"""
+    return labor_force / working_age_population * 100
+
+
+def employment_rate(employed, working_age_population):
+    """معدل التشغيل: العاملون / السكان في سن العمل × 100"""
+    return employed / working_age_population * 100
+
+
+def okun_unemployment_change(growth, natural_growth, beta):
+    """قانون أوكون: Δu = -β (g - g*)"""
+    return -beta * (growth - natural_growth)
+
+
+# ========== قاعدة 70 ==========
+def doubling_time(growth):
+    """عدد سنوات المضاعفة التقريبي: 70 / g"""
+    return RULE_OF_70 / np.asarray(growth, dtype=float)
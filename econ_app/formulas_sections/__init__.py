@@ -0,0 +1 @@
+"""أقسام تطبيق economic_app_formulas.py، وحدة لكل قسم تُستورد عند اختياره"""
@@ -0,0 +1,50 @@
+"""عرض البيانات الحالية وتصديرها"""
+import streamlit as st
+
+from econ_app.data_viewer import dataset_key
+from econ_app.artifact_cache import artifact_key, get_or_build_artifact, load_artifact, lookup_artifact
+from econ_app.data_export import EXPORT_FORMATS
+
+
+def render(df):
+    """عرض تحميل البيانات"""
+    st.header("📥 تحميل البيانات")
+
+    st.info("هذا القسم يسمح بتحميل بيانات حقيقية. راجع الكود السابق لتفاصيل التحميل.")
+
+    st.subheader("📊 البيانات الحالية")
+    st.dataframe(df.head(10), use_container_width=True)
+    st.caption(f"{len(df)} صف و {len(df.columns)} عمود")
+
+    st.subheader("💾 تصدير البيانات")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        export_choice = st.selectbox("صيغة التصدير", list(EXPORT_FORMATS), key="export_format")
+
+    export_format = EXPORT_FORMATS[export_choice]
+    export_key = artifact_key(dataset_key(df), export_format["kind"])
+
+    export_file_name = f"البيانات_الاقتصادية{export_format['suffix']}"
+
+    def build_export(path):
+        return export_format["writer"](df, path)
+
+    # الملف يُكتب عند الطلب فقط (لا عند كل زيارة للصفحة) ثم يُخدم من الذاكرة المؤقتة على القرص؛
+    # إعادة التشغيل تتحقق من وجوده فقط، ومحتواه يُقرأ عند نقر زر التنزيل
+    export_ready = lookup_artifact(export_key, export_format["suffix"]) is not None
+
+    with col2:
+        if not export_ready and st.button(f"⚙️ إنشاء ملف {export_choice}", key="export_build"):
+            with st.spinner("جارٍ إنشاء الملف..."):
+                get_or_build_artifact(export_key, export_format["suffix"], build_export)
+            export_ready = True
+
+        if export_ready:
+            st.download_button(
+                label=f"📥 تنزيل البيانات ({export_choice})",
+                data=lambda: load_artifact(export_key, export_format["suffix"], build_export),
+                file_name=export_file_name,
+                mime=export_format["mime"]
+            )
@@ -0,0 +1,159 @@
+"""الناتج المحلي الإجمالي (PIB) وطرق حسابه"""
+import streamlit as st
+import plotly.graph_objects as go
+
+from econ_app.figure_cache import cached_figure
+from econ_app import formulas
+
+
+def demand_components_figure(C, I, G, NX):
+    """توزيع مكونات PIB حسب طريقة الإنفاق"""
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=['الاستهلاك (C)', 'الاستثمار (I)', 'الإنفاق الحكومي (G)', 'الصادرات الصافية (NX)'],
+        values=[C, I, G, NX if NX > 0 else 0],
+        hole=.3,
+        marker_colors=['#2E86AB', '#A23B72', '#F18F01', '#4CAF50']
+    )])
+
+    fig_pie.update_layout(title="توزيع مكونات PIB")
+    return fig_pie
+
+
+def render(df):
+    """عرض صفحة PIB"""
+    st.header("💰 الناتج المحلي الإجمالي (PIB)")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>📖 التعريف (من الكتاب)</h3>
+        <p><b>الناتج المحلي الإجمالي (PIB)</b> يقيس الإنتاج الكلي للاقتصاد، أي مجموع الثروات المُنتَجة.</p>
+        <p>يُحسب لمنطقة جغرافية معينة (عادة دولة) ولفترة زمنية محددة (عادة سنة أو فصل).</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("📊 الطرق الثلاث لحساب PIB")
+
+    tab1, tab2, tab3 = st.tabs(["1️⃣ طريقة الإنتاج", "2️⃣ طريقة الطلب", "3️⃣ طريقة الدخل"])
+
+    with tab1:
+        st.markdown("""
+        ### 1️⃣ طريقة الإنتاج (Optique de la production)
+
+        <div class="formula-box">
+            <h4>📐 الصيغة الأساسية:</h4>
+            <p style="font-size: 20px; text-align: center;">
+                <b>PIB = مجموع القيم المضافة</b>
+            </p>
+            <p style="font-size: 18px; text-align: center;">
+                <b>VA = Production - Consommations Intermédiaires</b>
+            </p>
+            <p style="text-align: center;">
+                القيمة المضافة = الإنتاج - الاستهلاكات الوسيطة
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### 📚 من الكتاب:
+
+        <div class="law-box">
+            <p><b>لماذا نطرح الاستهلاكات الوسيطة؟</b></p>
+            <p>لتجنب الحساب المزدوج (Double comptabilisation). إذا جمعنا إنتاج جميع الصناعات، 
+            سنحسب إنتاج الفولاذ مرتين:</p>
+            <ul>
+                <li>المرة الأولى: عندما يُستخرج ويُباع كفولاذ</li>
+                <li>المرة الثانية: عندما يُحوّل ويُباع كسيارة</li>
+            </ul>
+            <p><b>الحل:</b> نستخدم مفهوم القيمة المضافة!</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown("""
+        ### 2️⃣ طريقة الطلب (Optique de la demande)
+
+        <div class="formula-box">
+            <h4>📐 الصيغة:</h4>
+            <p style="font-size: 20px; text-align: center;">
+                <b>PIB = C + I + G + (X - M)</b>
+            </p>
+            <p style="text-align: center;">حيث:</p>
+            <ul>
+                <li><b>C:</b> الاستهلاك (Consommation)</li>
+                <li><b>I:</b> الاستثمار (Investissement - FBCF)</li>
+                <li><b>G:</b> الإنفاق الحكومي (Dépenses publiques)</li>
+                <li><b>X:</b> الصادرات (Exportations)</li>
+                <li><b>M:</b> الواردات (Importations)</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### 🧮 حاسبة PIB (طريقة الطلب)
+        """)
+
+        # كل حاسبة جزء (fragment) مستقل: تغيير مدخلاتها يعيد تشغيل هذا الجزء فقط وليس الصفحة كلها
+        # والمدخلات المتعددة مجمعة في نموذج (form) فلا يُعاد الحساب إلا عند الضغط على زر الحساب
+        @st.fragment
+        def demand_calculator():
+            with st.form("demand_form"):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    C = st.number_input("الاستهلاك (C) - بالمليار", value=1268.5, step=10.0, key="c_demand")
+                    I = st.number_input("الاستثمار (I) - بالمليار", value=537.9, step=10.0, key="i_demand")
+
+                with col2:
+                    G = st.number_input("الإنفاق الحكومي (G) - بالمليار", value=550.9, step=10.0, key="g_demand")
+                    X = st.number_input("الصادرات (X) - بالمليار", value=737.4, step=10.0, key="x_demand")
+                    M = st.number_input("الواردات (M) - بالمليار", value=755.6, step=10.0, key="m_demand")
+
+                st.form_submit_button("🧮 احسب PIB")
+
+            NX = X - M
+            PIB_calculated = formulas.gdp_expenditure(C, I, G, X, M)
+
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>📊 الحساب خطوة بخطوة:</h4>
+                <p><b>الخطوة 1:</b> حساب الصادرات الصافية (NX)</p>
+                <p style="margin-right: 20px;">NX = X - M = {X:.2f} - {M:.2f} = <b>{NX:.2f}</b> مليار</p>
+
+                <p><b>الخطوة 2:</b> حساب PIB</p>
+                <p style="margin-right: 20px;">PIB = C + I + G + NX</p>
+                <p style="margin-right: 20px;">PIB = {C:.2f} + {I:.2f} + {G:.2f} + ({NX:.2f})</p>
+                <p style="margin-right: 20px;"><b style="font-size: 24px; color: #2E86AB;">PIB = {PIB_calculated:.2f} مليار</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # رسم بياني
+            st.plotly_chart(cached_figure(demand_components_figure, C, I, G, NX), use_container_width=True)
+
+        demand_calculator()
+
+    with tab3:
+        st.markdown("""
+        ### 3️⃣ طريقة الدخل (Optique des revenus)
+
+        <div class="formula-box">
+            <h4>📐 الصيغة:</h4>
+            <p style="font-size: 18px; text-align: center;">
+                <b>PIB = الأجور + الأرباح + الفوائد + الضرائب + ...</b>
+            </p>
+            <p style="text-align: center;">
+                <b>PIB = Salaires + Profits + Intérêts + Taxes + ...</b>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        #### 📚 من الكتاب:
+
+        حسب هذا المنهج، PIB هو مجموع دخول عوامل الإنتاج المُوزَّعة في الاقتصاد.
+
+        **أشكال الدخول:**
+        - **الأجور:** تعويض عامل الإنتاج "العمل"
+        - **الأرباح:** تعويض عامل الإنتاج "رأس المال"
+        - **الفوائد:** تعويض الادخار المُقرَض للشركة
+        - **الضرائب:** الضرائب غير المباشرة
+        """)
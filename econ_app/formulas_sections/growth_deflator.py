@@ -0,0 +1,172 @@
+"""معدل النمو ومخفض الناتج (الدفلاتور)"""
+import streamlit as st
+
+from econ_app import formulas
+
+
+def render(df):
+    """عرض معدل النمو والدفلاتور"""
+    st.header("📈 معدل النمو والدفلاتور")
+
+    st.subheader("1️⃣ معدل النمو (Taux de croissance)")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 الصيغة الأساسية (من الكتاب - صفحة 30-31):</h4>
+        <p style="font-size: 22px; text-align: center;">
+            <b>g<sub>t</sub> = [(Y<sub>t</sub> - Y<sub>t-1</sub>) / Y<sub>t-1</sub>] × 100</b>
+        </p>
+        <p style="text-align: center;">أو</p>
+        <p style="font-size: 22px; text-align: center;">
+            <b>g<sub>t</sub> = [(Y<sub>t</sub> / Y<sub>t-1</sub>) - 1] × 100</b>
+        </p>
+        <p style="text-align: center;">حيث Y = PIB</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # حاسبة معدل النمو
+    st.subheader("🧮 حاسبة معدل النمو")
+
+    @st.fragment
+    def growth_calculator():
+        col1, col2 = st.columns(2)
+
+        with col1:
+            pib_t1 = st.number_input("PIB السنة السابقة (t-1)", value=2247.2, step=10.0, key="pib_t1")
+            pib_t = st.number_input("PIB السنة الحالية (t)", value=2285.9, step=10.0, key="pib_t")
+
+        growth_rate = formulas.growth_rate(pib_t, pib_t1)
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>الحساب:</h4>
+                <p>g = [(Y<sub>t</sub> - Y<sub>t-1</sub>) / Y<sub>t-1</sub>] × 100</p>
+                <p>g = [({pib_t:.2f} - {pib_t1:.2f}) / {pib_t1:.2f}] × 100</p>
+                <p>g = [{pib_t - pib_t1:.2f} / {pib_t1:.2f}] × 100</p>
+                <p><b style="font-size: 24px; color: #2E86AB;">g = {growth_rate:.2f}%</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # التصنيف
+        if growth_rate > 0:
+            st.success(f"✅ **التوسع (Expansion):** معدل النمو إيجابي ({growth_rate:.2f}%)")
+        elif growth_rate < 0:
+            st.error(f"❌ **الركود (Récession):** معدل النمو سلبي ({growth_rate:.2f}%)")
+        else:
+            st.warning("⚠️ **ركود:** معدل النمو = صفر")
+
+    growth_calculator()
+
+    st.markdown("---")
+
+    # الدفلاتور
+    st.subheader("2️⃣ دفلاتور PIB (Déflateur du PIB)")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 الصيغة (من الكتاب - صفحة 31):</h4>
+        <p style="font-size: 22px; text-align: center;">
+            <b>Déflateur = PIB<sub>nominal</sub> / PIB<sub>réel</sub></b>
+        </p>
+        <p style="text-align: center;">أو</p>
+        <p style="font-size: 20px; text-align: center;">
+            <b>P = Y<sub>n</sub> / Y<sub>r</sub></b>
+        </p>
+        <p style="text-align: center;">حيث:</p>
+        <ul>
+            <li>P = الدفلاتور</li>
+            <li>Y<sub>n</sub> = PIB الاسمي</li>
+            <li>Y<sub>r</sub> = PIB الحقيقي</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="law-box">
+        <h4>📚 العلاقة الأساسية:</h4>
+        <p style="font-size: 20px; text-align: center;">
+            <b>PIB<sub>nominal</sub> = PIB<sub>réel</sub> × Déflateur</b>
+        </p>
+        <p style="font-size: 18px; text-align: center;">
+            <b>Y<sub>n</sub> = Y<sub>r</sub> × P</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # حاسبة الدفلاتور
+    st.subheader("🧮 حاسبة الدفلاتور")
+
+    @st.fragment
+    def deflator_calculator():
+        col1, col2 = st.columns(2)
+
+        with col1:
+            pib_nominal = st.number_input("PIB الاسمي", value=2353.1, step=10.0, key="pib_nom")
+            pib_reel = st.number_input("PIB الحقيقي", value=2285.9, step=10.0, key="pib_reel")
+
+        deflateur = formulas.deflator(pib_nominal, pib_reel)
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>الحساب:</h4>
+                <p>Déflateur = PIB<sub>nominal</sub> / PIB<sub>réel</sub></p>
+                <p>Déflateur = {pib_nominal:.2f} / {pib_reel:.2f}</p>
+                <p><b style="font-size: 24px; color: #2E86AB;">Déflateur = {deflateur:.4f}</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    deflator_calculator()
+
+    # معدل التضخم من الدفلاتور
+    st.subheader("3️⃣ معدل التضخم من الدفلاتور")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 الصيغة (من الكتاب - صفحة 31):</h4>
+        <p style="font-size: 18px; text-align: center;">
+            <b>π ≈ g<sub>nominal</sub> - g<sub>réel</sub></b>
+        </p>
+        <p style="text-align: center;">معدل التضخم ≈ معدل النمو الاسمي - معدل النمو الحقيقي</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="law-box">
+        <h4>📚 الصيغة الدقيقة (من الكتاب):</h4>
+        <p style="font-size: 18px; text-align: center;">
+            <b>g<sub>nominal</sub> = (1 + g<sub>réel</sub>) × (1 + π) - 1</b>
+        </p>
+        <p style="font-size: 18px; text-align: center;">
+            <b>g<sub>nominal</sub> ≈ g<sub>réel</sub> + π + (g<sub>réel</sub> × π)</b>
+        </p>
+        <p style="text-align: center;">
+            عندما تكون قيم g و π صغيرة، يكون حاصل ضربهما قريباً من صفر،
+        </p>
+        <p style="text-align: center;">
+            لذلك: <b>g<sub>nominal</sub> ≈ g<sub>réel</sub> + π</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # مثال من الكتاب
+    st.subheader("📚 مثال من الكتاب (2017-2018)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        **البيانات (من الكتاب):**
+        - معدل نمو PIB الاسمي = 2.5%
+        - معدل نمو PIB الحقيقي = 1.7%
+        """)
+
+    with col2:
+        st.markdown("""
+        **الحساب:**
+
+        π ≈ 2.5% - 1.7% = **0.8%**
+
+        معدل التضخم ≈ **0.8%**
+        """)
@@ -0,0 +1,257 @@
+"""التضخم ومؤشر أسعار الاستهلاك"""
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from econ_app import formulas
+from econ_app.chart_controls import client_mode
+from econ_app.charts import client_slider_figure
+from econ_app.figure_cache import cached_figure
+from econ_app.lookup_grids import (
+    PURCHASING_POWER_YEARS, PURCHASING_POWER_INFLATION, purchasing_power_curve, purchasing_power_grid,
+    slider_values, slider_index
+)
+
+
+def purchasing_power_figure(montant_initial, taux_inflation, annees):
+    """تآكل القوة الشرائية عبر السنوات"""
+    years_list = np.arange(annees + 1)
+    values = formulas.purchasing_power(montant_initial, taux_inflation, years_list)
+
+    fig_pa = go.Figure()
+    fig_pa.add_trace(go.Scatter(
+        x=years_list, y=values,
+        mode='lines+markers',
+        fill='tozeroy',
+        name='القوة الشرائية',
+        line=dict(color='#A23B72', width=3)
+    ))
+
+    fig_pa.update_layout(
+        title=f"تآكل القوة الشرائية بمعدل تضخم {taux_inflation}%",
+        xaxis_title="السنوات",
+        yaxis_title="القوة الشرائية",
+        height=400
+    )
+    return fig_pa
+
+
+def purchasing_power_slider_figure(montant_initial, taux_inflation):
+    """تآكل القوة الشرائية مع منزلق معدل التضخم داخل المتصفح (منحنى محسوب مسبقاً لكل معدل)"""
+    years_list = np.arange(PURCHASING_POWER_YEARS["max_value"] + 1)
+    grid = purchasing_power_grid(montant_initial)
+
+    steps = []
+    for inflation, values in zip(slider_values(PURCHASING_POWER_INFLATION), grid):
+        steps.append((f"{inflation:g}", [go.Scatter(
+            x=years_list, y=values,
+            mode='lines+markers',
+            fill='tozeroy',
+            name='القوة الشرائية',
+            line=dict(color='#A23B72', width=3)
+        )], {"title": f"تآكل القوة الشرائية بمعدل تضخم {inflation:g}% (بعد {years_list[-1]} سنة: {values[-1]:.2f})"}))
+
+    return client_slider_figure(
+        [], steps, slider_index(PURCHASING_POWER_INFLATION, taux_inflation),
+        prefix="معدل التضخم السنوي (%): ",
+        xaxis_title="السنوات",
+        yaxis_title="القوة الشرائية",
+        height=450
+    )
+
+
+def render(df):
+    """عرض التضخم ومؤشر الأسعار"""
+    st.header("💹 التضخم ومؤشر أسعار المستهلك (IPC)")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>📖 التعريف</h3>
+        <p><b>التضخم (Inflation):</b> الارتفاع المستمر والعام في مستوى الأسعار</p>
+        <p><b>مؤشر أسعار المستهلك (IPC - Indice des Prix à la Consommation):</b> 
+        يقيس التطور الزمني لمستوى أسعار سلة من السلع والخدمات المستهلكة</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("1️⃣ حساب مؤشر أسعار المستهلك (IPC)")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 صيغة IPC:</h4>
+        <p style="font-size: 20px; text-align: center;">
+            <b>IPC<sub>t</sub> = [Σ(P<sub>t</sub> × Q<sub>base</sub>) / Σ(P<sub>base</sub> × Q<sub>base</sub>)] × 100</b>
+        </p>
+        <p style="text-align: center;">حيث:</p>
+        <ul>
+            <li>P<sub>t</sub> = أسعار السنة الحالية</li>
+            <li>P<sub>base</sub> = أسعار سنة الأساس</li>
+            <li>Q<sub>base</sub> = كميات سنة الأساس (السلة الثابتة)</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("🧮 حاسبة IPC - مثال تطبيقي")
+
+    st.markdown("""
+    <div class="example-box">
+        <p>لنفترض سلة استهلاكية تحتوي على 3 منتجات:</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    @st.fragment
+    def ipc_calculator():
+        # البيانات
+        with st.form("ipc_form"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("**أسعار وكميات سنة الأساس (2020):**")
+                q1_base = st.number_input("كمية الخبز", value=100.0, key="q1_base")
+                p1_base = st.number_input("سعر الخبز", value=1.0, key="p1_base")
+
+                q2_base = st.number_input("كمية الحليب", value=50.0, key="q2_base")
+                p2_base = st.number_input("سعر الحليب", value=2.0, key="p2_base")
+
+                q3_base = st.number_input("كمية اللحم", value=20.0, key="q3_base")
+                p3_base = st.number_input("سعر اللحم", value=10.0, key="p3_base")
+
+            with col2:
+                st.markdown("**أسعار السنة الحالية (2023):**")
+                st.write("")  # spacing
+                st.write("")
+                p1_current = st.number_input("سعر الخبز الحالي", value=1.2, key="p1_current")
+                st.write("")
+                st.write("")
+                p2_current = st.number_input("سعر الحليب الحالي", value=2.5, key="p2_current")
+                st.write("")
+                st.write("")
+                p3_current = st.number_input("سعر اللحم الحالي", value=12.0, key="p3_current")
+
+            st.form_submit_button("🧮 احسب IPC")
+
+        # الحسابات
+        cost_base = (q1_base * p1_base) + (q2_base * p2_base) + (q3_base * p3_base)
+        cost_current = (q1_base * p1_current) + (q2_base * p2_current) + (q3_base * p3_current)
+        ipc = formulas.cpi_laspeyres(
+            [p1_current, p2_current, p3_current],
+            [p1_base, p2_base, p3_base],
+            [q1_base, q2_base, q3_base]
+        )
+
+        st.markdown(f"""
+        <div class="calculation-step">
+            <h4>الحساب خطوة بخطوة:</h4>
+
+            <p><b>الخطوة 1: تكلفة السلة في سنة الأساس</b></p>
+            <p>= ({q1_base} × {p1_base}) + ({q2_base} × {p2_base}) + ({q3_base} × {p3_base})</p>
+            <p>= {q1_base * p1_base} + {q2_base * p2_base} + {q3_base * p3_base}</p>
+            <p>= <b>{cost_base:.2f}</b></p>
+
+            <p><b>الخطوة 2: تكلفة نفس السلة بالأسعار الحالية</b></p>
+            <p>= ({q1_base} × {p1_current}) + ({q2_base} × {p2_current}) + ({q3_base} × {p3_current})</p>
+            <p>= {q1_base * p1_current} + {q2_base * p2_current} + {q3_base * p3_current}</p>
+            <p>= <b>{cost_current:.2f}</b></p>
+
+            <p><b>الخطوة 3: حساب IPC</b></p>
+            <p>IPC = ({cost_current:.2f} / {cost_base:.2f}) × 100</p>
+            <p><b style="font-size: 24px; color: #2E86AB;">IPC = {ipc:.2f}</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        st.subheader("2️⃣ حساب معدل التضخم")
+
+        st.markdown("""
+        <div class="formula-box">
+            <h4>📐 صيغة معدل التضخم:</h4>
+            <p style="font-size: 20px; text-align: center;">
+                <b>π<sub>t</sub> = [(IPC<sub>t</sub> - IPC<sub>t-1</sub>) / IPC<sub>t-1</sub>] × 100</b>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            ipc_t1 = st.number_input("IPC السنة السابقة", value=100.0, key="ipc_t1")
+            ipc_t = st.number_input("IPC السنة الحالية", value=ipc, key="ipc_t")
+
+        inflation_rate = formulas.inflation_rate(ipc_t, ipc_t1)
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>حساب معدل التضخم:</h4>
+                <p>π = [({ipc_t:.2f} - {ipc_t1:.2f}) / {ipc_t1:.2f}] × 100</p>
+                <p><b style="font-size: 24px; color: #A23B72;">π = {inflation_rate:.2f}%</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # تصنيف التضخم
+        if inflation_rate < 3:
+            st.success(f"✅ **تضخم زاحف (معتدل):** {inflation_rate:.2f}% < 3%")
+        elif 3 <= inflation_rate < 10:
+            st.warning(f"⚠️ **تضخم معتدل:** 3% ≤ {inflation_rate:.2f}% < 10%")
+        elif 10 <= inflation_rate < 50:
+            st.error(f"❌ **تضخم جامح:** 10% ≤ {inflation_rate:.2f}% < 50%")
+        else:
+            st.error(f"🔥 **تضخم مفرط:** {inflation_rate:.2f}% ≥ 50%")
+
+    ipc_calculator()
+
+    st.markdown("---")
+
+    st.subheader("3️⃣ القوة الشرائية (Pouvoir d'achat)")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 صيغة القوة الشرائية:</h4>
+        <p style="font-size: 20px; text-align: center;">
+            <b>PA<sub>t</sub> = Revenu<sub>nominal</sub> / (1 + π)<sup>n</sup></b>
+        </p>
+        <p style="text-align: center;">حيث:</p>
+        <ul>
+            <li>PA = القوة الشرائية</li>
+            <li>π = معدل التضخم السنوي</li>
+            <li>n = عدد السنوات</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("🧮 حاسبة القوة الشرائية")
+
+    @st.fragment
+    def purchasing_power_calculator():
+        client = client_mode("pa_client")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            montant_initial = st.number_input("المبلغ الأولي", value=1000.0, step=100.0, key="montant_pa")
+            taux_inflation = st.number_input("معدل التضخم السنوي (%)", value=3.0, step=0.5, key="taux_inf_pa")
+            annees = st.slider("عدد السنوات", value=10, key="annees_pa", **PURCHASING_POWER_YEARS)
+
+        # منحنى كل السنوات يُحسب مرة لكل مبلغ ومعدل تضخم، وتحريك منزلق السنوات قراءة بالفهرس
+        pa_finale = purchasing_power_curve(montant_initial, taux_inflation)[annees]
+        perte = ((montant_initial - pa_finale) / montant_initial) * 100
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>الحساب:</h4>
+                <p>PA = {montant_initial:.2f} / (1 + {taux_inflation/100:.3f})<sup>{annees}</sup></p>
+                <p>PA = {montant_initial:.2f} / {(1 + taux_inflation/100) ** annees:.4f}</p>
+                <p><b style="font-size: 20px; color: #A23B72;">PA = {pa_finale:.2f}</b></p>
+                <p style="margin-top: 15px;"><b>نسبة الفقدان:</b> {perte:.2f}%</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # رسم بياني
+        if client:
+            # منحنيات كل معدلات التضخم مضمنة في الرسم، وتحريك منزلقه لا يمر بالخادم
+            fig_pa = cached_figure(purchasing_power_slider_figure, montant_initial, taux_inflation)
+        else:
+            fig_pa = cached_figure(purchasing_power_figure, montant_initial, taux_inflation, annees)
+        st.plotly_chart(fig_pa, use_container_width=True)
+
+    purchasing_power_calculator()
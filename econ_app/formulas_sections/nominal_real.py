@@ -0,0 +1,153 @@
+"""PIB الاسمي والحقيقي"""
+import streamlit as st
+import pandas as pd
+
+
+def render(df):
+    """عرض PIB الاسمي والحقيقي"""
+    st.header("📊 PIB الاسمي والحقيقي")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>📖 من الكتاب (صفحة 29-30)</h3>
+        <p>في 2018، PIB الاسمي لفرنسا = 2353.1 مليار يورو</p>
+        <p>في 1960، PIB الاسمي لفرنسا = 46.8 مليار يورو</p>
+        <p><b>السؤال:</b> هل الإنتاج تضاعف 50.3 مرة؟</p>
+        <p><b>الجواب:</b> لا! لأن PIB الاسمي يتأثر بارتفاع الأسعار.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="formula-box">
+            <h4>📐 PIB الاسمي (PIB nominal)</h4>
+            <p><b>PIB en valeur / en euros courants</b></p>
+            <p style="font-size: 18px;">PIB<sub>nominal</sub> = Σ (Q<sub>t</sub> × P<sub>t</sub>)</p>
+            <p>حيث:</p>
+            <ul>
+                <li>Q<sub>t</sub> = الكميات في السنة t</li>
+                <li>P<sub>t</sub> = الأسعار الجارية في السنة t</li>
+            </ul>
+            <p><b>يتأثر بـ:</b></p>
+            <ul>
+                <li>✓ تغير الكميات</li>
+                <li>✓ تغير الأسعار (التضخم)</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="formula-box">
+            <h4>📐 PIB الحقيقي (PIB réel)</h4>
+            <p><b>PIB en volume / en euros constants</b></p>
+            <p style="font-size: 18px;">PIB<sub>réel</sub> = Σ (Q<sub>t</sub> × P<sub>base</sub>)</p>
+            <p>حيث:</p>
+            <ul>
+                <li>Q<sub>t</sub> = الكميات في السنة t</li>
+                <li>P<sub>base</sub> = أسعار سنة الأساس (ثابتة)</li>
+            </ul>
+            <p><b>يتأثر بـ:</b></p>
+            <ul>
+                <li>✓ تغير الكميات فقط</li>
+                <li>✗ لا يتأثر بالتضخم</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # مثال من الكتاب: اقتصاد بسلعة واحدة
+    st.subheader("📚 مثال: اقتصاد ينتج الحواسيب فقط (Tableau 1.6 من الكتاب)")
+
+    st.markdown("""
+    <div class="example-box">
+        <p>لنفترض أن الاقتصاد ينتج فقط الحواسيب، والبيانات كالتالي:</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # البيانات
+    data_computers = {
+        'السنة': ['السنة 1', 'السنة 2', 'السنة 3'],
+        'الكمية (Q)': [50000, 55000, 58000],
+        'السعر (P)': [100, 120, 150]
+    }
+
+    df_comp = pd.DataFrame(data_computers)
+    st.table(df_comp)
+
+    # الحسابات
+    st.subheader("🔢 الحسابات خطوة بخطوة")
+
+    tab1, tab2 = st.tabs(["PIB الاسمي", "PIB الحقيقي"])
+
+    with tab1:
+        st.markdown("""
+        ### حساب PIB الاسمي (بالأسعار الجارية)
+        """)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>السنة 1:</h4>
+            <p>PIB<sub>nominal</sub> = Q × P = 50,000 × 100 = <b>5,000,000</b></p>
+        </div>
+
+        <div class="calculation-step">
+            <h4>السنة 2:</h4>
+            <p>PIB<sub>nominal</sub> = Q × P = 55,000 × 120 = <b>6,600,000</b></p>
+            <p>معدل النمو = [(6,600,000 - 5,000,000) / 5,000,000] × 100 = <b>32.0%</b></p>
+        </div>
+
+        <div class="calculation-step">
+            <h4>السنة 3:</h4>
+            <p>PIB<sub>nominal</sub> = Q × P = 58,000 × 150 = <b>8,700,000</b></p>
+            <p>معدل النمو = [(8,700,000 - 6,600,000) / 6,600,000] × 100 = <b>31.8%</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown("""
+        ### حساب PIB الحقيقي (سنة الأساس: السنة 1)
+        """)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>السنة 1:</h4>
+            <p>PIB<sub>réel</sub> = Q<sub>1</sub> × P<sub>1</sub> = 50,000 × 100 = <b>5,000,000</b></p>
+            <p>ملاحظة: PIB الاسمي = PIB الحقيقي في سنة الأساس</p>
+        </div>
+
+        <div class="calculation-step">
+            <h4>السنة 2:</h4>
+            <p>PIB<sub>réel</sub> = Q<sub>2</sub> × P<sub>1</sub> = 55,000 × 100 = <b>5,500,000</b></p>
+            <p>معدل النمو الحقيقي = [(5,500,000 - 5,000,000) / 5,000,000] × 100 = <b>10.0%</b></p>
+        </div>
+
+        <div class="calculation-step">
+            <h4>السنة 3:</h4>
+            <p>PIB<sub>réel</sub> = Q<sub>3</sub> × P<sub>1</sub> = 58,000 × 100 = <b>5,800,000</b></p>
+            <p>معدل النمو الحقيقي = [(5,800,000 - 5,500,000) / 5,500,000] × 100 = <b>5.5%</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # جدول ملخص
+    summary_pib = pd.DataFrame({
+        'السنة': ['السنة 1', 'السنة 2', 'السنة 3'],
+        'الكمية': [50000, 55000, 58000],
+        'السعر': [100, 120, 150],
+        'PIB الاسمي': [5000000, 6600000, 8700000],
+        'PIB الحقيقي (أساس: سنة 1)': [5000000, 5500000, 5800000],
+        'نمو اسمي (%)': ['-', 32.0, 31.8],
+        'نمو حقيقي (%)': ['-', 10.0, 5.5]
+    })
+
+    st.subheader("📊 جدول ملخص (Tableau 1.7 من الكتاب)")
+    st.table(summary_pib)
+
+    st.success("""
+    ✅ **الاستنتاج الرئيسي:**
+
+    - النمو الاسمي (32%) > النمو الحقيقي (10%)
+    - الفرق يعود إلى ارتفاع الأسعار (التضخم)
+    - PIB الحقيقي يعكس النمو الفعلي للإنتاج
+    """)
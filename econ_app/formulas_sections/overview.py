@@ -0,0 +1,56 @@
+"""نظرة عامة على الصيغ الأساسية في الاقتصاد الكلي"""
+import streamlit as st
+
+
+def render(df):
+    """عرض الصفحة الرئيسية"""
+    st.header("📚 المؤشرات الاقتصادية الكلية - القوانين والصيغ")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>🎯 هذا التطبيق يعرض:</h3>
+        <ul>
+            <li>جميع الصيغ الرياضية لحساب المؤشرات الاقتصادية</li>
+            <li>الأمثلة العددية الواردة في الكتاب</li>
+            <li>شرح تفصيلي خطوة بخطوة للحسابات</li>
+            <li>حاسبات تفاعلية لتطبيق القوانين</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        ### 📊 المؤشرات الرئيسية:
+
+        **1. الناتج المحلي الإجمالي (PIB)**
+        - طريقة الإنتاج (القيم المضافة)
+        - طريقة الطلب (السلع النهائية)
+        - طريقة الدخل (الأجور والأرباح)
+
+        **2. معدل النمو الاقتصادي**
+        - الصيغة الأساسية
+        - التوسع والركود
+
+        **3. الدفلاتور (Déflateur)**
+        - PIB الاسمي / PIB الحقيقي
+        - قياس التضخم
+        """)
+
+    with col2:
+        st.markdown("""
+        ### 📐 القوانين الأساسية:
+
+        **4. مؤشر أسعار المستهلك (IPC)**
+        - حساب التضخم
+        - القوة الشرائية
+
+        **5. البطالة**
+        - معدل البطالة
+        - معدل المشاركة
+        - معدل التشغيل
+
+        **6. قاعدة 70**
+        - سنوات المضاعفة
+        """)
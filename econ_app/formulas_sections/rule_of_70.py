@@ -0,0 +1,258 @@
+"""قاعدة 70 وزمن تضاعف الناتج"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from econ_app import formulas
+from econ_app.chart_controls import client_mode
+from econ_app.charts import client_slider_figure
+from econ_app.figure_cache import cached_figure
+from econ_app.lookup_grids import (
+    RULE_OF_70_GROWTH, doubling_time_grid, doubling_time_lookup, slider_values, slider_index
+)
+from econ_app.downsample import downsample_positions
+
+
+def rule_of_70_figure(growth_rates):
+    """العلاقة بين معدل النمو وسنوات المضاعفة"""
+    doubling_times = formulas.doubling_time(growth_rates)
+
+    fig_70 = go.Figure()
+
+    fig_70.add_trace(go.Scatter(
+        x=growth_rates,
+        y=doubling_times,
+        mode='lines+markers',
+        name='قاعدة 70',
+        line=dict(color='#2E86AB', width=3),
+        marker=dict(size=10)
+    ))
+
+    fig_70.update_layout(
+        title="العلاقة بين معدل النمو وسنوات المضاعفة",
+        xaxis_title="معدل النمو السنوي (%)",
+        yaxis_title="عدد السنوات للمضاعفة",
+        height=500,
+        template='plotly_white'
+    )
+    return fig_70
+
+
+def rule_of_70_slider_figure(growth_rate):
+    """منحنى قاعدة 70 مع منزلق معدل النمو داخل المتصفح (سنوات المضاعفة لكل قيمة محسوبة مسبقاً)"""
+    growth_values = slider_values(RULE_OF_70_GROWTH)
+    doubling_times = doubling_time_grid()
+
+    curve = go.Scatter(
+        x=growth_values,
+        y=doubling_times,
+        mode='lines',
+        name='قاعدة 70',
+        line=dict(color='#2E86AB', width=3)
+    )
+
+    steps = []
+    for growth, years in zip(growth_values, doubling_times):
+        steps.append((f"{growth:g}", [go.Scatter(
+            x=[growth], y=[years],
+            mode='markers+text',
+            name='المعدل المختار',
+            marker=dict(size=14, color='#A23B72'),
+            text=[f"n ≈ {years:.1f} سنة"],
+            textposition="top right"
+        )], {"title": f"بمعدل نمو {growth:g}% سنوياً يتضاعف PIB في حوالي {years:.1f} سنة"}))
+
+    return client_slider_figure(
+        [curve], steps, slider_index(RULE_OF_70_GROWTH, growth_rate),
+        prefix="معدل النمو السنوي (%): ",
+        xaxis_title="معدل النمو السنوي (%)",
+        yaxis_title="عدد السنوات للمضاعفة",
+        height=500,
+        template='plotly_white'
+    )
+
+
+def doubling_figure(pib_initial, growth_rate):
+    """تطور PIB حتى ما بعد المضاعفة بمعدل نمو ثابت"""
+    years_double = formulas.doubling_time(growth_rate)
+    pib_final = pib_initial * 2
+
+    # محاكاة التطور (المعدلات الصغيرة جداً تعطي آلاف السنوات فتُقلَّص إلى عرض الرسم)
+    years_simulation = int(years_double * 2)
+    years_list = np.arange(years_simulation + 1)
+    pib_values = pib_initial * (1 + growth_rate/100) ** years_list
+
+    positions = downsample_positions(years_list, pib_values)
+    years_list, pib_values = years_list[positions], pib_values[positions]
+
+    fig_sim = go.Figure()
+
+    fig_sim.add_trace(go.Scatter(
+        x=years_list,
+        y=pib_values,
+        mode='lines+markers',
+        name='PIB',
+        line=dict(color='#2E86AB', width=3)
+    ))
+
+    # خط المضاعفة
+    fig_sim.add_hline(
+        y=pib_final,
+        line_dash="dash",
+        line_color="red",
+        annotation_text=f"المضاعفة ({pib_final:.0f})"
+    )
+
+    # نقطة المضاعفة
+    fig_sim.add_vline(
+        x=years_double,
+        line_dash="dash",
+        line_color="green",
+        annotation_text=f"{years_double:.1f} سنة"
+    )
+
+    fig_sim.update_layout(
+        title=f"تطور PIB بمعدل نمو {growth_rate}%",
+        xaxis_title="السنوات",
+        yaxis_title="PIB (مليار)",
+        height=500
+    )
+    return fig_sim
+
+
+def render(df):
+    """عرض قاعدة 70"""
+    st.header("🔢 قاعدة 70 - حساب سنوات المضاعفة")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>📖 قاعدة 70 (Règle de 70)</h3>
+        <p>قاعدة تقريبية لحساب عدد السنوات اللازمة لمضاعفة قيمة متغير ينمو بمعدل ثابت.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 الصيغة:</h4>
+        <p style="font-size: 24px; text-align: center;">
+            <b>عدد سنوات المضاعفة ≈ 70 / معدل النمو السنوي</b>
+        </p>
+        <p style="font-size: 22px; text-align: center;">
+            <b>n ≈ 70 / g</b>
+        </p>
+        <p style="text-align: center;">حيث:</p>
+        <ul>
+            <li>n = عدد السنوات للمضاعفة</li>
+            <li>g = معدل النمو السنوي (%)</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("🧮 حاسبة قاعدة 70")
+
+    @st.fragment
+    def rule_of_70_calculator():
+        if client_mode("growth_70_client"):
+            # كل قيم المنزلق مضمنة في الرسم، فالتحريك يتم في المتصفح دون إعادة تشغيل. منزلق الخادم
+            # غير معروض هنا فيحذف Streamlit حالته: آخر قيمة محفوظة في مفتاح عادي growth_70_value
+            st.plotly_chart(
+                cached_figure(rule_of_70_slider_figure, st.session_state.get("growth_70_value", 3.0)),
+                use_container_width=True
+            )
+            return
+
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            # القيمة الابتدائية من growth_70_value تعيد المنزلق إلى آخر قيمة بعد الرجوع من وضع المتصفح
+            growth_rate_70 = st.slider(
+                "معدل النمو السنوي (%)",
+                value=st.session_state.get("growth_70_value", 3.0),
+                key="growth_70",
+                **RULE_OF_70_GROWTH
+            )
+            st.session_state["growth_70_value"] = growth_rate_70
+
+        years_to_double = doubling_time_lookup(growth_rate_70)
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>الحساب:</h4>
+                <p style="font-size: 20px;">n = 70 / {growth_rate_70}</p>
+                <p><b style="font-size: 28px; color: #2E86AB;">n ≈ {years_to_double:.1f} سنة</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.info(f"""
+        📊 **التفسير:**
+
+        بمعدل نمو **{growth_rate_70}%** سنوياً، سيتضاعف PIB في حوالي **{years_to_double:.1f} سنة**.
+
+        **مثال:** إذا كان PIB الحالي 100 مليار، سيصبح 200 مليار بعد {years_to_double:.1f} سنة.
+        """)
+
+    rule_of_70_calculator()
+
+    st.markdown("---")
+
+    # أمثلة مقارنة
+    st.subheader("📊 مقارنة معدلات النمو المختلفة")
+
+    growth_rates = [1, 2, 3, 4, 5, 7, 10]
+    doubling_times = formulas.doubling_time(growth_rates)
+
+    comparison_df = pd.DataFrame({
+        'معدل النمو (%)': growth_rates,
+        'سنوات المضاعفة': [f"{dt:.1f}" for dt in doubling_times]
+    })
+
+    st.table(comparison_df)
+
+    # رسم بياني
+    st.plotly_chart(cached_figure(rule_of_70_figure, growth_rates), use_container_width=True)
+
+    st.markdown("""
+    <div class="law-box">
+        <h4>📚 ملاحظات مهمة:</h4>
+        <ul>
+            <li>قاعدة 70 هي قاعدة تقريبية، وليست دقيقة 100%</li>
+            <li>تعمل بشكل جيد للمعدلات بين 1% و 10%</li>
+            <li>يمكن استخدامها لأي متغير ينمو بمعدل ثابت (PIB، السكان، الاستثمار، ...)</li>
+            <li>بدائل: قاعدة 69.3 (أكثر دقة) أو قاعدة 72 (أسهل للحساب)</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # تطبيق عملي
+    st.subheader("💡 تطبيق عملي: مضاعفة PIB")
+
+    @st.fragment
+    def doubling_simulation():
+        col1, col2 = st.columns(2)
+
+        with col1:
+            pib_initial_70 = st.number_input("PIB الأولي (مليار)", value=100.0, step=10.0, key="pib_init_70")
+            growth_application = st.number_input("معدل النمو (%)", value=3.0, step=0.5, key="growth_app")
+
+        years_double_app = formulas.doubling_time(growth_application)
+        pib_final_70 = pib_initial_70 * 2
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>النتيجة:</h4>
+                <p>عدد السنوات = 70 / {growth_application} ≈ <b>{years_double_app:.1f} سنة</b></p>
+                <p style="margin-top: 15px;">PIB سيتطور من:</p>
+                <p><b>{pib_initial_70:.2f} مليار</b> → <b>{pib_final_70:.2f} مليار</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # محاكاة التطور
+        st.plotly_chart(
+            cached_figure(doubling_figure, pib_initial_70, growth_application),
+            use_container_width=True
+        )
+
+    doubling_simulation()
@@ -0,0 +1,176 @@
+"""مثال الصناعتين من الكتاب"""
+import streamlit as st
+import pandas as pd
+
+
+def render(df):
+    """عرض مثال الصناعتين"""
+    st.header("📐 مثال الصناعتين: الحديد والصلب والسيارات")
+
+    st.markdown("""
+    <div class="example-box">
+        <h3>📖 المثال من الكتاب (صفحة 26-29)</h3>
+        <p>لنفترض وجود صناعتين في الاقتصاد:</p>
+        <ul>
+            <li><b>الصناعة المعدنية (Métallurgique):</b> تنتج الفولاذ</li>
+            <li><b>الصناعة السيارات (Automobile):</b> تنتج السيارات</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # البيانات من الكتاب
+    st.subheader("📊 البيانات الأساسية (بملايين اليورو)")
+
+    data_industries = {
+        'البيان': ['الإنتاج (Production)', 'الاستهلاكات الوسيطة (CI)', 
+                   'الأجور (Salaires)', 'الفوائد (Intérêts)', 
+                   'التكاليف الكلية', 'الأرباح (Profit)'],
+        'الصناعة المعدنية': [1000, 0, 100, 30, 130, 870],
+        'صناعة السيارات': [2000, 1000, 400, 10, 1410, 590]
+    }
+
+    df_industries = pd.DataFrame(data_industries)
+    st.table(df_industries)
+
+    st.markdown("""
+    <div class="info-box">
+        <h4>📝 ملاحظات:</h4>
+        <ul>
+            <li>الصناعة المعدنية تستخرج الحديد بنفسها (CI = 0)</li>
+            <li>الصناعة المعدنية تبيع الفولاذ لصناعة السيارات بـ 1000 مليون يورو</li>
+            <li>صناعة السيارات تبيع السيارات بـ 2000 مليون يورو</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # الحسابات
+    st.subheader("🔢 الحسابات التفصيلية")
+
+    tab1, tab2, tab3 = st.tabs(["طريقة الإنتاج", "طريقة الطلب", "طريقة الدخل"])
+
+    with tab1:
+        st.markdown("""
+        ### 1️⃣ حساب PIB بطريقة الإنتاج (القيم المضافة)
+        """)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>الخطوة 1: حساب القيمة المضافة للصناعة المعدنية</h4>
+            <p style="font-size: 18px;">VA<sub>MET</sub> = P<sub>MET</sub> - CI<sub>MET</sub></p>
+            <p style="font-size: 18px;">VA<sub>MET</sub> = 1000 - 0 = <b>1000 مليون يورو</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>الخطوة 2: حساب القيمة المضافة لصناعة السيارات</h4>
+            <p style="font-size: 18px;">VA<sub>AUT</sub> = P<sub>AUT</sub> - CI<sub>AUT</sub></p>
+            <p style="font-size: 18px;">VA<sub>AUT</sub> = 2000 - 1000 = <b>1000 مليون يورو</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>الخطوة 3: حساب PIB</h4>
+            <p style="font-size: 18px;">PIB = VA<sub>MET</sub> + VA<sub>AUT</sub></p>
+            <p style="font-size: 18px;">PIB = 1000 + 1000 = <b style="color: #2E86AB; font-size: 24px;">2000 مليون يورو</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.warning("""
+        ⚠️ **ملاحظة مهمة من الكتاب:**
+
+        مجموع المبيعات = 1000 + 2000 = 3000 مليون يورو
+
+        لكن PIB ≠ 3000 !
+
+        لماذا؟ لأن 3000 تتضمن حساباً مزدوجاً للفولاذ. لهذا نستخدم القيم المضافة.
+        """)
+
+        # جدول ملخص
+        summary_production = pd.DataFrame({
+            'الصناعة': ['المعدنية', 'السيارات', 'المجموع'],
+            'الإنتاج': [1000, 2000, 3000],
+            'الاستهلاكات الوسيطة': [0, 1000, 1000],
+            'القيمة المضافة': [1000, 1000, 2000]
+        })
+
+        st.subheader("📊 جدول ملخص (Tableau 1.3 من الكتاب)")
+        st.table(summary_production)
+
+    with tab2:
+        st.markdown("""
+        ### 2️⃣ حساب PIB بطريقة الطلب (السلع النهائية)
+        """)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>التحليل:</h4>
+            <p>لدينا عمليتا بيع:</p>
+            <ol>
+                <li>بيع الفولاذ من الصناعة المعدنية لصناعة السيارات (1000 مليون)</li>
+                <li>بيع السيارات من صناعة السيارات للمستهلك (2000 مليون)</li>
+            </ol>
+
+            <p><b>السؤال:</b> أي عملية بيع نحسبها؟</p>
+
+            <p><b>الجواب:</b> فقط بيع السلع النهائية (السيارات)!</p>
+
+            <p style="font-size: 20px; margin-top: 20px;">
+                <b>PIB = 2000 مليون يورو</b>
+            </p>
+
+            <p>الفولاذ هو <b>سلعة وسيطة</b> (bien intermédiaire) لا تُحسب في PIB بهذه الطريقة.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with tab3:
+        st.markdown("""
+        ### 3️⃣ حساب PIB بطريقة الدخل
+        """)
+
+        st.markdown("""
+        <div class="calculation-step">
+            <h4>نجمع جميع الدخول المُوزَّعة:</h4>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # حساب كل صناعة
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            **الصناعة المعدنية:**
+            - الأجور: 100
+            - الفوائد: 30
+            - الأرباح: 870
+            - **المجموع: 1000**
+            """)
+
+        with col2:
+            st.markdown("""
+            **صناعة السيارات:**
+            - الأجور: 400
+            - الفوائد: 10
+            - الأرباح: 590
+            - **المجموع: 1000**
+            """)
+
+        # جدول ملخص
+        summary_income = pd.DataFrame({
+            'نوع الدخل': ['الأجور', 'الفوائد', 'الأرباح', 'المجموع'],
+            'الصناعة المعدنية': [100, 30, 870, 1000],
+            'صناعة السيارات': [400, 10, 590, 1000],
+            'المجموع': [500, 40, 1460, 2000]
+        })
+
+        st.subheader("📊 جدول الدخول (Tableau 1.4 من الكتاب)")
+        st.table(summary_income)
+
+        st.success("""
+        ✅ **النتيجة النهائية:**
+
+        PIB = 500 + 40 + 1460 = **2000 مليون يورو**
+
+        **الطرق الثلاث تعطي نفس النتيجة!**
+        """)
@@ -0,0 +1,165 @@
+"""البطالة ومعدل المشاركة"""
+import streamlit as st
+import plotly.graph_objects as go
+
+from econ_app import formulas
+from econ_app.figure_cache import cached_figure
+
+
+def employment_figure(employes, chomeurs, inactifs):
+    """توزيع السكان حسب حالة التشغيل"""
+    fig_emploi = go.Figure(data=[
+        go.Bar(name='العاملون', x=['السكان'], y=[employes], marker_color='#4CAF50'),
+        go.Bar(name='العاطلون', x=['السكان'], y=[chomeurs], marker_color='#F18F01'),
+        go.Bar(name='خارج القوى العاملة', x=['السكان'], y=[inactifs], marker_color='#9E9E9E')
+    ])
+
+    fig_emploi.update_layout(
+        barmode='stack',
+        title='توزيع السكان حسب حالة التشغيل',
+        yaxis_title='عدد السكان (مليون)',
+        height=400
+    )
+    return fig_emploi
+
+
+def render(df):
+    """عرض البطالة"""
+    st.header("👥 البطالة ومعدل المشاركة")
+
+    st.markdown("""
+    <div class="info-box">
+        <h3>📖 التعريف حسب BIT (من الكتاب - صفحة 41-42)</h3>
+        <p><b>العاطل عن العمل (Chômeur):</b> شخص في سن العمل (15 سنة فأكثر) يستوفي ثلاثة شروط:</p>
+        <ol>
+            <li>بدون عمل (لم يعمل حتى ساعة واحدة في الأسبوع المرجعي)</li>
+            <li>متاح للعمل خلال 15 يوماً</li>
+            <li>يبحث بنشاط عن عمل</li>
+        </ol>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("1️⃣ معدل البطالة (Taux de chômage)")
+
+    st.markdown("""
+    <div class="formula-box">
+        <h4>📐 الصيغة (من الكتاب - صفحة 42):</h4>
+        <p style="font-size: 22px; text-align: center;">
+            <b>u = (Nombre de chômeurs / Population active totale) × 100</b>
+        </p>
+        <p style="font-size: 20px; text-align: center;">
+            <b>معدل البطالة = (عدد العاطلين / القوى العاملة الكلية) × 100</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="law-box">
+        <h4>📚 تعريف القوى العاملة:</h4>
+        <p style="font-size: 18px; text-align: center;">
+            <b>Population active = Nombre de chômeurs + Nombre d'employés</b>
+        </p>
+        <p style="font-size: 18px; text-align: center;">
+            <b>القوى العاملة = عدد العاطلين + عدد العاملين</b>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("🧮 حاسبة معدل البطالة")
+
+    @st.fragment
+    def unemployment_calculator():
+        col1, col2 = st.columns(2)
+
+        with col1:
+            employes = st.number_input("عدد العاملين (بالمليون)", value=25.0, step=0.5, key="employes")
+            chomeurs = st.number_input("عدد العاطلين (بالمليون)", value=2.5, step=0.1, key="chomeurs")
+            population_totale = st.number_input("إجمالي السكان (بالمليون)", value=40.0, step=1.0, key="pop_totale")
+
+        population_active = employes + chomeurs
+        taux_chomage = formulas.unemployment_rate(chomeurs, employes)
+
+        with col2:
+            st.markdown(f"""
+            <div class="calculation-step">
+                <h4>الحساب خطوة بخطوة:</h4>
+
+                <p><b>الخطوة 1: القوى العاملة</b></p>
+                <p>Population active = {employes:.2f} + {chomeurs:.2f}</p>
+                <p>= <b>{population_active:.2f} مليون</b></p>
+
+                <p><b>الخطوة 2: معدل البطالة</b></p>
+                <p>u = ({chomeurs:.2f} / {population_active:.2f}) × 100</p>
+                <p><b style="font-size: 24px; color: #F18F01;">u = {taux_chomage:.2f}%</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        st.subheader("2️⃣ معدل المشاركة / النشاط (Taux de participation)")
+
+        st.markdown("""
+        <div class="formula-box">
+            <h4>📐 الصيغة (من الكتاب - صفحة 42):</h4>
+            <p style="font-size: 20px; text-align: center;">
+                <b>Taux de participation = (Population active / Population en âge de travailler) × 100</b>
+            </p>
+            <p style="font-size: 18px; text-align: center;">
+                <b>معدل المشاركة = (القوى العاملة / السكان في سن العمل) × 100</b>
+            </p>
+            <p style="text-align: center;">السكان في سن العمل = 15-64 سنة</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        taux_participation = formulas.participation_rate(population_active, population_totale)
+
+        st.markdown(f"""
+        <div class="calculation-step">
+            <h4>حساب معدل المشاركة:</h4>
+            <p>Taux de participation = ({population_active:.2f} / {population_totale:.2f}) × 100</p>
+            <p><b style="font-size: 24px; color: #2E86AB;">= {taux_participation:.2f}%</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        st.subheader("3️⃣ معدل التشغيل (Taux d'emploi)")
+
+        st.markdown("""
+        <div class="formula-box">
+            <h4>📐 الصيغة:</h4>
+            <p style="font-size: 20px; text-align: center;">
+                <b>Taux d'emploi = (Nombre d'employés / Population en âge de travailler) × 100</b>
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        taux_emploi = formulas.employment_rate(employes, population_totale)
+
+        st.markdown(f"""
+        <div class="calculation-step">
+            <h4>حساب معدل التشغيل:</h4>
+            <p>Taux d'emploi = ({employes:.2f} / {population_totale:.2f}) × 100</p>
+            <p><b style="font-size: 24px; color: #4CAF50;">= {taux_emploi:.2f}%</b></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # ملخص جميع المؤشرات
+        st.subheader("📊 ملخص المؤشرات")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("معدل البطالة", f"{taux_chomage:.2f}%")
+        with col2:
+            st.metric("معدل المشاركة", f"{taux_participation:.2f}%")
+        with col3:
+            st.metric("معدل التشغيل", f"{taux_emploi:.2f}%")
+
+        # رسم بياني توضيحي
+        st.plotly_chart(
+            cached_figure(employment_figure, employes, chomeurs, population_totale - population_active),
+            use_container_width=True
+        )
+
+    unemployment_calculator()
@@ -0,0 +1,363 @@
+"""مجمع عمليات مشترك للتحليلات الثقيلة: مهام قابلة للإلغاء، تقدم يغذي st.progress، ونتائج مخزنة مؤقتاً
+
+دالة المهمة تُعرَّف في مستوى الوحدة (حتى تُرسل إلى العملية العاملة) وتقبل المعامل progress:
+تستدعي progress(نسبة، نص) بين الدفعات، فيتوقف العمل عندها إذا أُلغيت المهمة.
+معاملات DataFrame والمصفوفات الكبيرة تُنشر في الذاكرة المشتركة (econ_app.shared_columns)
+فتقرأها العاملة دون نسخ بدل تسلسلها مع كل مهمة.
+
+الجدولة: المهام تنتظر في طابور محدود الحجم ولا تُرسل إلى المجمع إلا عند توفر عاملة. المهام
+التفاعلية تسبق المهام الدفعية، ثم الجلسة الأقل مهاماً جارية، ثم الأصغر حجماً، ثم الأقدم. لكل
+جلسة حد للمهام الجارية والمنتظرة، والعاملات تعمل بأولوية نظام أدنى حتى يبقى خادم Streamlit
+(والحاسبات التي تُحسب مباشرة في خيط السكربت) سريع الاستجابة.
+"""
+import functools
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from econ_app import shared_columns
+
+# عدد العمليات العاملة، وعدد النتائج المحفوظة، والحد الأدنى للصفوف قبل الإرسال إلى المجمع
+JOB_WORKERS = int(os.environ.get("ECON_APP_JOB_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+JOB_CACHE_SIZE = int(os.environ.get("ECON_APP_JOB_CACHE_SIZE", "64"))
+JOB_MIN_ROWS = int(os.environ.get("ECON_APP_JOB_MIN_ROWS", "50000"))
+
+# حجم الطابور العام، وحدود كل جلسة (مهام جارية / منتظرة)، وأولوية النظام للعاملات (nice)
+JOB_QUEUE_SIZE = int(os.environ.get("ECON_APP_JOB_QUEUE_SIZE", "32"))
+JOB_SESSION_RUNNING = int(os.environ.get("ECON_APP_JOB_SESSION_RUNNING", "2"))
+JOB_SESSION_QUEUED = int(os.environ.get("ECON_APP_JOB_SESSION_QUEUED", "4"))
+JOB_NICE = int(os.environ.get("ECON_APP_JOB_NICE", "10"))
+
+# الفاصل بين تحديثات شريط التقدم أثناء الانتظار
+POLL_INTERVAL_S = 0.1
+
+_lock = threading.RLock()
+_pool = None
+_shared = {}
+_jobs = {}
+_queue = {}
+_active = {}
+_slots = {}
+_results = OrderedDict()
+_sequence = itertools.count()
+
+
+class JobCancelled(Exception):
+    """أُلغيت المهمة (تغيّرت مدخلات الجلسة التي طلبتها)"""
+
+
+class JobRejected(Exception):
+    """رُفضت المهمة: الطابور ممتلئ أو تجاوزت الجلسة حدها"""
+
+
+# ========== داخل العملية العاملة ==========
+def _lower_priority(nice):
+    """أولوية أدنى للعاملة حتى يفضّل نظام التشغيل خيوط خادم Streamlit"""
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+def _report_progress(job_id, progress, cancelled, fraction, text=""):
+    """تحديث نسبة التقدم (0-1) ثم التوقف برفع JobCancelled إن طُلب الإلغاء"""
+    progress[job_id] = (min(max(float(fraction), 0.0), 1.0), text)
+    if cancelled.get(job_id):
+        raise JobCancelled(job_id)
+
+
+def _run_job(job_id, progress, cancelled, func, args, kwargs):
+    report = functools.partial(_report_progress, job_id, progress, cancelled)
+    # مهمة أُلغيت بعد إرسالها وقبل أن تبدأ لا تعمل
+    report(0.0)
+    args, kwargs = shared_columns.attach_args(args, kwargs)
+    return func(*args, progress=report, **kwargs)
+
+
+# ========== المجمع ==========
+def _executor():
+    """المجمع المشترك وقواميس التقدم والإلغاء (تُنشأ عند أول مهمة في العملية وبعد تعطل المجمع)"""
+    global _pool
+
+    with _lock:
+        if _pool is None:
+            # spawn بدل fork: نسخ عملية خادم متعددة الخيوط قد يورث أقفالاً محجوزة
+            context = multiprocessing.get_context("spawn")
+            manager = context.Manager()
+            _shared.update(manager=manager, progress=manager.dict(), cancelled=manager.dict())
+            _pool = ProcessPoolExecutor(
+                max_workers=JOB_WORKERS, mp_context=context,
+                initializer=_lower_priority, initargs=(JOB_NICE,)
+            )
+        return _pool
+
+
+def _reset_pool(broken):
+    """التخلي عن مجمع معطل (ماتت إحدى عاملاته: نفاد ذاكرة أو خطأ فادح) ليُنشأ مجمع جديد عند المهمة التالية
+
+    ProcessPoolExecutor لا يقبل مهام بعد موت عاملة، والمهام الجارية فيه تفشل بـ BrokenProcessPool.
+    """
+    global _pool
+
+    with _lock:
+        if _pool is not broken:
+            return
+        _pool = None
+        manager = _shared.pop("manager", None)
+        _shared.clear()
+
+    broken.shutdown(wait=False, cancel_futures=True)
+    if manager is not None:
+        try:
+            manager.shutdown()
+        except (OSError, EOFError):
+            pass
+
+
+# ========== الجدولة ==========
+def _order(job, per_session):
+    """ترتيب الطابور: التفاعلية أولاً، ثم الجلسة الأقل مهاماً جارية، ثم الأصغر، ثم الأقدم"""
+    return job["batch"], per_session[job["session"]], job["rows"], job["seq"]
+
+
+def _submit(job, args, kwargs):
+    """إرسال المهمة إلى المجمع الحالي (مع قواميس التقدم والإلغاء الخاصة به)"""
+    pool = _executor()
+    job["pool"] = pool
+    job["progress"], job["cancelled"] = _shared["progress"], _shared["cancelled"]
+    return pool.submit(_run_job, job["id"], job["progress"], job["cancelled"], job["func"], args, kwargs)
+
+
+def _start(job):
+    """إرسال المهمة إلى المجمع ونقل نتيجتها إلى مستقبل المهمة"""
+    args, kwargs, job["shared"] = shared_columns.share_args(job.pop("args"), job.pop("kwargs"))
+    job["state"] = "running"
+    _active[job["id"]] = job
+
+    try:
+        try:
+            pool_future = _submit(job, args, kwargs)
+        except BrokenProcessPool:
+            # ماتت عاملة بعد آخر إرسال: مجمع جديد بدل فشل كل المهام حتى إعادة تشغيل الخادم
+            _reset_pool(job["pool"])
+            pool_future = _submit(job, args, kwargs)
+    except RuntimeError as e:
+        # المجمع أُغلق (إنهاء الخادم) والمهمة ما زالت في الطابور
+        job["future"].set_exception(e)
+        return
+    pool_future.add_done_callback(lambda done, job=job: _settle(job, done))
+
+
+def _settle(job, pool_future):
+    future = job["future"]
+    if pool_future.cancelled():
+        future.set_exception(JobCancelled(job["id"]))
+    elif pool_future.exception() is not None:
+        if isinstance(pool_future.exception(), BrokenProcessPool):
+            _reset_pool(job["pool"])
+        future.set_exception(pool_future.exception())
+    else:
+        future.set_result(pool_future.result())
+
+
+def _dispatch():
+    """إرسال المهام المنتظرة ما دامت هناك عاملات متاحة، مع احترام حد كل جلسة"""
+    with _lock:
+        while len(_active) < JOB_WORKERS and _queue:
+            per_session = Counter(job["session"] for job in _active.values())
+            eligible = [job for job in _queue.values() if per_session[job["session"]] < JOB_SESSION_RUNNING]
+            if not eligible:
+                break
+
+            job = min(eligible, key=lambda job: _order(job, per_session))
+            del _queue[job["id"]]
+            # مهمة أُلغيت وهي في الطابور لا تُرسل
+            if job["future"].set_running_or_notify_cancel():
+                _start(job)
+
+
+def _admit(session_id):
+    """رفض المهمة الجديدة إذا امتلأ الطابور أو تجاوزت الجلسة حدها"""
+    if len(_queue) >= JOB_QUEUE_SIZE:
+        raise JobRejected("الخادم مشغول بمهام كثيرة حالياً، أعد المحاولة بعد قليل")
+    if sum(1 for job in _queue.values() if job["session"] == session_id) >= JOB_SESSION_QUEUED:
+        raise JobRejected("لديك مهام كثيرة في الانتظار، انتظر انتهاءها أولاً")
+
+
+# ========== المهام ==========
+def job_done(job):
+    return job["future"] is None or job["future"].done()
+
+
+def job_status(job):
+    """حالة المهمة ("queued" / "running" / "done") وعدد المهام المنتظرة قبلها"""
+    if job_done(job):
+        return {"state": "done", "ahead": 0}
+
+    with _lock:
+        if job["state"] != "queued":
+            return {"state": "running", "ahead": 0}
+        per_session = Counter(other["session"] for other in _active.values())
+        rank = _order(job, per_session)
+        ahead = sum(1 for other in _queue.values() if _order(other, per_session) < rank)
+        return {"state": "queued", "ahead": ahead}
+
+
+def job_progress(job):
+    """(نسبة، نص) آخر تقدم أبلغت عنه المهمة"""
+    if job_done(job):
+        return 1.0, ""
+    if job["state"] != "running":
+        return 0.0, ""
+    try:
+        return job["progress"].get(job["id"], (0.0, ""))
+    except (OSError, EOFError):
+        # مدير قواميس مجمع معطل أُغلق؛ المهمة ستنتهي بخطأ
+        return 0.0, ""
+
+
+def job_result(job, timeout=None):
+    return job["result"] if job["future"] is None else job["future"].result(timeout)
+
+
+def cancel_job(job):
+    """إلغاء المهمة: من الطابور مباشرة، أو تعاونياً عند أول تحديث للتقدم إن كانت تعمل"""
+    if not job_done(job) and not job["future"].cancel():
+        try:
+            job["cancelled"][job["id"]] = True
+        except (OSError, EOFError):
+            pass
+
+
+def _finish(job, future):
+    with _lock:
+        # خانات الجلسات التي تنتظر هذه المهمة لم تعد تحتاج التتبع (لا تتراكم بعد انتهاء الجلسات)؛
+        # مهمة ملغاة بنفس المفتاح لا تمس خانات مهمة أحدث حلت محلها
+        if _jobs.get(job["key"], job) is job:
+            for slot_key in [slot_key for slot_key, key in _slots.items() if key == job["key"]]:
+                del _slots[slot_key]
+        if _jobs.get(job["key"]) is job:
+            del _jobs[job["key"]]
+        _queue.pop(job["id"], None)
+        _active.pop(job["id"], None)
+        for shared_key in job.get("shared", ()):
+            shared_columns.release(shared_key)
+        if not future.cancelled() and future.exception() is None:
+            _results[job["key"]] = future.result()
+            _results.move_to_end(job["key"])
+            while len(_results) > JOB_CACHE_SIZE:
+                _results.popitem(last=False)
+
+        if job["state"] == "running" and job["pool"] is _pool:
+            job["progress"].pop(job["id"], None)
+            job["cancelled"].pop(job["id"], None)
+        job["state"] = "done"
+
+    _dispatch()
+
+
+def _release(key, session_id):
+    """فك ارتباط الجلسة بالمهمة، وإلغاؤها إن لم تعد أي جلسة تنتظرها"""
+    job = _jobs.get(key)
+    if job is None:
+        return
+    job["sessions"].discard(session_id)
+    if not job["sessions"]:
+        _jobs.pop(key, None)
+        cancel_job(job)
+
+
+def submit(slot, func, *args, rows=0, batch=False, **kwargs):
+    """إضافة func(*args, progress=..., **kwargs) إلى طابور المجمع في خانة slot الخاصة بالجلسة
+
+    إذا كانت الخانة تنتظر مهمة بمدخلات أخرى (حرّك المستخدم منزلقاً مثلاً) تُلغى القديمة.
+    المهام بنفس المدخلات تُشارك بين الجلسات، والنتائج الجاهزة تُعاد دون إرسال.
+    batch=True للمهام الدفعية الطويلة التي تتأخر عن المهام التفاعلية؛ يرفع JobRejected
+    إذا امتلأ الطابور أو تجاوزت الجلسة حدها.
+    """
+    from econ_app.figure_cache import figure_key
+    from econ_app.session_memory import current_session_id
+
+    key = figure_key(func, *args, **kwargs)
+    session_id = current_session_id()
+
+    with _lock:
+        previous = _slots.pop((session_id, slot), None)
+        if previous is not None and previous != key:
+            _release(previous, session_id)
+
+        if key in _results:
+            _results.move_to_end(key)
+            return {"key": key, "id": None, "future": None, "result": _results[key]}
+
+        job = _jobs.get(key)
+        if job is None:
+            _admit(session_id)
+            job = {
+                "key": key, "id": uuid.uuid4().hex, "future": Future(), "result": None,
+                "sessions": set(), "session": session_id, "state": "queued",
+                "batch": bool(batch), "rows": rows or 0, "seq": next(_sequence),
+                "func": func, "args": args, "kwargs": kwargs
+            }
+            _jobs[key] = job
+            _queue[job["id"]] = job
+            job["future"].add_done_callback(lambda done, job=job: _finish(job, done))
+
+        job["sessions"].add(session_id)
+        # الخانة تُتتبع ما دامت المهمة منتظرة أو جارية، وتُحذف في _finish
+        _slots[(session_id, slot)] = key
+
+    _dispatch()
+    return job
+
+
+def run_job(slot, func, *args, rows=None, batch=False, label="جارٍ الحساب...", **kwargs):
+    """نتيجة المهمة مع شريط تقدم أثناء الانتظار (البيانات الصغيرة تُحسب مباشرة في خيط السكربت)
+
+    يعرض الشريط موضع المهمة في الطابور ثم تقدمها أثناء العمل. إذا طلب المستخدم إعادة تشغيل
+    أثناء الانتظار يتوقف الانتظار عند تحديث الشريط، والتشغيل التالي يلغي المهمة إن تغيرت
+    مدخلاتها أو يعيد الارتباط بها إن لم تتغير. المهمة المرفوضة توقف الصفحة برسالة للمستخدم.
+    """
+    if rows is not None and rows < JOB_MIN_ROWS:
+        return func(*args, **kwargs)
+
+    import streamlit as st
+
+    try:
+        job = submit(slot, func, *args, rows=rows, batch=batch, **kwargs)
+    except JobRejected as e:
+        st.warning(f"⏳ {e}")
+        st.stop()
+
+    if job_done(job):
+        return job_result(job)
+
+    bar = st.progress(0.0, text=label)
+    while not job_done(job):
+        status = job_status(job)
+        if status["state"] == "queued":
+            bar.progress(0.0, text=f"{label} في الانتظار ({status['ahead']} مهمة قبلها)")
+        else:
+            fraction, text = job_progress(job)
+            bar.progress(fraction, text=f"{label} {text}".strip())
+        time.sleep(POLL_INTERVAL_S)
+    bar.empty()
+
+    return job_result(job)
+
+
+def jobs_info():
+    """عدد المهام الجارية والمنتظرة والنتائج المحفوظة"""
+    with _lock:
+        return {
+            "running": len(_active),
+            "queued": len(_queue),
+            "cached": len(_results),
+            "slots": len(_slots),
+            "workers": JOB_WORKERS,
+            "shared": shared_columns.shared_info()
+        }
@@ -0,0 +1,109 @@
+"""جداول نتائج محسوبة مسبقاً للحاسبات ذات المنزلقات المتقطعة: تحريك المنزلق يصبح قراءة بالفهرس
+
+مجال كل منزلق (الحد الأدنى، الأقصى، الخطوة) معرّف هنا ويُمرر إلى st.slider نفسه، فيبقى الجدول
+مطابقاً لقيم المنزلق. الجداول تُحسب مرة واحدة لكل عملية عند أول استخدام وتُشارك بين الجلسات.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from econ_app import formulas
+from econ_app.analytics import OKUN_SCENARIOS, OKUN_UNEMPLOYMENT_BOUNDS
+
+# مجالات المنزلقات (تُمرر كـ st.slider(..., **DOMAIN))
+RULE_OF_70_GROWTH = {"min_value": 0.5, "max_value": 10.0, "step": 0.5}
+OKUN_G_STAR = {"min_value": 1.0, "max_value": 4.0, "step": 0.1}
+OKUN_BETA = {"min_value": 0.1, "max_value": 1.0, "step": 0.1}
+OKUN_U0 = {"min_value": 3.0, "max_value": 15.0, "step": 0.1}
+PURCHASING_POWER_YEARS = {"min_value": 1, "max_value": 30, "step": 1}
+
+# معدلات التضخم المضمنة في رسم القوة الشرائية داخل المتصفح (حقل التضخم نفسه إدخال حر)
+PURCHASING_POWER_INFLATION = {"min_value": 0.0, "max_value": 20.0, "step": 0.5}
+
+
+# ========== المجالات والفهارس ==========
+def _count(domain):
+    return int(round((domain["max_value"] - domain["min_value"]) / domain["step"])) + 1
+
+
+def slider_values(domain):
+    """جميع قيم المنزلق بالترتيب (مقربة كما يعرضها المنزلق)"""
+    return np.round(domain["min_value"] + np.arange(_count(domain)) * domain["step"], 10)
+
+
+def slider_index(domain, value):
+    """فهرس قيمة المنزلق في الجدول"""
+    index = int(round((value - domain["min_value"]) / domain["step"]))
+    return min(max(index, 0), _count(domain) - 1)
+
+
+# ========== قاعدة 70 ==========
+@st.cache_resource(show_spinner=False)
+def doubling_time_grid():
+    """سنوات المضاعفة لكل قيمة من منزلق معدل النمو"""
+    grid = formulas.doubling_time(slider_values(RULE_OF_70_GROWTH))
+    grid.flags.writeable = False
+    return grid
+
+
+def doubling_time_lookup(growth):
+    return float(doubling_time_grid()[slider_index(RULE_OF_70_GROWTH, growth)])
+
+
+# ========== قانون أوكون ==========
+@st.cache_resource(show_spinner=False)
+def okun_grid():
+    """التغير في البطالة [سيناريو، g*، β] والبطالة الجديدة [سيناريو، g*، β، u0] لكل تركيبة منزلقات"""
+    g_star = slider_values(OKUN_G_STAR)
+    beta = slider_values(OKUN_BETA)
+    u0 = slider_values(OKUN_U0)
+
+    fixed = np.array([np.nan if growth is None else growth for growth in OKUN_SCENARIOS.values()])
+    growth = np.where(np.isnan(fixed)[:, None], g_star[None, :], fixed[:, None])
+
+    delta_u = formulas.okun_unemployment_change(
+        growth[:, :, None], g_star[None, :, None], beta[None, None, :]
+    )
+    new_u = np.clip(u0[None, None, None, :] + delta_u[..., None], *OKUN_UNEMPLOYMENT_BOUNDS)
+
+    grid = {"growth": growth, "delta_u": delta_u, "new_u": new_u}
+    for array in grid.values():
+        array.flags.writeable = False
+    return grid
+
+
+def okun_scenarios_lookup(g_star, beta, u0):
+    """نفس جدول analytics.okun_scenarios مقروءاً من الجدول المحسوب مسبقاً"""
+    grid = okun_grid()
+    g = slider_index(OKUN_G_STAR, g_star)
+    b = slider_index(OKUN_BETA, beta)
+    u = slider_index(OKUN_U0, u0)
+
+    growth = grid["growth"][:, g]
+    return pd.DataFrame({
+        "scenario": list(OKUN_SCENARIOS),
+        "growth": growth,
+        "gap": growth - slider_values(OKUN_G_STAR)[g],
+        "delta_u": grid["delta_u"][:, g, b],
+        "new_u": grid["new_u"][:, g, b, u]
+    })
+
+
+# ========== القوة الشرائية ==========
+@st.cache_resource(show_spinner=False, max_entries=256)
+def purchasing_power_curve(amount, inflation):
+    """القوة الشرائية لكل سنة من 0 إلى أقصى قيمة لمنزلق السنوات (المبلغ والتضخم حقول إدخال حرة)"""
+    years = np.arange(PURCHASING_POWER_YEARS["max_value"] + 1)
+    curve = formulas.purchasing_power(amount, inflation, years)
+    curve.flags.writeable = False
+    return curve
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def purchasing_power_grid(amount):
+    """القوة الشرائية [معدل تضخم، سنة] لكل معدل في PURCHASING_POWER_INFLATION"""
+    inflation = slider_values(PURCHASING_POWER_INFLATION)
+    years = np.arange(PURCHASING_POWER_YEARS["max_value"] + 1)
+    grid = formulas.purchasing_power(amount, inflation[:, None], years[None, :])
+    grid.flags.writeable = False
+    return grid
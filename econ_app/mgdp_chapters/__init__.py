@@ -0,0 +1 @@
+"""فصول تطبيق mgdp.py، وحدة لكل فصل تُستورد عند اختياره"""
@@ -0,0 +1,234 @@
+"""الفصل 1: المفاهيم الأساسية للاقتصاد الكلي"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from econ_app.figure_cache import cached_figure
+from econ_app.downsample import MAX_POINTS, downsample_frame
+from econ_app.chart_controls import zoom_range
+
+
+def gdp_line_figure(data, x_range=None):
+    """تطور الناتج المحلي الحقيقي من البيانات المحملة (مقلّص إلى عرض الرسم)"""
+    return px.line(
+        downsample_frame(data, "السنة", "الناتج_الحقيقي_مليار_يورو", MAX_POINTS, x_range),
+        x="السنة",
+        y="الناتج_الحقيقي_مليار_يورو",
+        title="تطور الناتج المحلي (مثال واقعي)",
+        markers=True
+    )
+
+
+def supply_demand_figure():
+    """منحنى العرض والطلب (اقتصاد جزئي)"""
+    prices = np.linspace(1, 10, 20)
+    demand = 100 - 8 * prices
+    supply = 20 + 5 * prices
+
+    fig_micro = go.Figure()
+    fig_micro.add_trace(go.Scatter(x=prices, y=demand, name="الطلب", line=dict(color='blue')))
+    fig_micro.add_trace(go.Scatter(x=prices, y=supply, name="العرض", line=dict(color='red')))
+    fig_micro.update_layout(
+        title="منحنى العرض والطلب (اقتصاد جزئي)",
+        xaxis_title="السعر",
+        yaxis_title="الكمية"
+    )
+    return fig_micro
+
+
+def swimmers_figure(df_swim):
+    """نتائج السباق (النهج الكلي)"""
+    fig_swim = px.bar(
+        df_swim,
+        x="السباح",
+        y="الزمن (ثانية)",
+        color="السرعة (م/ث)",
+        title="نتائج السباق (النهج الكلي)",
+        color_continuous_scale="Viridis"
+    )
+    fig_swim.update_layout(height=400)
+    return fig_swim
+
+
+def render(uploaded_data, data_info):
+    """عرض الفصل 1: المفاهيم الأساسية"""
+    st.header("📖 الفصل 1: المفاهيم الأساسية للاقتصاد الكلي")
+    
+    # عرض بيانات محملة إذا كانت موجودة
+    if uploaded_data is not None and data_info:
+        st.sidebar.success(f"✅ تم تحميل {data_info['عدد_الصفوف']} صف و {data_info['عدد_الأعمدة']} عمود")
+        
+        with st.expander("👁️ عرض البيانات المحملة"):
+            st.write("**معلومات عن البيانات:**")
+            st.json(data_info)
+            st.write("**عينة من البيانات:**")
+            st.dataframe(uploaded_data.head())
+    
+    st.markdown("""
+    ## 🎯 الهدف التعليمي
+    فهم الفرق بين الاقتصاد الكلي والاقتصاد الجزئي وإدراك أهمية النهج الشمولي في التحليل الاقتصادي.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="chapter-box">', unsafe_allow_html=True)
+        st.subheader("🎯 الاقتصاد الكلي")
+        st.markdown("""
+        **تعريف:** دراسة الظواهر الاقتصادية على مستوى الاقتصاد ككل
+        
+        **يركز على:**
+        - الناتج المحلي الإجمالي (GDP)
+        - التضخم
+        - البطالة
+        - النمو الاقتصادي
+        - السياسات الاقتصادية الكلية
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # مخطط توضيحي
+        if uploaded_data is not None and 'الناتج_الحقيقي_مليار_يورو' in uploaded_data.columns:
+            x_range = zoom_range(uploaded_data["السنة"], key="macro_zoom")
+            st.plotly_chart(cached_figure(gdp_line_figure, uploaded_data, x_range), use_container_width=True)
+    
+    with col2:
+        st.markdown('<div class="chapter-box">', unsafe_allow_html=True)
+        st.subheader("🔬 الاقتصاد الجزئي")
+        st.markdown("""
+        **تعريف:** دراسة سلوك الوحدات الاقتصادية الفردية
+        
+        **يركز على:**
+        - سلوك المستهلكين
+        - قرارات المنتجين
+        - تحديد الأسعار في الأسواق الفردية
+        - كفاءة تخصيص الموارد
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # مثال محاكاة للاقتصاد الجزئي
+        st.plotly_chart(cached_figure(supply_demand_figure), use_container_width=True)
+    
+    st.markdown("---")
+    
+    st.subheader("🏊 مثال توضيحي: سباحة السباحين")
+    
+    st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **المثال كما ورد في الكتاب (الصفحة 18-19):**
+    
+    تخيل سباق سباحة (100 متر حرة) بـ 8 سباحين:
+    
+    1. **النهج الجزئي**: مراقبة سباح واحد بالمنظار (كاميرا منعزلة)
+    2. **النهج الكلي**: مشاهدة السباق بالعين المجردة
+    
+    **التطبيق العملي:**
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # كل محاكاة أو حاسبة جزء (fragment) مستقل: تغيير مدخلاتها يعيد تشغيل هذا الجزء فقط وليس الفصل كله
+    @st.fragment
+    def swimmers_simulation():
+        # محاكاة تفاعلية
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            n_swimmers = st.slider("عدد السباحين في السباق", 3, 8, 5)
+            
+            # محاكاة أداء السباحين
+            swimmers = [f"السباح {i+1}" for i in range(n_swimmers)]
+            speeds = np.random.uniform(1.5, 2.5, n_swimmers)
+            times = 100 / speeds
+            
+            df_swim = pd.DataFrame({
+                "السباح": swimmers,
+                "السرعة (م/ث)": speeds,
+                "الزمن (ثانية)": times
+            }).sort_values("الزمن (ثانية)")
+            
+            st.dataframe(df_swim.style.format({
+                "السرعة (م/ث)": "{:.2f}",
+                "الزمن (ثانية)": "{:.2f}"
+            }), use_container_width=True)
+        
+        with col2:
+            # رسم بياني للنتائج
+            st.plotly_chart(cached_figure(swimmers_figure, df_swim), use_container_width=True)
+    
+    swimmers_simulation()
+    
+    st.markdown("---")
+    
+    st.subheader("🤔 المفارقة الأساسية: مفارقة الادخار")
+    
+    st.markdown('<div class="formula-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **كما ورد في الكتاب (الصفحة 19):**
+    
+    > "إذا توقع الأسر أن الوضع الاقتصادي سيتدهور، فسيقللون من إنفاقهم ويزيدون من ادخارهم. 
+    > لكن هذا التصرف الفردي العقلاني يؤدي إلى حلقة مفرغة..."
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # محاكاة مفارقة الادخار
+    st.subheader("🔄 محاكاة تفاعلية لمفارقة الادخار")
+    
+    @st.fragment
+    def saving_paradox_simulation():
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            initial_consumption = st.number_input("الاستهلاك الأولي (مليار يورو)", 1000, 2000, 1500)
+        
+        with col2:
+            savings_rate = st.slider("معدل الادخار (%)", 10, 40, 20)
+        
+        with col3:
+            economic_outlook = st.selectbox("توقعات الأسر", ["متفائلة جداً", "متفائلة", "محايدة", "متشائمة", "متشائمة جداً"])
+        
+        # حساب التأثيرات
+        outlook_multiplier = {
+            "متفائلة جداً": 1.2,
+            "متفائلة": 1.1,
+            "محايدة": 1.0,
+            "متشائمة": 0.9,
+            "متشائمة جداً": 0.8
+        }
+        
+        new_consumption = initial_consumption * outlook_multiplier[economic_outlook]
+        consumption_change = new_consumption - initial_consumption
+        
+        # تأثير مضاعف الإنفاق
+        spending_multiplier = 1.5  # مبسط
+        gdp_effect = consumption_change * spending_multiplier
+        
+        # تأثير على التوظيف (تقريبي)
+        employment_effect = gdp_effect * 0.001  # كل مليار يورو يخلق 1000 وظيفة تقريباً
+        
+        # عرض النتائج
+        st.markdown("### 📊 نتائج المحاكاة")
+        
+        metrics_cols = st.columns(4)
+        
+        with metrics_cols[0]:
+            st.metric("التغير في الاستهلاك", f"{consumption_change:+.1f} مليار")
+        
+        with metrics_cols[1]:
+            st.metric("تأثير على الناتج المحلي", f"{gdp_effect:+.1f} مليار")
+        
+        with metrics_cols[2]:
+            st.metric("تأثير على التوظيف", f"{employment_effect:+.0f} ألف وظيفة")
+        
+        with metrics_cols[3]:
+            paradox = "نعم" if (economic_outlook in ["متشائمة", "متشائمة جداً"] and gdp_effect < 0) else "لا"
+            st.metric("هل تحدث المفارقة؟", paradox)
+    
+    saving_paradox_simulation()
+    
+    st.warning("""
+    **الخلاصة التعليمية:**
+    - النهج الكلي ≠ مجموع النهج الجزئي
+    - "الكل أكبر من مجموع الأجزاء" (أرسطو)
+    - التفاعلات بين القرارات الفردية تولد ظواهر كلية جديدة
+    """)
@@ -0,0 +1,309 @@
+"""الفصل 2: الناتج المحلي الإجمالي - القياس والتحليل"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from econ_app import formulas
+from econ_app.analytics import trend_regression
+from econ_app.charts import trend_figure
+from econ_app.figure_cache import cached_figure
+from econ_app.chart_controls import zoom_range
+
+
+def nominal_real_figure(df_simulated):
+    """مقارنة الناتج الاسمي والحقيقي"""
+    fig_comparison = go.Figure()
+    fig_comparison.add_trace(go.Scatter(
+        x=df_simulated["السنة"],
+        y=df_simulated["الناتج_الحقيقي"],
+        name="الناتج الحقيقي",
+        line=dict(color='green', width=3)
+    ))
+    fig_comparison.add_trace(go.Scatter(
+        x=df_simulated["السنة"],
+        y=df_simulated["الناتج_الاسمي"],
+        name="الناتج الاسمي",
+        line=dict(color='blue', width=3)
+    ))
+
+    fig_comparison.update_layout(
+        title="مقارنة الناتج الاسمي والحقيقي",
+        xaxis_title="السنة",
+        yaxis_title="مليار يورو",
+        height=400
+    )
+    return fig_comparison
+
+
+def render(uploaded_data, data_info):
+    """عرض الفصل 2: الناتج المحلي الإجمالي"""
+    st.header("📊 الفصل 2: الناتج المحلي الإجمالي - القياس والتحليل")
+    
+    # قسم بيانات حقيقية إذا تم تحميلها
+    if uploaded_data is not None:
+        st.markdown('<div class="data-source">', unsafe_allow_html=True)
+        st.subheader("📊 البيانات المحملة")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.write("**عينة من البيانات:**")
+            st.dataframe(uploaded_data.head())
+        
+        with col2:
+            st.write("**إحصائيات أساسية:**")
+            st.metric("عدد السنوات", len(uploaded_data))
+            if 'الناتج_الحقيقي_مليار_يورو' in uploaded_data.columns:
+                latest_gdp = uploaded_data['الناتج_الحقيقي_مليار_يورو'].iloc[-1]
+                growth_rate = formulas.growth_rate(latest_gdp, uploaded_data['الناتج_الحقيقي_مليار_يورو'].iloc[-2])
+                st.metric("آخر قيمة للناتج المحلي", f"{latest_gdp:.1f} مليار")
+                st.metric("آخر معدل نمو", f"{growth_rate:.1f}%")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## 🎯 الهدف التعليمي
+    فهم طرق حساب الناتج المحلي الإجمالي الثلاث والتمييز بين الناتج الاسمي والناتج الحقيقي.
+    """)
+    
+    st.subheader("📋 الطرق الثلاث لحساب الناتج المحلي الإجمالي")
+    
+    # عرض طرق الحساب في تبويبات
+    tab1, tab2, tab3 = st.tabs(["طريقة الإنتاج", "طريقة الإنفاق", "طريقة الدخل"])
+    
+    with tab1:
+        st.markdown('<div class="chapter-box">', unsafe_allow_html=True)
+        st.subheader("🏭 طريقة الإنتاج (القيمة المضافة)")
+        st.markdown("""
+        **التعريف:** مجموع القيم المضافة الناتجة في الاقتصاد
+        
+        **المعادلة:**
+        ```
+        الناتج المحلي = Σ (القيمة المضافة لكل قطاع)
+        القيمة المضافة = الإنتاج - المستهلكات الوسيطة
+        ```
+        
+        **مثال من الكتاب (الصفحة 26-27):**
+        - الصناعة المعدنية: 1000 - 0 = 1000 مليون يورو
+        - الصناعة السيارات: 2000 - 1000 = 1000 مليون يورو
+        - **المجموع: 2000 مليون يورو**
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # آلة حاسبة للقيمة المضافة
+        st.subheader("🧮 آلة حاسبة القيمة المضافة")
+        
+        @st.fragment
+        def value_added_calculator():
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                production = st.number_input("قيمة الإنتاج (مليون يورو)", 0, 5000, 1000)
+            
+            with col2:
+                intermediate = st.number_input("قيمة المستهلكات الوسيطة (مليون يورو)", 0, 5000, 500)
+            
+            value_added = production - intermediate
+            
+            st.metric("القيمة المضافة", f"{value_added} مليون يورو")
+        
+        value_added_calculator()
+    
+    with tab2:
+        st.markdown('<div class="chapter-box">', unsafe_allow_html=True)
+        st.subheader("💰 طريقة الإنفاق")
+        st.markdown("""
+        **التعريف:** قيمة السلع والخدمات النهائية المنتجة
+        
+        **المعادلة:**
+        ```
+        الناتج المحلي = الاستهلاك + الاستثمار + الإنفاق الحكومي + الصادرات الصافية
+        Y = C + I + G + (X - M)
+        ```
+        
+        **مثال من الكتاب (الصفحة 36):**
+        - الاستهلاك (C): 1268.5 مليار يورو
+        - الاستثمار (I): 537.9 مليار يورو
+        - الإنفاق الحكومي (G): 550.9 مليار يورو
+        - الصادرات الصافية (NX): -18.3 مليار يورو
+        - **المجموع: 2339 مليار يورو**
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # آلة حاسبة طريقة الإنفاق
+        st.subheader("🧮 آلة حاسبة طريقة الإنفاق")
+        
+        @st.fragment
+        def expenditure_calculator():
+            # المدخلات الخمسة في نموذج واحد: حساب واحد عند الضغط على الزر بدل حساب عند كل تعديل
+            with st.form("expenditure_form"):
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    C = st.number_input("الاستهلاك (C)", 0, 3000, 1268)
+                
+                with col2:
+                    I = st.number_input("الاستثمار (I)", 0, 3000, 538)
+                
+                with col3:
+                    G = st.number_input("الإنفاق الحكومي (G)", 0, 3000, 551)
+                
+                with col4:
+                    X = st.number_input("الصادرات (X)", 0, 3000, 737)
+                    M = st.number_input("الواردات (M)", 0, 3000, 755)
+            
+                st.form_submit_button("🧮 احسب الناتج")
+            
+            NX = X - M
+            GDP_expenditure = C + I + G + NX
+            
+            st.metric("الناتج المحلي الإجمالي (طريقة الإنفاق)", f"{GDP_expenditure} مليار يورو")
+        
+        expenditure_calculator()
+    
+    with tab3:
+        st.markdown('<div class="chapter-box">', unsafe_allow_html=True)
+        st.subheader("💼 طريقة الدخل")
+        st.markdown("""
+        **التعريف:** مجموع مداخيل عوامل الإنتاج
+        
+        **المعادلة:**
+        ```
+        الناتج المحلي = الأجور + الأرباح + الفوائد + الإيجارات + الضرائب
+        ```
+        
+        **مثال من الكتاب (الصفحة 28):**
+        - الأجور: 500 مليون يورو
+        - الفوائد: 40 مليون يورو
+        - الأرباح: 1460 مليون يورو
+        - **المجموع: 2000 مليون يورو**
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # آلة حاسبة طريقة الدخل
+        st.subheader("🧮 آلة حاسبة طريقة الدخل")
+        
+        @st.fragment
+        def income_calculator():
+            with st.form("income_form"):
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    wages = st.number_input("الأجور", 0, 2000, 500)
+                
+                with col2:
+                    profits = st.number_input("الأرباح", 0, 2000, 1460)
+                
+                with col3:
+                    interests = st.number_input("الفوائد", 0, 200, 40)
+                
+                with col4:
+                    rents = st.number_input("الإيجارات", 0, 200, 50)
+                    taxes = st.number_input("الضرائب", 0, 500, 100)
+            
+                st.form_submit_button("🧮 احسب الناتج")
+            
+            GDP_income = wages + profits + interests + rents + taxes
+            
+            st.metric("الناتج المحلي الإجمالي (طريقة الدخل)", f"{GDP_income} مليون يورو")
+        
+        income_calculator()
+    
+    st.markdown("---")
+    
+    st.subheader("💰 التمييز بين الناتج الاسمي والناتج الحقيقي")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="formula-box">', unsafe_allow_html=True)
+        st.markdown("""
+        **الناتج الاسمي:**
+        ```
+        الناتج الاسمي = Σ (الكمية × السعر الحالي)
+        ```
+        
+        **الناتج الحقيقي:**
+        ```
+        الناتج الحقيقي = Σ (الكمية × السعر الأساسي)
+        ```
+        
+        **معادلة مُعَدِّل الناتج المحلي:**
+        ```
+        مُعَدِّل الناتج المحلي = الناتج الاسمي ÷ الناتج الحقيقي
+        ```
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        # محاكاة بيانات الناتج الاسمي والحقيقي
+        years = list(range(2015, 2024))
+        
+        # إنشاء بيانات محاكاة
+        base_real_gdp = 2000  # مليار يورو في 2015
+        
+        simulated_data = []
+        current_real = base_real_gdp
+        current_nominal = base_real_gdp
+        
+        for i, year in enumerate(years):
+            # نمو حقيقي عشوائي (مع إضافة تأثير COVID في 2020)
+            if year == 2020:
+                real_growth = np.random.uniform(-8, -5)
+            else:
+                real_growth = np.random.uniform(0.5, 3.5)
+            
+            # تضخم عشوائي
+            inflation = np.random.uniform(0.5, 3.5)
+            if year >= 2022:  # تضخم مرتفع في السنوات الأخيرة
+                inflation = np.random.uniform(4, 7)
+            
+            # حساب القيم
+            current_real *= (1 + real_growth/100)
+            current_nominal = current_real * (1 + inflation/100)
+            
+            simulated_data.append({
+                "السنة": year,
+                "الناتج_الحقيقي": current_real,
+                "الناتج_الاسمي": current_nominal,
+                "معدل_النمو_الحقيقي": real_growth,
+                "التضخم": inflation
+            })
+        
+        df_simulated = pd.DataFrame(simulated_data)
+        
+        # رسم بياني للمقارنة
+        st.plotly_chart(cached_figure(nominal_real_figure, df_simulated), use_container_width=True)
+    
+    # إذا كانت هناك بيانات حقيقية، إجراء تحليل إضافي
+    if uploaded_data is not None and 'الناتج_الحقيقي_مليار_يورو' in uploaded_data.columns:
+        st.markdown("---")
+        st.subheader("📈 تحليل بيانات الناتج المحلي الحقيقية")
+        
+        # تحليل الاتجاه الخطي
+        trend = trend_regression(uploaded_data['الناتج_الحقيقي_مليار_يورو'])
+        
+        # إنشاء الشكل (السلاسل الطويلة تُقلَّص، والتكبير يعيد قراءة النطاق بدقة كاملة)
+        x_range = zoom_range(uploaded_data["السنة"], key="trend_zoom")
+        fig_trend = cached_figure(
+            trend_figure,
+            uploaded_data["السنة"],
+            uploaded_data["الناتج_الحقيقي_مليار_يورو"],
+            trend["trend_line"],
+            x_range=x_range
+        )
+        
+        st.plotly_chart(fig_trend, use_container_width=True)
+        
+        # عرض إحصائيات الاتجاه
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("متوسط النمو السنوي", f"{trend['avg_growth']:.2f}%")
+        
+        with col2:
+            st.metric("ميل الاتجاه", f"{trend['slope']:.2f} مليار/سنة")
+        
+        with col3:
+            st.metric("معامل التحديد (R²)", f"{trend['r_squared']:.3f}")
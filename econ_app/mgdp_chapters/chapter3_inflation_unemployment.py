@@ -0,0 +1,230 @@
+"""الفصل 3: التضخم والبطالة - القياس والتحليل"""
+import streamlit as st
+import plotly.express as px
+
+from econ_app import formulas
+from econ_app.data_viewer import render_paged_dataframe
+from econ_app.analytics import phillips_curve
+from econ_app.charts import phillips_figure
+from econ_app.figure_cache import cached_figure
+
+
+def population_figure(employed, unemployed, inactive):
+    """توزيع السكان في سن العمل"""
+    categories = ["مشتغلون", "عاطلون", "غير نشطين"]
+    values = [employed, unemployed, inactive]
+
+    return px.pie(
+        names=categories,
+        values=values,
+        title="توزيع السكان في سن العمل",
+        color_discrete_sequence=['#2ecc71', '#e74c3c', '#95a5a6']
+    )
+
+
+def render(uploaded_data, data_info):
+    """عرض الفصل 3: التضخم والبطالة"""
+    st.header("💰 الفصل 3: التضخم والبطالة - القياس والتحليل")
+    
+    st.markdown("""
+    ## 🎯 الهدف التعليمي
+    فهم كيفية قياس التضخم والبطالة وتحليل العلاقة بينهما.
+    """)
+    
+    # عرض بيانات محملة إذا كانت موجودة
+    if uploaded_data is not None:
+        with st.expander("📊 عرض بيانات التضخم والبطالة"):
+            render_paged_dataframe(uploaded_data, key="ch3_data")
+            
+            # إذا كانت البيانات تحتوي على معلومات التضخم والبطالة
+            if 'التضخم_٪' in uploaded_data.columns and 'البطالة_٪' in uploaded_data.columns:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    avg_inflation = uploaded_data['التضخم_٪'].mean()
+                    st.metric("متوسط التضخم", f"{avg_inflation:.2f}%")
+                
+                with col2:
+                    avg_unemployment = uploaded_data['البطالة_٪'].mean()
+                    st.metric("متوسط البطالة", f"{avg_unemployment:.2f}%")
+    
+    st.subheader("🧺 قياس التضخم: سلة السلع ومؤشر الأسعار")
+    
+    st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **مثال من الكتاب (الصفحة 46):**
+    
+    مستهلك يشتري:
+    - 2 لتر حليب
+    - 3 كيلو برتقال
+    - 2 رغيف خبز
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # آلة حاسبة مؤشر الأسعار
+    st.subheader("🧮 آلة حاسبة مؤشر الأسعار والتضخم")
+    
+    @st.fragment
+    def price_index_calculator():
+        with st.form("price_index_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**سنة الأساس**")
+                milk_base = st.number_input("سعر اللتر حليب (يورو)", 0.3, 2.0, 0.50, key="milk_base")
+                orange_base = st.number_input("سعر الكيلو برتقال (يورو)", 0.5, 3.0, 1.00, key="orange_base")
+                bread_base = st.number_input("سعر الرغيف خبز (يورو)", 0.5, 2.0, 1.10, key="bread_base")
+            
+            with col2:
+                st.markdown("**السنة الحالية**")
+                milk_current = st.number_input("سعر اللتر حليب (يورو)", 0.3, 2.0, 0.70, key="milk_current")
+                orange_current = st.number_input("سعر الكيلو برتقال (يورو)", 0.5, 3.0, 2.00, key="orange_current")
+                bread_current = st.number_input("سعر الرغيف خبز (يورو)", 0.5, 2.0, 1.20, key="bread_current")
+        
+            st.form_submit_button("🧮 احسب مؤشر الأسعار")
+        
+        # الكميات الثابتة
+        quantities = {"حليب": 2, "برتقال": 3, "خبز": 2}
+        
+        # حساب تكلفة السلة
+        basket_cost_base = (
+            quantities["حليب"] * milk_base +
+            quantities["برتقال"] * orange_base +
+            quantities["خبز"] * bread_base
+        )
+        
+        basket_cost_current = (
+            quantities["حليب"] * milk_current +
+            quantities["برتقال"] * orange_current +
+            quantities["خبز"] * bread_current
+        )
+        
+        # حساب مؤشر الأسعار
+        price_index = formulas.cpi_laspeyres(
+            [milk_current, orange_current, bread_current],
+            [milk_base, orange_base, bread_base],
+            [quantities["حليب"], quantities["برتقال"], quantities["خبز"]]
+        )
+        inflation_rate = formulas.inflation_rate(price_index, 100)
+        
+        # عرض النتائج
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("تكلفة السلة في سنة الأساس", f"{basket_cost_base:.2f} يورو")
+        
+        with col2:
+            st.metric("تكلفة السلة في السنة الحالية", f"{basket_cost_current:.2f} يورو")
+        
+        with col3:
+            st.metric("مؤشر الأسعار", f"{price_index:.1f}")
+            st.metric("معدل التضخم", f"{inflation_rate:.1f}%")
+    
+    price_index_calculator()
+    
+    st.markdown("---")
+    
+    st.subheader("👥 قياس البطالة")
+    
+    st.markdown('<div class="formula-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **الصيغ الأساسية:**
+    
+    ```
+    القوى العاملة = المشتغلين + العاطلين
+    L = E + U
+    
+    معدل البطالة = (العاطلين ÷ القوى العاملة) × 100
+    u = (U ÷ L) × 100
+    
+    معدل المشاركة = (القوى العاملة ÷ السكان في سن العمل) × 100
+    PR = (L ÷ WA) × 100
+    ```
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # آلة حاسبة البطالة
+    st.subheader("🧮 آلة حاسبة معدلات البطالة والمشاركة")
+    
+    @st.fragment
+    def labor_market_calculator():
+        with st.form("labor_market_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                working_age_pop = st.number_input("السكان في سن العمل (مليون)", 10.0, 100.0, 45.0)
+                employed = st.number_input("عدد المشتغلين (مليون)", 1.0, 50.0, 25.0)
+            
+            with col2:
+                unemployed = st.number_input("عدد العاطلين (مليون)", 0.1, 20.0, 2.5)
+                inactive = st.number_input("غير النشطين اقتصادياً (مليون)", 0.0, 50.0, 17.5)
+        
+            st.form_submit_button("🧮 احسب المعدلات")
+        
+        # الحسابات
+        labor_force = employed + unemployed
+        unemployment_rate = formulas.unemployment_rate(unemployed, employed) if labor_force > 0 else 0
+        participation_rate = formulas.participation_rate(labor_force, working_age_pop) if working_age_pop > 0 else 0
+        employment_rate = formulas.employment_rate(employed, working_age_pop) if working_age_pop > 0 else 0
+        
+        # عرض المؤشرات
+        st.markdown("### 📊 المؤشرات المحسوبة")
+        
+        metrics_cols = st.columns(4)
+        
+        with metrics_cols[0]:
+            st.metric("القوى العاملة", f"{labor_force:.1f} مليون")
+        
+        with metrics_cols[1]:
+            st.metric("معدل البطالة", f"{unemployment_rate:.1f}%")
+        
+        with metrics_cols[2]:
+            st.metric("معدل المشاركة", f"{participation_rate:.1f}%")
+        
+        with metrics_cols[3]:
+            st.metric("معدل التشغيل", f"{employment_rate:.1f}%")
+        
+        # مخطط دائري لتوزيع السكان
+        fig_pie = cached_figure(population_figure, employed, unemployed, inactive)
+        
+        st.plotly_chart(fig_pie, use_container_width=True)
+    
+    labor_market_calculator()
+    
+    st.markdown("---")
+    
+    st.subheader("📈 تحليل العلاقة بين التضخم والبطالة")
+    
+    # منحنى فيليبس قصير الأجل
+    expected_inflation = 2.0
+    natural_unemployment = 6.0
+    beta = 0.5
+    
+    phillips_data = phillips_curve(expected_inflation, natural_unemployment, beta)
+    
+    # رسم منحنى فيليبس
+    fig_phillips = cached_figure(phillips_figure, phillips_data, natural_unemployment)
+    
+    st.plotly_chart(fig_phillips, use_container_width=True)
+    
+    st.markdown('<div class="formula-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **معادلة منحنى فيليبس:**
+    
+    ```
+    π = πₑ - β(u - uₙ)
+    ```
+    
+    حيث:
+    - π: التضخم الفعلي
+    - πₑ: التضخم المتوقع
+    - β: معامل الحساسية (عادة ≈ 0.5)
+    - u: معدل البطالة الفعلي
+    - uₙ: معدل البطالة الطبيعي
+    
+    **تفسير:**
+    - عندما تكون البطالة فوق الطبيعي → التضخم ينخفض
+    - عندما تكون البطالة تحت الطبيعي → التضخم يرتفع
+    ```
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
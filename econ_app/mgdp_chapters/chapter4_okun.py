@@ -0,0 +1,168 @@
+"""الفصل 4: قانون أوكون - العلاقة بين النمو والبطالة"""
+import streamlit as st
+
+from econ_app.analytics import okun_data, okun_fit, okun_scenarios_table
+from econ_app.chart_controls import client_mode
+from econ_app.charts import okun_scatter_figure, okun_figure, okun_slider_figure
+from econ_app.figure_cache import cached_figure
+from econ_app.lookup_grids import (
+    OKUN_G_STAR, OKUN_BETA, OKUN_U0, okun_scenarios_lookup, slider_values, slider_index
+)
+from econ_app.table_styles import styled_table, cell_contains
+
+# ألوان اتجاه البطالة في جدول السيناريوهات (الاستقرار أصفر افتراضياً)
+OKUN_STYLE_RULES = [
+    (cell_contains('ارتفاع'), 'background-color: #ffcccc', "🔴"),
+    (cell_contains('انخفاض'), 'background-color: #ccffcc', "🟢")
+]
+
+
+def render(uploaded_data, data_info):
+    """عرض الفصل 4: قانون أوكون"""
+    st.header("📈 الفصل 4: قانون أوكون - العلاقة بين النمو والبطالة")
+    
+    st.markdown("""
+    ## 🎯 الهدف التعليمي
+    فهم العلاقة العكسية بين النمو الاقتصادي والتغير في معدل البطالة كما صاغها آرثر أوكون.
+    """)
+    
+    # إذا كانت هناك بيانات حقيقية، استخدامها
+    if uploaded_data is not None and 'معدل_النمو_٪' in uploaded_data.columns and 'البطالة_٪' in uploaded_data.columns:
+        st.markdown('<div class="data-source">', unsafe_allow_html=True)
+        st.subheader("📊 تحليل بيانات النمو والبطالة الحقيقية")
+        
+        # تحليل قانون أوكون من البيانات (التغير في البطالة لكل سنة مكتملة)
+        df_analysis = okun_data(uploaded_data)
+        
+        # رسم العلاقة
+        fig_real_okun = cached_figure(okun_scatter_figure, df_analysis)
+        st.plotly_chart(fig_real_okun, use_container_width=True)
+        
+        # حساب معامل أوكون
+        okun = okun_fit(uploaded_data)
+        
+        if okun is not None:
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("معامل أوكون المقدر", f"{okun['okun_coefficient']:.3f}")
+            
+            with col2:
+                st.metric("قوة العلاقة (R²)", f"{okun['r_squared']:.3f}")
+            
+            with col3:
+                st.metric("معدل النمو الطبيعي المقدر", f"{okun['natural_growth']:.2f}%")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.subheader("📐 الصيغة الرياضية لقانون أوكون")
+    
+    st.markdown('<div class="formula-box">', unsafe_allow_html=True)
+    st.markdown("""
+    **الصيغة الأساسية:**
+    
+    ```
+    التغير في البطالة = -β × (النمو الفعلي - النمو الطبيعي)
+    
+    Δu = -β × (g - g*)
+    ```
+    
+    **حيث:**
+    - Δu: التغير في معدل البطالة (نقاط مئوية)
+    - β: معامل أوكون (عادة ≈ 0.5)
+    - g: معدل النمو الاقتصادي الفعلي (%)
+    - g*: معدل النمو الطبيعي (%)
+    
+    **تفسير:**
+    - إذا كان النمو = g* → البطالة مستقرة (Δu = 0)
+    - إذا كان النمو > g* → البطالة تنخفض (Δu < 0)
+    - إذا كان النمو < g* → البطالة ترتفع (Δu > 0)
+    ```
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # محاكاة تفاعلية
+    st.subheader("🔄 محاكاة تفاعلية لقانون أوكون")
+    
+    @st.fragment
+    def okun_simulation():
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            g_star = st.slider("معدل النمو الطبيعي (g*) %", value=2.2, **OKUN_G_STAR,
+                              help="معدل النمو الذي يحافظ على استقرار البطالة")
+        
+        with col2:
+            beta = st.slider("معامل أوكون (β)", value=0.5, **OKUN_BETA,
+                            help="كل 1% نمو فوق الطبيعي يخفض البطالة β نقطة")
+        
+        with col3:
+            u0 = st.slider("معدل البطالة الأولي %", value=9.1, **OKUN_U0,
+                          help="معدل البطالة في بداية الفترة")
+        
+        # إنشاء سيناريوهات مختلفة
+        st.markdown("### 📊 سيناريوهات النمو وتأثيرها على البطالة")
+        
+        # قراءة من جدول محسوب مسبقاً لكل تركيبة منزلقات بدل إعادة الحساب
+        scenarios = okun_scenarios_lookup(g_star, beta, u0)
+        df_scenarios = okun_scenarios_table(scenarios)
+        
+        # عرض النتائج في جدول
+        st.dataframe(
+            styled_table(
+                df_scenarios,
+                OKUN_STYLE_RULES,
+                subset=['اتجاه البطالة'],
+                default='background-color: #ffffcc',
+                default_marker="🟡"
+            ),
+            use_container_width=True
+        )
+        
+        # إنشاء مخطط تفاعلي
+        st.markdown("### 📈 تمثيل بياني لقانون أوكون")
+        
+        if client_mode("okun_client"):
+            # كل قيم β مضمنة في الرسم كإطارات، فيُحرَّك منزلق الرسم دون إعادة تشغيل
+            betas = slider_values(OKUN_BETA)
+            scenarios_by_beta = [okun_scenarios_lookup(g_star, b, u0) for b in betas]
+            fig_okun = cached_figure(
+                okun_slider_figure, g_star, betas, scenarios_by_beta, slider_index(OKUN_BETA, beta)
+            )
+        else:
+            fig_okun = cached_figure(okun_figure, g_star, beta, scenarios)
+        
+        st.plotly_chart(fig_okun, use_container_width=True)
+        
+        st.markdown("---")
+        
+        st.subheader("🎯 التطبيق العملي: تقدير معدل النمو المستهدف")
+        
+        st.markdown("""
+        **مثال تطبيقي:** إذا كانت البطالة الحالية 9% ونريد خفضها إلى 8% خلال سنة:
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            current_u = st.number_input("البطالة الحالية (%)", 1.0, 20.0, 9.0, 0.1)
+            target_u = st.number_input("البطالة المستهدفة (%)", 1.0, 20.0, 8.0, 0.1)
+            time_period = st.slider("الفترة الزمنية (سنوات)", 1, 5, 1)
+        
+        with col2:
+            # حساب النمو المطلوب
+            delta_u_target = (target_u - current_u) / time_period
+            required_growth = g_star - (delta_u_target / beta)
+            
+            st.metric("التغير المطلوب في البطالة سنوياً", f"{delta_u_target:.2f} نقطة")
+            st.metric("معدل النمو المطلوب سنوياً", f"{required_growth:.2f}%")
+            st.metric("الفرق عن النمو الطبيعي", f"{required_growth - g_star:+.2f}%")
+        
+        st.info("""
+        **تفسير النتائج:**
+        - لخفض البطالة من 9% إلى 8% خلال سنة واحدة:
+        - يجب تحقيق نمو اقتصادي قدره {:.2f}%
+        - هذا أعلى من معدل النمو الطبيعي ({:.1f}%) بمقدار {:.2f} نقطة مئوية
+        """.format(required_growth, g_star, required_growth - g_star))
+    
+    okun_simulation()
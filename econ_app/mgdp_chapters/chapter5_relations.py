@@ -0,0 +1,185 @@
+"""الفصل 5: العلاقات بين المتغيرات الاقتصادية"""
+import streamlit as st
+import pandas as pd
+
+from econ_app.analytics import POLICY_EFFECTS, is_favorable_effect
+from econ_app.charts import policy_figure
+from econ_app.figure_cache import cached_figure
+from econ_app.table_styles import styled_table, cell_equals, cell_contains
+
+# ألوان مصفوفة العلاقات: (شرط، نمط، رمز للجداول الكبيرة)
+MATRIX_STYLE_RULES = [
+    (cell_equals("+"), 'background-color: #d4edda; color: #155724;', "🟢"),
+    (cell_equals("-"), 'background-color: #f8d7da; color: #721c24;', "🔴"),
+    (cell_contains("قصيراً"), 'background-color: #fff3cd; color: #856404;', "🟡"),
+    (cell_equals(""), 'background-color: #f8f9fa;', "")
+]
+
+
+def render(uploaded_data, data_info):
+    """عرض الفصل 5: العلاقات الاقتصادية"""
+    st.header("🔄 الفصل 5: العلاقات بين المتغيرات الاقتصادية")
+    
+    st.markdown("""
+    ## 🎯 الهدف التعليمي
+    فهم العلاقات المتبادلة بين المتغيرات الاقتصادية الرئيسية وتأثير السياسات الاقتصادية.
+    """)
+    
+    st.subheader("📊 الشبكة الاقتصادية: التفاعلات المتبادلة")
+    
+    # إنشاء مصفوفة العلاقات
+    variables = ["النمو الاقتصادي", "التضخم", "البطالة", "سعر الفائدة", "الإنفاق الحكومي", "الصادرات"]
+    
+    # علاقات مبسطة
+    relationships = {
+        "النمو الاقتصادي": {"التضخم": "+", "البطالة": "-", "الصادرات": "+"},
+        "التضخم": {"النمو الاقتصادي": "+ قصيراً", "سعر الفائدة": "+", "البطالة": "- قصيراً"},
+        "البطالة": {"النمو الاقتصادي": "-", "التضخم": "- قصيراً", "الإنفاق الحكومي": "-"},
+        "سعر الفائدة": {"التضخم": "+", "النمو الاقتصادي": "-", "الصادرات": "-"},
+        "الإنفاق الحكومي": {"النمو الاقتصادي": "+", "التضخم": "+", "البطالة": "-"},
+        "الصادرات": {"النمو الاقتصادي": "+", "سعر الفائدة": "-"}
+    }
+    
+    # إنشاء مصفوفة العلاقات
+    matrix_data = []
+    for var1 in variables:
+        row = [var1]
+        for var2 in variables:
+            if var1 == var2:
+                row.append("-")
+            else:
+                rel = relationships.get(var1, {}).get(var2, "")
+                row.append(rel)
+        matrix_data.append(row)
+    
+    df_matrix = pd.DataFrame(matrix_data, columns=["المتغير"] + variables)
+    
+    # عرض مصفوفة العلاقات
+    st.markdown("### 🔗 مصفوفة العلاقات الاقتصادية")
+    
+    # تنسيق المصفوفة
+    st.dataframe(
+        styled_table(df_matrix, MATRIX_STYLE_RULES, subset=variables),
+        use_container_width=True,
+        height=400
+    )
+    
+    st.markdown("""
+    **مفتاح الألوان:**
+    - 🟢 **أخضر**: علاقة إيجابية (زيادة في أحدهما تؤدي إلى زيادة في الآخر)
+    - 🔴 **أحمر**: علاقة سلبية (زيادة في أحدهما تؤدي إلى انخفاض في الآخر)
+    - 🟡 **أصفر**: علاقة قصيرة الأجل فقط
+    """)
+    
+    st.markdown("---")
+    
+    st.subheader("🎯 تأثير السياسات الاقتصادية")
+    
+    @st.fragment
+    def policy_simulation():
+        # محاكاة تأثير السياسات
+        policy_type = st.selectbox(
+            "اختر نوع السياسة الاقتصادية:",
+            [
+                "سياسة مالية توسعية",
+                "سياسة مالية انكماشية", 
+                "سياسة نقدية توسعية",
+                "سياسة نقدية انكماشية",
+                "سياسة تجارية توسعية",
+                "سياسة إصلاح سوق العمل"
+            ]
+        )
+        
+        selected_policy = POLICY_EFFECTS[policy_type]
+        
+        # عرض تأثيرات السياسة
+        st.markdown(f"### 📋 تأثيرات {policy_type}")
+        st.info(f"**وصف السياسة:** {selected_policy['description']}")
+        
+        # عرض المؤشرات
+        effects = selected_policy['effects']
+        
+        cols = st.columns(len(effects))
+        
+        for idx, (indicator, effect) in enumerate(effects.items()):
+            with cols[idx]:
+                delta_color = "inverse" if indicator in ["البطالة", "العجز الحكومي"] else "normal"
+                st.metric(
+                    label=indicator,
+                    value=f"{effect:+.1f}%" if indicator != "البطالة" else f"{effect:+.1f} نقطة",
+                    delta=f"تأثير مباشر" if effect != 0 else "لا تأثير",
+                    delta_color="normal" if is_favorable_effect(indicator, effect) else "inverse"
+                )
+        
+        # مخطط تأثيرات السياسة
+        st.markdown("### 📊 تمثيل بياني لتأثيرات السياسة")
+        
+        fig_policy = cached_figure(policy_figure, policy_type, effects)
+        
+        st.plotly_chart(fig_policy, use_container_width=True)
+    
+    policy_simulation()
+    
+    st.markdown("---")
+    
+    st.subheader("🔄 محاكاة التفاعلات الاقتصادية")
+    
+    # محاكاة تفاعلية للعلاقات
+    st.markdown("### 🎮 محاكاة تفاعلية للعلاقات الاقتصادية")
+    
+    @st.fragment
+    def interactions_simulation():
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            initial_growth = st.slider("النمو الاقتصادي الأولي (%)", -2.0, 6.0, 2.0, 0.1)
+            initial_inflation = st.slider("التضخم الأولي (%)", 0.0, 10.0, 2.0, 0.1)
+        
+        with col2:
+            initial_unemployment = st.slider("البطالة الأولية (%)", 3.0, 15.0, 8.0, 0.1)
+            interest_rate = st.slider("سعر الفائدة (%)", 0.0, 8.0, 3.0, 0.1)
+        
+        # محاكاة التفاعلات
+        st.markdown("#### 📈 نتائج المحاكاة بعد سنة:")
+        
+        # محاكاة مبسطة للتفاعلات
+        # النمو يتأثر بالتضخم (منحنى فيليبس عكسي) وسعر الفائدة
+        growth_effect = 2.0 + 0.3 * (initial_inflation - 2) - 0.2 * (interest_rate - 3)
+        
+        # التضخم يتأثر بالنمو (منحنى فيليبس) والبطالة
+        inflation_effect = 2.0 + 0.5 * (initial_growth - 2) - 0.3 * (initial_unemployment - 6)
+        
+        # البطالة تتأثر بالنمو (قانون أوكون)
+        unemployment_effect = initial_unemployment - 0.5 * (growth_effect - 2)
+        
+        # سعر الفائدة يتأثر بالتضخم (قاعدة تايلور)
+        interest_effect = 2.0 + 0.5 * (inflation_effect - 2) + 0.5 * (growth_effect - 2)
+        
+        results_cols = st.columns(4)
+        
+        with results_cols[0]:
+            st.metric("النمو الاقتصادي", f"{growth_effect:.1f}%", 
+                     f"{growth_effect - initial_growth:+.1f}%")
+        
+        with results_cols[1]:
+            st.metric("التضخم", f"{inflation_effect:.1f}%", 
+                     f"{inflation_effect - initial_inflation:+.1f}%")
+        
+        with results_cols[2]:
+            st.metric("البطالة", f"{unemployment_effect:.1f}%", 
+                     f"{unemployment_effect - initial_unemployment:+.1f} نقطة")
+        
+        with results_cols[3]:
+            st.metric("سعر الفائدة", f"{interest_effect:.1f}%", 
+                     f"{interest_effect - interest_rate:+.1f}%")
+        
+        st.info("""
+        **ملاحظة:** هذه محاكاة مبسطة تعتمد على:
+        1. قانون أوكون (العلاقة بين النمو والبطالة)
+        2. منحنى فيليبس (العلاقة بين التضخم والبطالة)
+        3. قاعدة تايلور (تحديد سعر الفائدة)
+        
+        في الواقع، التفاعلات أكثر تعقيداً وتتأثر بالعديد من العوامل الأخرى.
+        """)
+    
+    interactions_simulation()
@@ -0,0 +1,549 @@
+"""التمارين العملية في الاقتصاد الكلي"""
+import streamlit as st
+import numpy as np
+
+from econ_app import formulas
+from econ_app.data_viewer import render_paged_dataframe, dataset_key
+from econ_app.report_export import (
+    XLSX_MIME, STREAMING_EXPORT_ROWS, REPORT_VERSION, build_excel_report
+)
+from econ_app.artifact_cache import artifact_key, get_or_build_artifact, load_artifact, lookup_artifact
+from econ_app.data_export import EXPORT_FORMATS
+from econ_app.figure_cache import cached_figure
+from econ_app.charts import relationship_figure
+from econ_app.trendlines import TRENDLINE_METHODS, trendline_points
+from econ_app.analytics import dataset_statistics
+from econ_app.jobs import run_job
+from econ_app.shared_data import shared_upload
+
+
+def render(uploaded_data, data_info):
+    """عرض قسم التمارين العملية"""
+    st.header("🎯 التمارين العملية في الاقتصاد الكلي")
+    
+    st.markdown("""
+    ## 📝 تمارين تطبيقية بناءً على منهجية الكتاب
+    
+    اختر التمرين الذي تريد حله:
+    """)
+    
+    exercise = st.selectbox(
+        "اختر التمرين:",
+        [
+            "تمرين 1: حساب الناتج المحلي بطرق مختلفة",
+            "تمرين 2: تحليل التضخم والبطالة", 
+            "تمرين 3: تطبيق قانون أوكون",
+            "تمرين 4: تحليل تأثير السياسات",
+            "تمرين 5: تحميل وتحليل بيانات حقيقية"
+        ]
+    )
+    
+    if exercise == "تمرين 1: حساب الناتج المحلي بطرق مختلفة":
+        st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+        st.subheader("تمرين 1: حساب الناتج المحلي بطرق مختلفة")
+        
+        st.markdown("""
+        **البيانات:**
+        
+        افترض اقتصاداً بسيطاً يتكون من ثلاث وحدات إنتاجية:
+        
+        1. **الزراعة**: تنتج قمحاً بقيمة 500 مليون يورو
+        2. **المطاحن**: تشتري كل القمح وتنتج دقيقاً بقيمة 800 مليون يورو
+        3. **المخابز**: تشتري كل الدقيق وتنتج خبزاً بقيمة 1200 مليون يورو
+        
+        **المعلومات الإضافية:**
+        - الأجور المدفوعة: الزراعة 150، المطاحن 200، المخابز 300 مليون يورو
+        - الأرباح: الزراعة 350، المطاحن 600، المخابز 900 مليون يورو
+        
+        **المطلوب:**
+        1. حساب الناتج المحلي بطريقة الإنتاج (القيمة المضافة)
+        2. حساب الناتج المحلي بطريقة الإنفاق
+        3. حساب الناتج المحلي بطريقة الدخل
+        4. التحقق من تطابق النتائج
+        """)
+        
+        # حل تفاعلي
+        st.markdown("---")
+        st.subheader("🧮 الحل التفاعلي")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### طريقة الإنتاج (القيمة المضافة)")
+            
+            # حساب القيم المضافة
+            st.markdown("**الزراعة:**")
+            st.latex(r"500 - 0 = 500")
+            
+            st.markdown("**المطاحن:**")
+            st.latex(r"800 - 500 = 300")
+            
+            st.markdown("**المخابز:**")
+            st.latex(r"1200 - 800 = 400")
+            
+            total_value_added = 500 + 300 + 400
+            st.metric("إجمالي القيمة المضافة", f"{total_value_added} مليون يورو")
+        
+        with col2:
+            st.markdown("### طريقة الدخل")
+            
+            # حساب إجمالي الدخل
+            st.markdown("**الأجور:**")
+            st.latex(r"150 + 200 + 300 = 650")
+            
+            st.markdown("**الأرباح:**")
+            st.latex(r"350 + 600 + 900 = 1850")
+            
+            total_income = 650 + 1850
+            st.metric("إجمالي الدخل", f"{total_income} مليون يورو")
+        
+        st.markdown("### طريقة الإنفاق")
+        st.markdown("""
+        في هذا الاقتصاد المبسط، السلعة النهائية الوحيدة هي الخبز:
+        
+        """)
+        st.latex(r"1200 = C + I + G + (X - M)")
+        st.metric("قيمة السلع النهائية", "1200 مليون يورو")
+        
+        # التحقق من تطابق النتائج
+        st.markdown("---")
+        st.subheader("✅ التحقق من تطابق النتائج")
+        
+        check_cols = st.columns(3)
+        
+        with check_cols[0]:
+            st.metric("طريقة الإنتاج", f"{total_value_added} مليون")
+        
+        with check_cols[1]:
+            st.metric("طريقة الدخل", f"{total_income} مليون")
+        
+        with check_cols[2]:
+            st.success("✅ النتائج متطابقة!")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif exercise == "تمرين 2: تحليل التضخم والبطالة":
+        st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+        st.subheader("تمرين 2: تحليل التضخم والبطالة")
+        
+        st.markdown("""
+        **البيانات:**
+        
+        سلة استهلاكية تحتوي على:
+        
+        | السلعة | الكمية | سعر سنة الأساس | سعر السنة الحالية |
+        |---------|--------|----------------|-------------------|
+        | خبز     | 10 أرغفة | 1 يورو/رغيف | 1.2 يورو/رغيف |
+        | حليب    | 5 لترات | 0.8 يورو/لتر | 1.0 يورو/لتر |
+        | لحوم    | 2 كجم   | 15 يورو/كجم | 18 يورو/كجم |
+        
+        **سوق العمل:**
+        - السكان في سن العمل: 50 مليون
+        - المشتغلين: 22 مليون
+        - العاطلين: 3 مليون
+        
+        **المطلوب:**
+        1. حساب مؤشر الأسعار
+        2. حساب معدل التضخم
+        3. حساب معدل البطالة
+        4. حساب معدل المشاركة
+        """)
+        
+        # حل تفاعلي
+        st.markdown("---")
+        st.subheader("🧮 الحل التفاعلي")
+        
+        # إدخال البيانات
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### حساب التضخم")
+            
+            # السلة: الكميات وأسعار سنة الأساس والسنة الحالية
+            quantities = [10, 5, 2]
+            prices_base = [1, 0.8, 15]
+            prices_current = [1.2, 1.0, 18]
+            
+            st.markdown("**تكلفة السلة سنة الأساس:**")
+            st.latex(r"(10 \times 1) + (5 \times 0.8) + (2 \times 15) = 44 \, \text{يورو}")
+            
+            st.markdown("**تكلفة السلة السنة الحالية:**")
+            st.latex(r"(10 \times 1.2) + (5 \times 1.0) + (2 \times 18) = 53 \, \text{يورو}")
+            
+            # مؤشر الأسعار
+            price_index = formulas.cpi_laspeyres(prices_current, prices_base, quantities)
+            inflation = formulas.inflation_rate(price_index, 100)
+            
+            st.metric("مؤشر الأسعار", f"{price_index:.1f}")
+            st.metric("معدل التضخم", f"{inflation:.1f}%")
+        
+        with col2:
+            st.markdown("### حساب مؤشرات سوق العمل")
+            
+            # البيانات
+            working_age = 50
+            employed = 22
+            unemployed = 3
+            
+            # الحسابات
+            labor_force = employed + unemployed
+            unemployment_rate = formulas.unemployment_rate(unemployed, employed)
+            participation_rate = formulas.participation_rate(labor_force, working_age)
+            
+            st.markdown("**القوى العاملة:**")
+            st.latex(r"22 + 3 = 25 \, \text{مليون}")
+            
+            st.markdown("**معدل البطالة:**")
+            st.latex(r"\frac{3}{25} \times 100 = 12\%")
+            
+            st.markdown("**معدل المشاركة:**")
+            st.latex(r"\frac{25}{50} \times 100 = 50\%")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif exercise == "تمرين 3: تطبيق قانون أوكون":
+        st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+        st.subheader("تمرين 3: تطبيق قانون أوكون")
+        
+        st.markdown("""
+        **البيانات:**
+        
+        بلد لديه المعطيات التالية:
+        - معدل البطالة الأولي: 9.5%
+        - معدل النمو الطبيعي: 2.2%
+        - معامل أوكون: 0.5
+        
+        **المطلوب:**
+        
+        1. إذا حقق النمو 3.5%، كم سيكون معدل البطالة الجديد؟
+        2. إذا كان المستهدف خفض البطالة إلى 8% خلال سنة، ما هو معدل النمو المطلوب؟
+        3. إذا انخفض النمو إلى 1%، كم سترتفع البطالة؟
+        """)
+        
+        # حل تفاعلي
+        st.markdown("---")
+        st.subheader("🧮 الحل التفاعلي")
+        
+        # المعطيات
+        u0 = 9.5
+        g_star = 2.2
+        beta = 0.5
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**الجزء 1: النمو = 3.5%**")
+            g1 = 3.5
+            delta_u1 = -beta * (g1 - g_star)
+            u1 = u0 + delta_u1
+            
+            st.markdown(f"""
+            ```
+            Δu = -0.5 × (3.5 - 2.2) = -0.65 نقطة
+            البطالة الجديدة = 9.5 - 0.65 = {u1:.2f}%
+            ```
+            """)
+        
+        with col2:
+            st.markdown("**الجزء 2: خفض البطالة إلى 8%**")
+            u_target = 8.0
+            delta_u_target = u_target - u0
+            g_required = g_star - (delta_u_target / beta)
+            
+            st.markdown(f"""
+            ```
+            Δu المستهدف = 8.0 - 9.5 = -1.5 نقطة
+            النمو المطلوب = 2.2 - (-1.5/0.5) = 5.2%
+            ```
+            """)
+        
+        with col3:
+            st.markdown("**الجزء 3: النمو = 1%**")
+            g3 = 1.0
+            delta_u3 = -beta * (g3 - g_star)
+            u3 = u0 + delta_u3
+            
+            st.markdown(f"""
+            ```
+            Δu = -0.5 × (1.0 - 2.2) = +0.6 نقطة
+            البطالة الجديدة = 9.5 + 0.6 = {u3:.2f}%
+            ```
+            """)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif exercise == "تمرين 4: تحليل تأثير السياسات":
+        st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+        st.subheader("تمرين 4: تحليل تأثير السياسات")
+        
+        st.markdown("""
+        **السيناريو:**
+        
+        اقتصاد يواجه الركود مع:
+        - النمو الحالي: -1.5%
+        - البطالة: 10%
+        - التضخم: 1.2%
+        
+        **المطلوب:**
+        
+        قم بتحليل تأثير السياسات التالية:
+        
+        1. **السياسة المالية التوسعية**: زيادة الإنفاق الحكومي بـ 100 مليار يورو
+        2. **السياسة النقدية التوسعية**: خفض سعر الفائدة بمقدار 2 نقطة مئوية
+        
+        **افترض أن:**
+        - مضاعف الإنفاق = 1.5
+        - معامل أوكون = 0.5
+        - معدل النمو الطبيعي = 2.2%
+        """)
+        
+        # حل تفاعلي
+        st.markdown("---")
+        st.subheader("🧮 الحل التفاعلي")
+        
+        # البيانات الأولية
+        initial_data = {
+            "النمو": -1.5,
+            "البطالة": 10.0,
+            "التضخم": 1.2
+        }
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### السياسة المالية التوسعية")
+            
+            # تأثير السياسة المالية
+            gov_spending = 100
+            multiplier = 1.5
+            g_star = 2.2
+            beta = 0.5
+            
+            # التأثير على النمو
+            growth_effect_fiscal = (gov_spending * multiplier) / 1000  # مقارنة بالناتج المحلي
+            new_growth_fiscal = initial_data["النمو"] + growth_effect_fiscal
+            
+            # التأثير على البطالة (قانون أوكون)
+            delta_u_fiscal = -beta * (new_growth_fiscal - g_star)
+            new_unemployment_fiscal = initial_data["البطالة"] + delta_u_fiscal
+            
+            # التأثير على التضخم (منحنى فيليبس مبسط)
+            inflation_effect_fiscal = 0.3 * growth_effect_fiscal
+            new_inflation_fiscal = initial_data["التضخم"] + inflation_effect_fiscal
+            
+            st.metric("النمو الجديد", f"{new_growth_fiscal:.1f}%", 
+                     f"{growth_effect_fiscal:+.1f}%")
+            st.metric("البطالة الجديدة", f"{new_unemployment_fiscal:.1f}%", 
+                     f"{delta_u_fiscal:+.2f} نقطة")
+            st.metric("التضخم الجديد", f"{new_inflation_fiscal:.1f}%", 
+                     f"{inflation_effect_fiscal:+.1f}%")
+        
+        with col2:
+            st.markdown("### السياسة النقدية التوسعية")
+            
+            # تأثير السياسة النقدية
+            interest_cut = 2.0
+            
+            # التأثير على النمو (قاعدة مبسطة)
+            growth_effect_monetary = 0.5 * interest_cut
+            new_growth_monetary = initial_data["النمو"] + growth_effect_monetary
+            
+            # التأثير على البطالة
+            delta_u_monetary = -beta * (new_growth_monetary - g_star)
+            new_unemployment_monetary = initial_data["البطالة"] + delta_u_monetary
+            
+            # التأثير على التضخم
+            inflation_effect_monetary = 0.2 * interest_cut
+            new_inflation_monetary = initial_data["التضخم"] + inflation_effect_monetary
+            
+            st.metric("النمو الجديد", f"{new_growth_monetary:.1f}%", 
+                     f"{growth_effect_monetary:+.1f}%")
+            st.metric("البطالة الجديدة", f"{new_unemployment_monetary:.1f}%", 
+                     f"{delta_u_monetary:+.2f} نقطة")
+            st.metric("التضخم الجديد", f"{new_inflation_monetary:.1f}%", 
+                     f"{inflation_effect_monetary:+.1f}%")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif exercise == "تمرين 5: تحميل وتحليل بيانات حقيقية":
+        st.markdown('<div class="exercise-box">', unsafe_allow_html=True)
+        st.subheader("تمرين 5: تحميل وتحليل بيانات حقيقية")
+        
+        st.markdown("""
+        **المطلوب:**
+        
+        1. قم بتحميل ملف بيانات اقتصادية (Excel أو CSV)
+        2. قم بالتحليل الإحصائي الأساسي
+        3. ارسم العلاقات بين المتغيرات الرئيسية
+        4. قدم استنتاجاتك
+        """)
+        
+        # تحميل البيانات
+        st.markdown("---")
+        st.subheader("📥 تحميل البيانات")
+        
+        uploaded_file = st.file_uploader(
+            "اختر ملف بيانات اقتصادية",
+            type=['xlsx', 'xls', 'csv']
+        )
+        
+        if uploaded_file is not None:
+            try:
+                # الملف يُحلَّل مرة واحدة لكل محتوى ويبقى نفس الكائن بين إعادات التشغيل، فتُصيب
+                # بصمة dataset_key والفهارس والرسوم المخزنة مؤقتاً عند كل تفاعل
+                file_type = "CSV" if uploaded_file.name.endswith('.csv') else "Excel"
+                df = shared_upload(uploaded_file, file_type)
+                
+                st.success(f"✅ تم تحميل {len(df)} صف و {len(df.columns)} عمود")
+                
+                # عرض البيانات
+                with st.expander("👁️ عرض البيانات"):
+                    render_paged_dataframe(df, key="ex5_data")
+                
+                # التحليل الإحصائي
+                st.markdown("---")
+                st.subheader("📊 التحليل الإحصائي")
+                
+                # الزر يضبط علامة في session_state حتى يبقى التحليل ومحدداته ظاهرة بعد أول نقرة
+                # (تغيير المتغيرات أو خط الاتجاه يعيد التشغيل والزر عندها False)
+                if st.button("إجراء التحليل الإحصائي"):
+                    st.session_state["ex5_analysed"] = dataset_key(df)
+                
+                statistics = None
+                if st.session_state.get("ex5_analysed") == dataset_key(df):
+                    # الملفات الكبيرة تُحلل في مجمع العمليات المشترك (خارج خيط السكربت) مع شريط تقدم،
+                    # كمهمة دفعية تتأخر في الطابور عن خطوط الاتجاه التفاعلية للجلسات الأخرى
+                    statistics = run_job(
+                        "ex5_statistics", dataset_statistics, df,
+                        rows=len(df), batch=True, label="جارٍ حساب الإحصائيات..."
+                    )
+                    
+                    # إحصائيات وصفية
+                    st.markdown("### الإحصائيات الوصفية")
+                    st.dataframe(statistics["describe"])
+                    
+                    # تحليل المتغيرات الرقمية
+                    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+                    
+                    if numeric_cols:
+                        st.markdown("### العلاقات بين المتغيرات")
+                        
+                        # اختيار متغيرين للتحليل
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            x_var = st.selectbox("اختر المتغير الأول (X)", numeric_cols, key="ex5_x")
+                        
+                        with col2:
+                            y_var = st.selectbox(
+                                "اختر المتغير الثاني (Y)", numeric_cols,
+                                index=min(1, len(numeric_cols) - 1), key="ex5_y"
+                            )
+                        
+                        # رسم العلاقة
+                        if x_var != y_var:
+                            trendline_label = st.radio(
+                                "خط الاتجاه",
+                                list(TRENDLINE_METHODS),
+                                horizontal=True,
+                                key="ex5_trendline"
+                            )
+                            trendline_method = TRENDLINE_METHODS[trendline_label]
+                            # تغيير الطريقة أثناء الحساب يلغي المهمة السابقة في نفس الخانة
+                            trendline_line = run_job(
+                                "ex5_trendline", trendline_points,
+                                df[x_var].to_numpy(), df[y_var].to_numpy(), trendline_method,
+                                rows=len(df), label="جارٍ حساب خط الاتجاه..."
+                            )
+                            fig_scatter = cached_figure(
+                                relationship_figure, df, x_var, y_var, trendline_method, trendline_line
+                            )
+                            st.plotly_chart(fig_scatter, use_container_width=True)
+                            
+                            # حساب معامل الارتباط
+                            correlation = statistics["corr"].loc[x_var, y_var]
+                            st.metric("معامل الارتباط", f"{correlation:.3f}")
+                            
+                            # تفسير معامل الارتباط
+                            if abs(correlation) > 0.7:
+                                strength = "قوي"
+                            elif abs(correlation) > 0.3:
+                                strength = "متوسط"
+                            else:
+                                strength = "ضعيف"
+                            
+                            direction = "إيجابي" if correlation > 0 else "سلبي"
+                            st.info(f"العلاقة {strength} و {direction}")
+                
+                # التصدير
+                st.markdown("---")
+                st.subheader("💾 تصدير التحليل")
+                
+                excel_report_label = "Excel - تقرير كامل (.xlsx)"
+                export_choice = st.selectbox(
+                    "صيغة التصدير",
+                    [excel_report_label] + list(EXPORT_FORMATS),
+                    help="Parquet و Arrow و CSV المضغوط أسرع بكثير في الكتابة والقراءة من Excel"
+                )
+                
+                # الملفات مخزنة على القرص حسب بصمة البيانات، فيُعاد استخدامها بين المستخدمين وإعادات التشغيل
+                if export_choice == excel_report_label:
+                    streaming_export = st.checkbox(
+                        "وضع التصدير المتدفق (ذاكرة ثابتة للملفات الكبيرة)",
+                        value=len(df) >= STREAMING_EXPORT_ROWS,
+                        help="يكتب الصفوف تدريجياً في ملف مؤقت على القرص بدلاً من بناء المصنف كاملاً في الذاكرة"
+                    )
+                    
+                    export_suffix = ".xlsx"
+                    export_mime = XLSX_MIME
+                    export_file_name = "التحليل_الاقتصادي.xlsx"
+                    export_key = artifact_key(
+                        dataset_key(df),
+                        "xlsx",
+                        version=REPORT_VERSION,
+                        sheets=["raw", "describe", "corr"],
+                        streaming=streaming_export
+                    )
+                    
+                    def build_export(path):
+                        # نفس جداول مهمة التحليل (محفوظة في ذاكرة نتائج المجمع) بدل حسابها مرة ثانية
+                        tables = statistics if statistics is not None else dataset_statistics(df)
+                        return build_excel_report(
+                            df,
+                            path,
+                            describe=tables["describe"],
+                            corr=tables["corr"],
+                            streaming=streaming_export
+                        )
+                else:
+                    export_format = EXPORT_FORMATS[export_choice]
+                    
+                    export_suffix = export_format["suffix"]
+                    export_mime = export_format["mime"]
+                    export_file_name = f"البيانات_الاقتصادية{export_suffix}"
+                    export_key = artifact_key(dataset_key(df), export_format["kind"])
+                    
+                    def build_export(path):
+                        return export_format["writer"](df, path)
+                
+                # إعادة التشغيل تتحقق من وجود الملف فقط؛ محتواه يُقرأ عند نقر زر التنزيل (ويُعاد
+                # بناؤه إن حذفته جلسة أخرى من الذاكرة المؤقتة في الأثناء)
+                export_ready = lookup_artifact(export_key, export_suffix) is not None
+                
+                if not export_ready and st.button("تصدير التحليل"):
+                    with st.spinner("جارٍ إنشاء الملف..."):
+                        get_or_build_artifact(export_key, export_suffix, build_export)
+                    export_ready = True
+                
+                if export_ready:
+                    st.download_button(
+                        label=f"📥 تنزيل الملف ({export_choice})",
+                        data=lambda: load_artifact(export_key, export_suffix, build_export),
+                        file_name=export_file_name,
+                        mime=export_mime
+                    )
+            
+            except Exception as e:
+                st.error(f"خطأ في تحليل البيانات: {str(e)}")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
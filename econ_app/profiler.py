@@ -0,0 +1,269 @@
+"""قياس زمن كل قسم من إعادة التشغيل وحجم العناصر المرسلة إلى المتصفح، مع تصدير بصيغة Prometheus"""
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+
+# التفعيل: ECON_APP_PROFILE=1، أو ملف مقاييس، أو لوحة التصحيح في الشريط الجانبي
+METRICS_FILE = os.environ.get("ECON_APP_METRICS_FILE")
+METRICS_INTERVAL_S = float(os.environ.get("ECON_APP_METRICS_INTERVAL_S", "10"))
+PROFILE_SIDEBAR = os.environ.get("ECON_APP_PROFILE_SIDEBAR", "0") == "1"
+PROFILE_ENABLED = os.environ.get("ECON_APP_PROFILE", "0") == "1" or bool(METRICS_FILE) or PROFILE_SIDEBAR
+
+# عدد القياسات المحفوظة لكل قسم لحساب المئينات
+SAMPLES_PER_SECTION = 1000
+
+# إصدارات Streamlit التي اختُبر عليها قياس حجم الرسائل (يعتمد على ScriptRunContext._enqueue الداخلية)
+PAYLOAD_HOOK_VERSIONS = ((1, 37), (1, 66))
+QUANTILES = (0.5, 0.9, 0.99)
+
+_lock = threading.Lock()
+_durations = defaultdict(lambda: deque(maxlen=SAMPLES_PER_SECTION))
+_payloads = defaultdict(lambda: deque(maxlen=SAMPLES_PER_SECTION))
+_run_counts = defaultdict(int)
+_last_runs = {}
+_last_export = 0.0
+_run = threading.local()
+
+
+# ========== حجم العناصر المرسلة ==========
+def _element_type(msg):
+    """نوع العنصر في رسالة Streamlit (plotly_chart، arrow_data_frame، markdown، ...)"""
+    if msg.WhichOneof("type") != "delta":
+        return None
+    delta = msg.delta
+    if delta.WhichOneof("type") == "new_element":
+        return delta.new_element.WhichOneof("type")
+    return delta.WhichOneof("type")
+
+
+def _record_message(msg):
+    run = getattr(_run, "state", None)
+    if run is None:
+        return
+    element = _element_type(msg)
+    if element is None:
+        return
+
+    # الرسائل تُجمع حتى العلامة التالية التي تسمّي القسم الذي أرسلها
+    run["pending"][element] = run["pending"].get(element, 0) + msg.ByteSize()
+
+
+def payload_hook_supported():
+    """هل إصدار Streamlit المثبت ضمن PAYLOAD_HOOK_VERSIONS؟ (خارجها لا تُقاس الأحجام)"""
+    try:
+        import streamlit
+    except ImportError:
+        return False
+
+    try:
+        version = tuple(int(part) for part in streamlit.__version__.split(".")[:2])
+    except ValueError:
+        return False
+    low, high = PAYLOAD_HOOK_VERSIONS
+    return low <= version <= high
+
+
+def _install_payload_hook():
+    """تغليف دالة الإرسال في سياق التشغيل الحالي لقياس حجم كل رسالة (مرة واحدة لكل جلسة)
+
+    _enqueue واجهة داخلية في Streamlit، فالتغليف يُفعّل فقط في الإصدارات المختبرة ولا يفعل شيئاً
+    خارجها (الأزمنة تبقى مقاسة). إعادة تشغيل st.fragment وحده لا تمر بـ begin_run، فرسائلها
+    لا تُحسب في أي قسم: الأحجام تغطي إعادات التشغيل الكاملة فقط.
+    """
+    if not payload_hook_supported():
+        return
+
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return
+
+    ctx = get_script_run_ctx()
+    if ctx is None or getattr(ctx, "_econ_app_profiled", False) or not hasattr(ctx, "_enqueue"):
+        return
+
+    original = ctx._enqueue
+
+    def enqueue(msg):
+        _record_message(msg)
+        original(msg)
+
+    ctx._enqueue = enqueue
+    ctx._econ_app_profiled = True
+
+
+# ========== أقسام التشغيل ==========
+def begin_run(app):
+    """بداية إعادة تشغيل السكربت app"""
+    if not PROFILE_ENABLED:
+        return
+
+    now = time.perf_counter()
+    _run.state = {
+        "app": app,
+        "started": now,
+        "last": now,
+        "sections": [],
+        "pending": {},
+        "payloads": {}
+    }
+    _install_payload_hook()
+
+
+def mark(section):
+    """نهاية القسم section (الزمن منذ العلامة السابقة) وبداية القسم التالي"""
+    run = getattr(_run, "state", None)
+    if run is None:
+        return
+
+    now = time.perf_counter()
+    run["sections"].append((section, now - run["last"]))
+    run["last"] = now
+
+    for element, size in run["pending"].items():
+        run["payloads"][(section, element)] = run["payloads"].get((section, element), 0) + size
+    run["pending"] = {}
+
+
+def end_run():
+    """نهاية إعادة التشغيل: حفظ الأزمنة والأحجام وكتابة ملف المقاييس عند الحاجة"""
+    run = getattr(_run, "state", None)
+    if run is None:
+        return None
+    # رسائل ما بعد آخر علامة (التذييل مثلاً)
+    if run["pending"]:
+        mark("end")
+    _run.state = None
+
+    total = time.perf_counter() - run["started"]
+    payloads = run["payloads"]
+
+    with _lock:
+        app = run["app"]
+        _run_counts[app] += 1
+        _durations[(app, "total")].append(total)
+        for section, seconds in run["sections"]:
+            _durations[(app, section)].append(seconds)
+        for (section, element), size in payloads.items():
+            _payloads[(app, section, element)].append(size)
+        _last_runs[app] = {"total": total, "sections": run["sections"], "payloads": dict(payloads)}
+
+    if METRICS_FILE:
+        _maybe_export()
+    return _last_runs[app]
+
+
+# ========== التصدير ==========
+def _quantile(values, q):
+    ordered = sorted(values)
+    position = q * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+def _summary_lines(name, samples):
+    lines = []
+    for labels, values in samples:
+        if not values:
+            continue
+        for q in QUANTILES:
+            lines.append(f"{name}{{{_labels(**labels, quantile=q)}}} {_quantile(values, q):.6g}")
+        lines.append(f"{name}_sum{{{_labels(**labels)}}} {sum(values):.6g}")
+        lines.append(f"{name}_count{{{_labels(**labels)}}} {len(values)}")
+    return lines
+
+
+def prometheus_text():
+    """المقاييس بصيغة Prometheus النصية (مئينات آخر القياسات لكل قسم)"""
+    with _lock:
+        durations = [({"app": app, "section": section}, list(values))
+                     for (app, section), values in sorted(_durations.items())]
+        payloads = [({"app": app, "section": section, "element": element}, list(values))
+                    for (app, section, element), values in sorted(_payloads.items())]
+        runs = sorted(_run_counts.items())
+
+    lines = [
+        "# HELP econ_app_section_seconds زمن كل قسم من إعادة التشغيل",
+        "# TYPE econ_app_section_seconds summary",
+        *_summary_lines("econ_app_section_seconds", durations),
+        "# HELP econ_app_payload_bytes حجم العناصر المرسلة إلى المتصفح لكل قسم ونوع عنصر",
+        "# TYPE econ_app_payload_bytes summary",
+        *_summary_lines("econ_app_payload_bytes", payloads),
+        "# HELP econ_app_runs_total عدد إعادات التشغيل",
+        "# TYPE econ_app_runs_total counter",
+        *(f"econ_app_runs_total{{{_labels(app=app)}}} {count}" for app, count in runs)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _maybe_export():
+    global _last_export
+
+    now = time.monotonic()
+    with _lock:
+        if now - _last_export < METRICS_INTERVAL_S:
+            return
+        _last_export = now
+
+    export_metrics(METRICS_FILE)
+
+
+def export_metrics(path):
+    """كتابة المقاييس في ملف (كتابة ذرية يقرأها node_exporter textfile أو أي جامع آخر)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    with os.fdopen(fd, "w", encoding="utf-8") as metrics_file:
+        metrics_file.write(prometheus_text())
+    os.replace(tmp_path, path)
+
+
+# ========== لوحة التصحيح ==========
+def render_profile(container, app):
+    """أزمنة الأقسام وأحجام العناصر في الشريط الجانبي (عند ECON_APP_PROFILE_SIDEBAR=1)"""
+    if not PROFILE_SIDEBAR:
+        return
+
+    import pandas as pd
+
+    with _lock:
+        last_run = _last_runs.get(app)
+        rows = [
+            {
+                "القسم": section,
+                "آخر تشغيل (مللي ث)": None,
+                "p50 (مللي ث)": _quantile(values, 0.5) * 1000,
+                "p90 (مللي ث)": _quantile(values, 0.9) * 1000,
+                "العينات": len(values)
+            }
+            for (run_app, section), values in _durations.items()
+            if run_app == app and values
+        ]
+
+    if last_run is None:
+        return
+
+    last_sections = dict(last_run["sections"], total=last_run["total"])
+    for row in rows:
+        seconds = last_sections.get(row["القسم"])
+        row["آخر تشغيل (مللي ث)"] = None if seconds is None else seconds * 1000
+
+    expander = container.expander("🐞 زمن الأقسام وحجم البيانات المرسلة")
+    expander.dataframe(pd.DataFrame(rows).round(2), hide_index=True)
+
+    payload_rows = [
+        {"القسم": section, "العنصر": element, "الحجم (ك.ب)": size / 1024}
+        for (section, element), size in sorted(last_run["payloads"].items(), key=lambda item: -item[1])
+    ]
+    if payload_rows:
+        expander.dataframe(pd.DataFrame(payload_rows).round(1), hide_index=True)
+    elif not payload_hook_supported():
+        expander.caption("حجم البيانات المرسلة غير مقاس في إصدار Streamlit المثبت (انظر PAYLOAD_HOOK_VERSIONS)")
@@ -0,0 +1,83 @@
+"""تصدير تقارير التحليل إلى Excel بذاكرة ثابتة (كتابة متدفقة صفاً بصف)"""
+import numpy as np
+import pandas as pd
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# عدد الصفوف التي يبدأ عندها وضع التصدير المتدفق افتراضياً
+STREAMING_EXPORT_ROWS = 50_000
+EXPORT_CHUNK_ROWS = 10_000
+
+# يتغير عند تعديل محتوى التقرير حتى تُبطَل النسخ المخزنة القديمة
+REPORT_VERSION = 1
+
+SHEET_RAW = "البيانات الخام"
+SHEET_DESCRIBE = "الإحصائيات الوصفية"
+SHEET_CORR = "مصفوفة الارتباطات"
+
+
+def _clean_rows(frame):
+    """تحويل كتلة من DataFrame إلى صفوف قابلة للكتابة (القيم المفقودة → خلايا فارغة)"""
+    cleaned = frame.astype(object).where(frame.notna(), None)
+    return cleaned.itertuples(index=False, name=None)
+
+
+def _append_frame(ws, frame, index=False, chunk_rows=EXPORT_CHUNK_ROWS):
+    """كتابة DataFrame في ورقة write-only على دفعات"""
+    header = [str(c) for c in frame.columns]
+    ws.append(([""] if index else []) + header)
+
+    if index:
+        frame = frame.reset_index()
+
+    for start in range(0, len(frame), chunk_rows):
+        for row in _clean_rows(frame.iloc[start:start + chunk_rows]):
+            ws.append(row)
+
+
+def write_excel_report_streaming(df, path, describe=None, corr=None):
+    """كتابة تقرير التحليل في ملف XLSX بوضع write-only دون الاحتفاظ بالخلايا في الذاكرة"""
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+
+    _append_frame(wb.create_sheet(SHEET_RAW), df)
+
+    if describe is not None:
+        _append_frame(wb.create_sheet(SHEET_DESCRIBE), describe, index=True)
+
+    if corr is not None:
+        _append_frame(wb.create_sheet(SHEET_CORR), corr, index=True)
+
+    wb.save(path)
+    return path
+
+
+def analysis_tables(df, describe=None, corr=None):
+    """الجداول المشتقة للتقرير: الإحصائيات الوصفية ومصفوفة الارتباطات (تُحسب إن لم تُمرر)"""
+    if describe is None:
+        describe = df.describe()
+
+    if corr is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        corr = df[numeric_cols].corr()
+    if len(corr.columns) < 2:
+        corr = None
+
+    return describe, corr
+
+
+def build_excel_report(df, path, describe=None, streaming=True, corr=None):
+    """كتابة تقرير Excel في المسار المحدد (متدفقاً أو عبر pandas.ExcelWriter)"""
+    describe, corr = analysis_tables(df, describe, corr)
+
+    if streaming:
+        write_excel_report_streaming(df, path, describe, corr)
+    else:
+        with pd.ExcelWriter(path, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name=SHEET_RAW, index=False)
+            describe.to_excel(writer, sheet_name=SHEET_DESCRIBE)
+            if corr is not None:
+                corr.to_excel(writer, sheet_name=SHEET_CORR)
+
+    return path
@@ -0,0 +1,264 @@
+"""محاسبة ذاكرة الجلسات: حد أقصى عام، وإخراج الكائنات الأقدم استخداماً إلى القرص"""
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# الحد الأقصى لذاكرة جميع الجلسات، ومدة الخمول قبل حذف بيانات الجلسة، ومجلد الإخراج إلى القرص
+MEMORY_CAP_BYTES = int(float(os.environ.get("ECON_APP_SESSION_MEMORY_MB", "1024")) * 1024 * 1024)
+SESSION_IDLE_SECONDS = float(os.environ.get("ECON_APP_SESSION_IDLE_S", "3600"))
+SPILL_DIR = os.environ.get(
+    "ECON_APP_SPILL_DIR",
+    os.path.join(tempfile.gettempdir(), "econ_app_sessions")
+)
+
+_lock = threading.RLock()
+_sessions = {}
+
+
+# ========== حجم الكائنات ==========
+def object_size(value):
+    """تقدير حجم الكائن في الذاكرة بالبايت"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(object_size(k) + object_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(object_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def format_bytes(size):
+    """حجم مقروء (ك.ب / م.ب)"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} م.ب"
+    return f"{size / 1024:.1f} ك.ب"
+
+
+# ========== الجلسات ==========
+def current_session_id():
+    """معرّف جلسة Streamlit الحالية ("local" خارج التطبيق)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return "local"
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "local"
+
+
+def _session(session_id=None):
+    session_id = session_id or current_session_id()
+    session = _sessions.get(session_id)
+    if session is None:
+        session = {"last_seen": time.time(), "objects": OrderedDict()}
+        _sessions[session_id] = session
+    session["last_seen"] = time.time()
+    return session_id, session
+
+
+def _spill_path(session_id, key):
+    # اسم فريد لكل إخراج: كتابة متأخرة لإخراج قديم لا تمس ملف إخراج أحدث لنفس المفتاح
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(SPILL_DIR, session_id, f"{name}-{uuid.uuid4().hex[:8]}.pkl")
+
+
+def _write_spill(session_id, key, entry, value):
+    """كتابة قيمة مُخرجة إلى القرص (خارج القفل)؛ القيمة تبقى في entry["pending"] حتى تكتمل الكتابة"""
+    path = entry["path"]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as spill_file:
+        pickle.dump(value, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    with _lock:
+        session = _sessions.get(session_id)
+        current = session is not None and session["objects"].get(key) is entry and entry["path"] == path
+        if current:
+            entry["pending"] = None
+    if not current:
+        # استُرجع الكائن أو حُذف أثناء الكتابة
+        _remove_file(path)
+
+
+def _remove_file(path):
+    if path:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _drop_session(session_id):
+    _sessions.pop(session_id, None)
+    return os.path.join(SPILL_DIR, session_id)
+
+
+# ========== التخزين والاسترجاع ==========
+def remember(key, value, shared=False, size=None):
+    """حفظ كائن في ذاكرة الجلسة مع حسابه ضمن الحد العام
+
+    الكائنات المشتركة (shared) تُعرض في حجم الجلسة لكنها لا تُحتسب في الحد ولا تُخرج إلى القرص.
+    """
+    with _lock:
+        session_id, session = _session()
+        old = session["objects"].pop(key, None)
+
+        session["objects"][key] = {
+            "value": value,
+            "bytes": object_size(value) if size is None else size,
+            "shared": shared,
+            "last_used": time.time(),
+            "path": None,
+            "pending": None
+        }
+    _remove_file(old and old["path"])
+    enforce_cap()
+    return value
+
+
+def recall(key, default=None):
+    """استرجاع كائن من ذاكرة الجلسة (يُعاد تحميله من القرص إن كان قد أُخرج)
+
+    قراءة ملف الإخراج تتم خارج القفل، فلا يوقف قرص بطيء الجلسات الأخرى.
+    """
+    with _lock:
+        session_id, session = _session()
+        entry = session["objects"].get(key)
+        if entry is None:
+            return default
+        if entry["value"] is None and entry["pending"] is not None:
+            # الإخراج لم يكتمل بعد: القيمة ما زالت في الذاكرة
+            entry["value"], entry["pending"], entry["path"] = entry["pending"], None, None
+        path = entry["path"] if entry["value"] is None else None
+
+    if path:
+        try:
+            with open(path, "rb") as spill_file:
+                value = pickle.load(spill_file)
+        except FileNotFoundError:
+            # استرجاع متزامن من نفس الجلسة سبق إلى الملف
+            value = None
+
+        with _lock:
+            if entry["path"] == path:
+                entry["value"], entry["path"] = value, None
+            else:
+                path = None
+        _remove_file(path)
+
+    with _lock:
+        if session["objects"].get(key) is not entry:
+            return default
+        entry["last_used"] = time.time()
+        session["objects"].move_to_end(key)
+        value = entry["value"]
+    enforce_cap()
+    return value
+
+
+def forget(key):
+    """حذف كائن من ذاكرة الجلسة"""
+    with _lock:
+        _, session = _session()
+        entry = session["objects"].pop(key, None)
+    _remove_file(entry and entry["path"])
+
+
+def forget_everywhere(key):
+    """حذف كائن من ذاكرة كل الجلسات (مثلاً عروض ملف أُزيل من المخزن المشترك)"""
+    with _lock:
+        entries = [session["objects"].pop(key, None) for session in _sessions.values()]
+    for entry in entries:
+        _remove_file(entry and entry["path"])
+
+
+def enforce_cap(max_bytes=MEMORY_CAP_BYTES):
+    """حذف الجلسات الخاملة ثم إخراج الكائنات الأقدم استخداماً إلى القرص حتى يعود المجموع تحت الحد
+
+    الاختيار يتم تحت القفل، والكتابة إلى القرص وحذف مجلدات الجلسات بعده.
+    """
+    spills = []
+    with _lock:
+        now = time.time()
+        idle = [sid for sid, s in _sessions.items() if now - s["last_seen"] > SESSION_IDLE_SECONDS]
+        dropped = [_drop_session(session_id) for session_id in idle]
+
+        resident = [
+            (entry["last_used"], session_id, key, entry)
+            for session_id, session in _sessions.items()
+            for key, entry in session["objects"].items()
+            if entry["value"] is not None and not entry["shared"]
+        ]
+        total = sum(entry["bytes"] for *_, entry in resident)
+
+        for _, session_id, key, entry in sorted(resident, key=lambda item: item[0]):
+            if total <= max_bytes:
+                break
+            spills.append((session_id, key, entry, entry["value"]))
+            entry["value"], entry["pending"] = None, entry["value"]
+            entry["path"] = _spill_path(session_id, key)
+            total -= entry["bytes"]
+
+    for directory in dropped:
+        shutil.rmtree(directory, ignore_errors=True)
+    for spill in spills:
+        _write_spill(*spill)
+
+
+# ========== التقارير ==========
+def session_footprint(session_id=None):
+    """حجم ذاكرة الجلسة: في الذاكرة، على القرص، ومشترك مع الجلسات الأخرى"""
+    with _lock:
+        if session_id is None:
+            _, session = _session()
+        else:
+            # بدون تحديث وقت آخر نشاط حتى لا تبدو الجلسات الخاملة نشطة
+            session = _sessions.get(session_id, {"objects": {}})
+        footprint = {"resident": 0, "spilled": 0, "shared": 0, "objects": len(session["objects"])}
+        for entry in session["objects"].values():
+            if entry["shared"]:
+                footprint["shared"] += entry["bytes"]
+            elif entry["value"] is None:
+                footprint["spilled"] += entry["bytes"]
+            else:
+                footprint["resident"] += entry["bytes"]
+        return footprint
+
+
+def memory_report():
+    """ملخص ذاكرة جميع الجلسات في العملية"""
+    with _lock:
+        sessions = {session_id: session_footprint(session_id) for session_id in list(_sessions)}
+        return {
+            "cap": MEMORY_CAP_BYTES,
+            "resident": sum(f["resident"] for f in sessions.values()),
+            "sessions": sessions
+        }
+
+
+def render_memory_panel(container):
+    """عرض حجم ذاكرة الجلسة الحالية والمجموع العام"""
+    footprint = session_footprint()
+    report = memory_report()
+
+    container.caption(
+        f"💾 ذاكرة الجلسة: {format_bytes(footprint['resident'])}"
+        f" (على القرص {format_bytes(footprint['spilled'])}، مشتركة {format_bytes(footprint['shared'])})"
+        f" — جميع الجلسات ({len(report['sessions'])}): "
+        f"{format_bytes(report['resident'])} / {format_bytes(report['cap'])}"
+    )
@@ -0,0 +1,288 @@
+"""نشر البيانات مرة واحدة في الذاكرة المشتركة لتقرأها العمليات العاملة دون نسخ أو تسلسل
+
+كل مجموعة بيانات تُكتب عموداً بعمود في قطعة multiprocessing.shared_memory واحدة، ولا يُرسل إلى
+العملية العاملة إلا وصف صغير (اسم القطعة وأنواع الأعمدة ومواضعها). الأعمدة الرقمية تُقرأ كما هي
+(مصفوفات numpy للقراءة فقط فوق الذاكرة المشتركة)، والأعمدة الرقمية القابلة للقيم الناقصة
+(Int64، Float64، boolean) كمصفوفة قيم + قناع، والتواريخ ذات المنطقة الزمنية كتواريخ UTC + اسم المنطقة،
+فتعود كلها بنفس نوعها. بقية الأعمدة (النصية) تُنشر كرموز رقمية + قائمة القيم المختلفة فتصل إلى
+العاملة كأعمدة category.
+"""
+import atexit
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# أصغر حجم (بايت) يستحق النشر بدل الإرسال العادي، وعدد المجموعات المنشورة المحتفظ بها
+SHARED_MIN_BYTES = int(os.environ.get("ECON_APP_SHARED_MIN_BYTES", str(1024 ** 2)))
+SHARED_MAX_DATASETS = int(os.environ.get("ECON_APP_SHARED_DATASETS", "8"))
+
+# محاذاة بداية كل عمود داخل القطعة
+_ALIGNMENT = 64
+
+# أنواع numpy التي تُنشر كما هي (أرقام، منطقية، تواريخ دون منطقة زمنية)
+_RAW_KINDS = "biufcmM"
+
+# أنواع pandas الرقمية ذات القناع (Int64، Float64، boolean...)
+_MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+_lock = threading.Lock()
+_published = OrderedDict()
+_attached = OrderedDict()
+
+
+# ========== النشر (في عملية الخادم) ==========
+def _is_masked(dtype):
+    return (
+        isinstance(dtype, pd.api.extensions.ExtensionDtype)
+        and issubclass(dtype.construct_array_type(), _MASKED_ARRAYS)
+    )
+
+
+def _column_arrays(df):
+    """(الوصف، المصفوفات) لكل عمود بالترتيب: القيم، ثم قناع القيم الناقصة للأنواع ذات القناع"""
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i]
+        column = {"categories": None, "extension": None, "tz": None}
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in _RAW_KINDS:
+            arrays = [np.ascontiguousarray(values.to_numpy())]
+        elif isinstance(values.dtype, pd.DatetimeTZDtype):
+            column["tz"] = str(values.dtype.tz)
+            arrays = [np.ascontiguousarray(values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy())]
+        elif _is_masked(values.dtype):
+            column["extension"] = values.dtype.name
+            mask = values.isna().to_numpy()
+            data = values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=values.dtype.numpy_dtype.type(0))
+            arrays = [np.ascontiguousarray(data), np.ascontiguousarray(mask)]
+        else:
+            codes, column["categories"] = pd.factorize(values, use_na_sentinel=True)
+            arrays = [codes.astype(np.min_scalar_type(-max(len(column["categories"]), 1)))]
+        column["dtype"] = arrays[0].dtype.str
+        yield column, arrays
+
+
+def _write_segment(arrays):
+    """قطعة ذاكرة مشتركة تحتوي المصفوفات متتالية، مع موضع كل منها"""
+    offsets = []
+    size = 0
+    for array in arrays:
+        size = -(-size // _ALIGNMENT) * _ALIGNMENT
+        offsets.append(size)
+        size += array.nbytes
+
+    segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for array, offset in zip(arrays, offsets):
+        np.ndarray(array.shape, array.dtype, buffer=segment.buf, offset=offset)[...] = array
+    return segment, offsets
+
+
+def _publish_frame(df):
+    index_names = None
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        # الفهرس غير الافتراضي يُنشر كأعمدة إضافية ويُعاد بناؤه عند القراءة
+        index_names = list(df.index.names)
+        df = df.reset_index(names=[f"__index_{i}__" for i in range(df.index.nlevels)])
+
+    columns, column_arrays = zip(*_column_arrays(df)) if df.shape[1] else ((), ())
+    segment, offsets = _write_segment([array for arrays in column_arrays for array in arrays])
+    offsets = iter(offsets)
+    for column, name, arrays in zip(columns, df.columns, column_arrays):
+        column.update(name=name, offset=next(offsets), mask=next(offsets) if len(arrays) > 1 else None)
+
+    descriptor = {"kind": "frame", "rows": len(df), "columns": list(columns), "index": index_names}
+    return segment, descriptor
+
+
+def _publish_array(array):
+    array = np.ascontiguousarray(array)
+    segment, (offset,) = _write_segment([array])
+    return segment, {"kind": "array", "dtype": array.dtype.str, "shape": array.shape, "offset": offset}
+
+
+def _value_key(value):
+    if isinstance(value, pd.DataFrame):
+        from econ_app.data_viewer import dataset_key
+        return "df:" + dataset_key(value)
+
+    digest = hashlib.sha1(f"{value.dtype}:{value.shape}:".encode())
+    digest.update(np.ascontiguousarray(value).tobytes())
+    return "array:" + digest.hexdigest()
+
+
+def publish(value, key=None):
+    """نشر DataFrame أو مصفوفة numpy (مرة واحدة لكل مفتاح) وإعادة الوصف الذي يُرسل إلى العاملة
+
+    كل نشر يحجز المجموعة حتى استدعاء release(key)؛ المجموعات غير المحجوزة تبقى منشورة
+    لإعادة استخدامها إلى أن تُزاح بعد تجاوز SHARED_MAX_DATASETS.
+    """
+    key = key or _value_key(value)
+
+    with _lock:
+        entry = _published.get(key)
+        if entry is None:
+            if isinstance(value, pd.DataFrame):
+                segment, descriptor = _publish_frame(value)
+            else:
+                segment, descriptor = _publish_array(value)
+            descriptor.update(shared=segment.name, key=key)
+            entry = {"segment": segment, "descriptor": descriptor, "users": 0}
+            _published[key] = entry
+
+        entry["users"] += 1
+        _published.move_to_end(key)
+        _evict()
+        return entry["descriptor"]
+
+
+def release(key):
+    """فك حجز مجموعة منشورة (تبقى متاحة لإعادة الاستخدام إلى أن تُزاح)"""
+    with _lock:
+        entry = _published.get(key)
+        if entry is not None:
+            entry["users"] = max(entry["users"] - 1, 0)
+            _evict()
+
+
+def _unlink(entry):
+    # العمليات التي ربطت القطعة تحتفظ بها حتى تغلقها؛ الحذف يمنع الربط الجديد فقط
+    entry["segment"].unlink()
+    try:
+        entry["segment"].close()
+    except BufferError:
+        pass
+
+
+def _evict():
+    """إزالة أقدم المجموعات غير المحجوزة بعد تجاوز الحد"""
+    for key in list(_published):
+        if len(_published) <= SHARED_MAX_DATASETS:
+            break
+        if _published[key]["users"] == 0:
+            _unlink(_published.pop(key))
+
+
+@atexit.register
+def release_all():
+    """حذف جميع القطع المنشورة (عند إنهاء العملية)"""
+    with _lock:
+        while _published:
+            _unlink(_published.popitem()[1])
+
+
+def rows(descriptor, start, stop):
+    """وصف نطاق صفوف [start, stop) من DataFrame منشور (يُقرأ كعرض دون نسخ)"""
+    return dict(descriptor, start=start, stop=stop)
+
+
+def is_descriptor(value):
+    return isinstance(value, dict) and "shared" in value and "kind" in value
+
+
+def share_args(args, kwargs):
+    """استبدال DataFrame والمصفوفات الكبيرة في المعاملات بأوصاف منشورة
+
+    يعيد (args، kwargs، المفاتيح المحجوزة) — تُمرر المفاتيح إلى release بعد انتهاء المهمة.
+    """
+    keys = []
+
+    def share(value):
+        if isinstance(value, pd.DataFrame):
+            size = value.memory_usage(index=True, deep=False).sum()
+        elif isinstance(value, np.ndarray) and value.dtype.kind in _RAW_KINDS:
+            size = value.nbytes
+        else:
+            return value
+        if size < SHARED_MIN_BYTES:
+            return value
+
+        descriptor = publish(value)
+        keys.append(descriptor["key"])
+        return descriptor
+
+    return (
+        tuple(share(value) for value in args),
+        {name: share(value) for name, value in kwargs.items()},
+        keys
+    )
+
+
+def shared_info():
+    """عدد المجموعات المنشورة وحجمها الإجمالي"""
+    with _lock:
+        return {
+            "datasets": len(_published),
+            "pinned": sum(1 for entry in _published.values() if entry["users"]),
+            "bytes": sum(entry["segment"].size for entry in _published.values())
+        }
+
+
+# ========== القراءة (في العملية العاملة) ==========
+def _view(segment, dtype, shape, offset):
+    array = np.ndarray(shape, np.dtype(dtype), buffer=segment.buf, offset=offset)
+    array.flags.writeable = False
+    return array
+
+
+def _build(segment, descriptor):
+    if descriptor["kind"] == "array":
+        return _view(segment, descriptor["dtype"], descriptor["shape"], descriptor["offset"])
+
+    columns = {}
+    for i, column in enumerate(descriptor["columns"]):
+        values = _view(segment, column["dtype"], (descriptor["rows"],), column["offset"])
+        if column["categories"] is not None:
+            values = pd.Categorical.from_codes(values, categories=column["categories"])
+        elif column["mask"] is not None:
+            mask = _view(segment, "|b1", (descriptor["rows"],), column["mask"])
+            values = pd.api.types.pandas_dtype(column["extension"]).construct_array_type()(values, mask)
+        elif column["tz"] is not None:
+            values = pd.Series(values).dt.tz_localize("UTC").dt.tz_convert(column["tz"]).array
+        columns[i] = values
+
+    df = pd.DataFrame(columns, index=pd.RangeIndex(descriptor["rows"]), copy=False)
+    df.columns = [column["name"] for column in descriptor["columns"]]
+
+    if descriptor["index"] is not None:
+        index_columns = list(df.columns[:len(descriptor["index"])])
+        df = df.set_index(index_columns)
+        df.index.names = descriptor["index"]
+    return df
+
+
+def attach(descriptor):
+    """DataFrame أو مصفوفة للقراءة فقط فوق الذاكرة المشتركة (تُربط مرة واحدة لكل عملية)"""
+    name = descriptor["shared"]
+
+    with _lock:
+        entry = _attached.get(name)
+        if entry is None:
+            # العاملة تشارك متتبع موارد العملية الأم، فالقطعة تبقى مسجلة مرة واحدة وتحذفها الأم
+            segment = shared_memory.SharedMemory(name=name)
+            entry = (segment, _build(segment, descriptor))
+            _attached[name] = entry
+            while len(_attached) > SHARED_MAX_DATASETS:
+                # مرجع الإطار يُترك قبل الإغلاق، وإلا بقيت مصفوفاته تشير إلى القطعة دائماً
+                old_segment = _attached.popitem(last=False)[1][0]
+                try:
+                    old_segment.close()
+                except BufferError:
+                    # ما زالت نتيجة سابقة تشير إلى القطعة؛ تُغلق عند تحرير آخر مرجع
+                    pass
+        _attached.move_to_end(name)
+
+    value = entry[1]
+    if "start" in descriptor:
+        value = value.iloc[descriptor["start"]:descriptor["stop"]].reset_index(drop=True)
+    return value
+
+
+def attach_args(args, kwargs):
+    """عكس share_args داخل العملية العاملة"""
+    def resolve(value):
+        return attach(value) if is_descriptor(value) else value
+
+    return tuple(resolve(value) for value in args), {name: resolve(value) for name, value in kwargs.items()}
@@ -0,0 +1,114 @@
+"""مخزن بيانات مشترك بين الجلسات: نسخة واحدة للقراءة فقط لكل مجموعة بيانات في العملية
+
+كل جلسة تحصل على عرض سطحي (df.copy(deep=False)) يشارك الأعمدة مع النسخة المشتركة؛
+مع النسخ عند الكتابة (Copy-on-Write) لا تُنسخ البيانات إلا إذا عدّلت الجلسة عرضها.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import streamlit as st
+
+from econ_app.session_memory import forget_everywhere, remember, recall, object_size
+
+# النسخ عند الكتابة مفعّل دائماً منذ pandas 3.0، ويُفعَّل يدوياً في الإصدارات السابقة
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# عدد الملفات المرفوعة المحفوظة بعد تحليلها وحجمها الإجمالي الأقصى (الأقدم استخداماً يُحذف أولاً)
+MAX_SHARED_UPLOADS = 32
+SHARED_UPLOAD_BYTES = int(float(os.environ.get("ECON_APP_SHARED_UPLOADS_MB", "512")) * 1024 * 1024)
+
+_uploads_lock = threading.Lock()
+_uploads = OrderedDict()
+
+
+# ========== المخزن المشترك ==========
+@st.cache_resource(show_spinner=False)
+def shared_frames(name, _builder):
+    """بيانات يبنيها _builder مرة واحدة لكل عملية وتُشارك بين جميع الجلسات"""
+    return _builder()
+
+
+def parse_upload(content, file_type):
+    """تحليل محتوى ملف مرفوع (Excel أو CSV) إلى DataFrame"""
+    if file_type == "Excel":
+        return pd.read_excel(io.BytesIO(content))
+    return pd.read_csv(io.BytesIO(content), encoding='utf-8')
+
+
+def _parsed_upload(content_key, content, file_type):
+    """تحليل ملف مرفوع مرة واحدة لكل محتوى (نفس الملف من عدة طلاب يُقرأ مرة واحدة)
+
+    بيانات الملفات تُحسب مرة واحدة في المخزن (لا في كل جلسة)، والمخزن محدود بعدد الملفات
+    وبحجمها الإجمالي (SHARED_UPLOAD_BYTES). الملف المحذوف منه تُحذف عروضه من كل الجلسات
+    فتتحرر بياناته فعلاً، وتعيد الجلسة التي ما زالت تعرضه تحليله عند التشغيل التالي.
+    """
+    with _uploads_lock:
+        entry = _uploads.get(content_key)
+        if entry is not None:
+            _uploads.move_to_end(content_key)
+            return entry[0]
+
+    df = parse_upload(content, file_type)
+
+    evicted = []
+    with _uploads_lock:
+        _uploads[content_key] = (df, object_size(df))
+        total = sum(size for _, size in _uploads.values())
+        # الملف الأحدث يبقى ولو تجاوز الحد وحده، حتى لا يُعاد تحليله في كل إعادة تشغيل
+        while len(_uploads) > 1 and (len(_uploads) > MAX_SHARED_UPLOADS or total > SHARED_UPLOAD_BYTES):
+            old_key, (_, size) = _uploads.popitem(last=False)
+            evicted.append(old_key)
+            total -= size
+
+    for old_key in evicted:
+        forget_everywhere(f"view:upload:{old_key}")
+    return df
+
+
+def shared_upload(uploaded_file, file_type):
+    """DataFrame لملف مرفوع، مفتاحه بصمة محتوى الملف: عرض خاص بالجلسة فوق نسخة المخزن المشتركة"""
+    content = uploaded_file.getvalue()
+    content_key = hashlib.sha1(content).hexdigest()
+    df = _parsed_upload(content_key, content, file_type)
+    return session_view(f"upload:{content_key}", df)
+
+
+def shared_uploads_info():
+    """عدد الملفات المرفوعة في المخزن المشترك وحجمها الإجمالي"""
+    with _uploads_lock:
+        return {
+            "uploads": len(_uploads),
+            "bytes": sum(size for _, size in _uploads.values()),
+            "max_bytes": SHARED_UPLOAD_BYTES
+        }
+
+
+def clear_shared_uploads():
+    """تفريغ مخزن الملفات المرفوعة المشترك (مع عروضه في الجلسات)"""
+    with _uploads_lock:
+        keys = list(_uploads)
+        _uploads.clear()
+    for content_key in keys:
+        forget_everywhere(f"view:upload:{content_key}")
+
+
+# ========== عروض الجلسة ==========
+def session_view(name, df, shared=True):
+    """عرض خاص بالجلسة للبيانات المشتركة يبقى نفس الكائن بين إعادات التشغيل
+
+    ثبات الكائن يحافظ على بصمة dataset_key المحفوظة حسب الهوية، فلا يُعاد حساب
+    الفهارس والرسوم المخزنة مؤقتاً في كل إعادة تشغيل. ذاكرة الجلسة تحفظ العرض ومعرّف
+    المصدر فقط (لا المصدر نفسه). العرض يشارك أعمدة المصدر، فيُحسب مع البيانات المشتركة
+    (shared=True) لا ضمن حد الجلسات؛ shared=False لعروض بيانات خاصة بالجلسة وحدها.
+    """
+    key = f"view:{name}"
+    entry = recall(key)
+    if entry is None or entry[0] != id(df):
+        view = df.copy(deep=False)
+        entry = remember(key, (id(df), view), shared=shared, size=object_size(view))
+    return entry[1]
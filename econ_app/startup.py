@@ -0,0 +1,161 @@
+"""استيراد الوحدات الثقيلة عند الطلب، تسخينها في الخلفية، وقياس زمن بدء التشغيل"""
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+
+from econ_app import profiler
+
+logger = logging.getLogger(__name__)
+
+# ميزانية زمن التشغيل البارد (ثوانٍ) وتفعيل التسخين يمكن تغييرهما عبر متغيرات البيئة
+STARTUP_BUDGET_S = float(os.environ.get("ECON_APP_STARTUP_BUDGET_S", "3.0"))
+WARMUP_ENABLED = os.environ.get("ECON_APP_WARMUP", "1") != "0"
+SHOW_TIMINGS = os.environ.get("ECON_APP_SHOW_TIMINGS", "0") == "1"
+
+# مكتبات ثقيلة لا تحتاجها الصفحة الأولى
+HEAVY_MODULES = (
+    "plotly.express",
+    "plotly.graph_objects",
+    "scipy.special",
+    "openpyxl",
+    "pyarrow"
+)
+
+_lock = threading.Lock()
+_import_timings = {}
+_cold_start = None
+_warmup_thread = None
+_run = threading.local()
+
+
+# ========== الاستيراد عند الطلب ==========
+def import_module(name, source="page"):
+    """استيراد وحدة مع تسجيل زمن استيرادها البارد (أول مرة في العملية)"""
+    # importlib يأخذ قفل الوحدة فينتظر اكتمال استيراد بدأه خيط التسخين بدل إرجاع وحدة نصف مستوردة
+    # من sys.modules، وهو سريع للوحدات المستوردة كاملاً
+    cold = name not in sys.modules
+
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - started
+
+    if cold:
+        with _lock:
+            _import_timings.setdefault(name, {"seconds": elapsed, "source": source})
+    return module
+
+
+def _warmup(modules):
+    for name in modules:
+        try:
+            import_module(name, source="warmup")
+        except ImportError:
+            # المكتبات الاختيارية (مثل pyarrow) قد لا تكون مثبتة
+            logger.debug("تخطي تسخين %s: غير مثبتة", name)
+
+
+def start_warmup(extra_modules=()):
+    """تحميل المكتبات الثقيلة ووحدات الصفحات في خيط خلفي بعد أول عرض (مرة واحدة لكل عملية)"""
+    global _warmup_thread
+
+    if not WARMUP_ENABLED:
+        return None
+
+    with _lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=_warmup,
+                args=(HEAVY_MODULES + tuple(extra_modules),),
+                name="econ_app-warmup",
+                daemon=True
+            )
+            _warmup_thread.start()
+    return _warmup_thread
+
+
+# ========== قياس زمن التشغيل ==========
+def begin_run(app):
+    """بداية تشغيل السكربت app: تصفير مراحل القياس لهذا الخيط (والمحلل عند تفعيله)"""
+    now = time.perf_counter()
+    _run.started = now
+    _run.last = now
+    _run.stages = []
+    profiler.begin_run(app)
+
+
+def mark(stage):
+    """تسجيل زمن المرحلة المنتهية منذ آخر علامة"""
+    if not hasattr(_run, "started"):
+        return
+
+    now = time.perf_counter()
+    _run.stages.append((stage, now - _run.last))
+    _run.last = now
+    profiler.mark(stage)
+
+
+def end_run():
+    """نهاية التشغيل: يُحفظ أول تشغيل في العملية كتشغيل بارد ويُقارن بالميزانية"""
+    global _cold_start
+
+    if not hasattr(_run, "started"):
+        return None
+    profiler.end_run()
+
+    report = {
+        "total": time.perf_counter() - _run.started,
+        "stages": list(_run.stages)
+    }
+
+    with _lock:
+        is_cold = _cold_start is None
+        if is_cold:
+            _cold_start = report
+
+    if is_cold:
+        stages = ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in report["stages"])
+        logger.info("التشغيل البارد: %.3fs (%s)", report["total"], stages)
+        if report["total"] > STARTUP_BUDGET_S:
+            logger.warning(
+                "زمن التشغيل البارد %.3fs يتجاوز الميزانية %.1fs",
+                report["total"], STARTUP_BUDGET_S
+            )
+    return report
+
+
+def startup_report():
+    """ملخص التشغيل البارد وأزمنة استيراد الوحدات مرتبة تنازلياً"""
+    with _lock:
+        imports = sorted(_import_timings.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        return {
+            "budget": STARTUP_BUDGET_S,
+            "cold_start": _cold_start,
+            "imports": [
+                {"module": name, "seconds": info["seconds"], "source": info["source"]}
+                for name, info in imports
+            ]
+        }
+
+
+def render_timings(container):
+    """عرض تفصيل أزمنة التشغيل في الشريط الجانبي (عند ECON_APP_SHOW_TIMINGS=1)"""
+    if not SHOW_TIMINGS:
+        return
+
+    report = startup_report()
+    expander = container.expander("⏱️ زمن بدء التشغيل")
+
+    cold_start = report["cold_start"]
+    if cold_start is not None:
+        status = "✅" if cold_start["total"] <= report["budget"] else "⚠️"
+        expander.caption(
+            f"{status} التشغيل البارد: {cold_start['total']:.2f} ث (الميزانية {report['budget']:.1f} ث)"
+        )
+        for stage, seconds in cold_start["stages"]:
+            expander.caption(f"• {stage}: {seconds:.3f} ث")
+
+    for item in report["imports"]:
+        expander.caption(f"📦 {item['module']} ({item['source']}): {item['seconds']:.3f} ث")
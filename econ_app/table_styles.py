@@ -0,0 +1,54 @@
+"""تنسيق الجداول بأقنعة متجهة بدل دوال Styler التي تُستدعى لكل خلية"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# فوق هذا العدد من الصفوف يُستبدل التلوين برموز في الخلايا (Styler يولّد CSS لكل خلية)
+STYLE_MAX_ROWS = int(os.environ.get("ECON_APP_STYLE_MAX_ROWS", "2000"))
+
+
+# ========== شروط متجهة على الخلايا ==========
+def _cells(frame):
+    return frame.to_numpy(dtype=str)
+
+
+def cell_equals(value):
+    """شرط: الخلية تساوي value"""
+    return lambda frame: _cells(frame) == value
+
+
+def cell_contains(text):
+    """شرط: الخلية تحتوي النص text"""
+    return lambda frame: np.char.find(_cells(frame), text) >= 0
+
+
+# ========== التنسيق ==========
+def css_masks(frame, rules, default=""):
+    """CSS لكل خلية: أول قاعدة (شرط، نمط، رمز) يتحقق شرطها، وإلا default"""
+    conditions = [condition(frame) for condition, _, _ in rules]
+    css = np.select(conditions, [style for _, style, _ in rules], default=default)
+    return pd.DataFrame(css, index=frame.index, columns=frame.columns)
+
+
+def marker_masks(frame, rules, default_marker=""):
+    """رمز لكل خلية بنفس القواعد (بديل التلوين في الجداول الكبيرة)"""
+    conditions = [condition(frame) for condition, _, _ in rules]
+    markers = np.select(conditions, [marker for _, _, marker in rules], default=default_marker)
+    return pd.DataFrame(markers, index=frame.index, columns=frame.columns)
+
+
+def styled_table(frame, rules, subset=None, default="", default_marker=""):
+    """جدول جاهز لـ st.dataframe: Styler بقناع واحد للجداول الصغيرة، ورموز نصية للكبيرة"""
+    subset = list(frame.columns if subset is None else subset)
+    target = frame[subset]
+
+    if len(frame) <= STYLE_MAX_ROWS:
+        css = css_masks(target, rules, default)
+        # استدعاء واحد للجدول كله يعيد القناع المحسوب مسبقاً
+        return frame.style.apply(lambda _: css, axis=None, subset=subset)
+
+    markers = marker_masks(target, rules, default_marker)
+    marked = frame.copy()
+    marked[subset] = (markers + " " + target.astype(str)).apply(lambda column: column.str.strip())
+    return marked
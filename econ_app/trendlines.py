@@ -0,0 +1,157 @@
+"""خطوط الاتجاه بصيغ مغلقة O(n) بدل trendline="ols" في plotly (بدون statsmodels)"""
+import numpy as np
+
+TRENDLINE_METHODS = {
+    "خطي (OLS)": "ols",
+    "مقاوم للقيم الشاذة (Huber)": "robust",
+    "محلي (LOWESS)": "lowess"
+}
+
+
+def _finite_pairs(x, y):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = np.isfinite(x) & np.isfinite(y)
+    return x[keep], y[keep]
+
+
+# ========== الانحدار الخطي من المجاميع ==========
+def fit_sums(x, y, weights=None):
+    """المجاميع الكافية للانحدار الخطي (مُزاحة حول أول نقطة لتفادي فقدان الدقة)"""
+    x, y = _finite_pairs(x, y)
+    if len(x) == 0:
+        return {"n": 0, "x0": 0.0, "y0": 0.0, "sx": 0.0, "sy": 0.0, "sxx": 0.0, "sxy": 0.0, "syy": 0.0}
+
+    x0, y0 = float(x[0]), float(y[0])
+    dx, dy = x - x0, y - y0
+    w = np.ones_like(dx) if weights is None else np.asarray(weights, dtype=float)
+
+    return {
+        "n": float(w.sum()),
+        "x0": x0,
+        "y0": y0,
+        "sx": float(w @ dx),
+        "sy": float(w @ dy),
+        "sxx": float(w @ (dx * dx)),
+        "sxy": float(w @ (dx * dy)),
+        "syy": float(w @ (dy * dy))
+    }
+
+
+def linear_from_sums(sums):
+    """الميل والمقطع و R² من المجاميع الكافية"""
+    n = sums["n"]
+    if n < 2:
+        return None
+
+    sxx = sums["sxx"] - sums["sx"] ** 2 / n
+    sxy = sums["sxy"] - sums["sx"] * sums["sy"] / n
+    syy = sums["syy"] - sums["sy"] ** 2 / n
+    if sxx <= 0:
+        return None
+
+    slope = sxy / sxx
+    mean_x = sums["x0"] + sums["sx"] / n
+    mean_y = sums["y0"] + sums["sy"] / n
+
+    return {
+        "slope": slope,
+        "intercept": float(mean_y - slope * mean_x),
+        "r_squared": (sxy * sxy) / (sxx * syy) if syy > 0 else 0.0,
+        "n": n
+    }
+
+
+def _p_value(slope, r_squared, n):
+    """احتمال الدلالة للميل (اختبار t بدرجات حرية n - 2) كما في scipy.stats.linregress"""
+    if n <= 2:
+        return 0.0 if slope != 0 else 1.0
+    if r_squared >= 1.0:
+        return 0.0
+
+    from scipy.special import stdtr
+
+    t_stat = np.sqrt(r_squared * (n - 2) / (1.0 - r_squared))
+    return float(2 * stdtr(n - 2, -t_stat))
+
+
+def linear_fit(x, y, p_value=False):
+    """انحدار خطي بصيغة مغلقة: slope و intercept و r_squared (و p_value عند الطلب)"""
+    fit = linear_from_sums(fit_sums(x, y))
+    if fit is not None and p_value:
+        fit["p_value"] = _p_value(fit["slope"], fit["r_squared"], fit["n"])
+    return fit
+
+
+# ========== البدائل: مقاوم و LOWESS ==========
+def robust_fit(x, y, iterations=20, tuning=1.345, progress=None):
+    """انحدار Huber بالمربعات الصغرى الموزونة المتكررة (كل تكرار O(n))"""
+    x, y = _finite_pairs(x, y)
+    fit = linear_from_sums(fit_sums(x, y))
+    if fit is None:
+        return None
+
+    for iteration in range(iterations):
+        if progress is not None:
+            progress(iteration / iterations, "Huber")
+        residuals = y - (fit["intercept"] + fit["slope"] * x)
+        # مقياس البواقي المقاوم (MAD)
+        scale = np.median(np.abs(residuals - np.median(residuals))) / 0.6745
+        if scale == 0:
+            break
+
+        scaled = np.abs(residuals) / (tuning * scale)
+        weights = np.where(scaled <= 1, 1.0, 1.0 / np.maximum(scaled, 1e-12))
+
+        new_fit = linear_from_sums(fit_sums(x, y, weights))
+        if new_fit is None:
+            break
+        converged = abs(new_fit["slope"] - fit["slope"]) <= 1e-10 * max(1.0, abs(fit["slope"]))
+        fit = new_fit
+        if converged:
+            break
+
+    return fit
+
+
+def lowess_curve(x, y, frac=2 / 3, points=100, progress=None):
+    """منحنى LOWESS (انحدار خطي محلي بأوزان tricube) مقيَّماً على شبكة من النقاط"""
+    x, y = _finite_pairs(x, y)
+    n = len(x)
+    if n < 3:
+        return x, y
+
+    grid = np.linspace(x.min(), x.max(), min(points, n))
+    span = max(int(np.ceil(frac * n)), 2)
+    fitted = np.empty_like(grid)
+
+    for i, x_star in enumerate(grid):
+        if progress is not None:
+            progress(i / len(grid), "LOWESS")
+        distances = np.abs(x - x_star)
+        radius = np.partition(distances, span - 1)[span - 1]
+        if radius == 0:
+            radius = distances.max() or 1.0
+        weights = np.clip(1 - (distances / radius) ** 3, 0, None) ** 3
+
+        fit = linear_from_sums(fit_sums(x, y, weights))
+        if fit is None:
+            fitted[i] = np.average(y, weights=weights) if weights.sum() > 0 else np.nan
+        else:
+            fitted[i] = fit["intercept"] + fit["slope"] * x_star
+
+    return grid, fitted
+
+
+def trendline_points(x, y, method="ols", progress=None):
+    """نقاط خط الاتجاه للرسم: نقطتان للخط المستقيم، وشبكة لـ LOWESS"""
+    if method == "lowess":
+        return lowess_curve(x, y, progress=progress)
+
+    fit = robust_fit(x, y, progress=progress) if method == "robust" else linear_fit(x, y)
+    if fit is None:
+        return np.array([]), np.array([])
+
+    x_values, _ = _finite_pairs(x, y)
+    line_x = np.array([x_values.min(), x_values.max()])
+    return line_x, fit["intercept"] + fit["slope"] * line_x
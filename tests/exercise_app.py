@@ -0,0 +1,6 @@
+"""تطبيق اختبار يعرض قسم التمارين وحده (AppTest.from_file)"""
+from econ_app.mgdp_chapters import exercises
+
+# العمليات العاملة (spawn) تعيد تنفيذ ملف السكربت الرئيسي باسم __mp_main__
+if __name__ == "__main__":
+    exercises.render(None, None)
@@ -0,0 +1,98 @@
+"""اختبارات تقليص السلاسل (econ_app.downsample): LTTB، القص بالنطاق، وأنواع المحور الأفقي"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_app.downsample import axis_kind, downsample_frame, lttb_indices
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_lttb_keeps_endpoints_and_extremes(seed):
+    rng = np.random.default_rng(seed)
+    y = rng.normal(size=5000).cumsum()
+    x = np.arange(len(y), dtype=float)
+
+    indices = lttb_indices(x, y, 200)
+
+    assert np.all(np.diff(indices) > 0)
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert np.argmin(y) in indices and np.argmax(y) in indices
+    assert len(indices) <= 202
+
+
+def test_lttb_short_series_is_unchanged():
+    assert np.array_equal(lttb_indices([0, 1, 2], [5, 1, 3], 10), np.arange(3))
+
+
+def _series_frame(x):
+    y = np.sin(np.linspace(0, 60, len(x))) + np.linspace(0, 1, len(x))
+    y[len(x) // 3] = 10.0
+    y[2 * len(x) // 3] = -10.0
+    return pd.DataFrame({"x": x, "y": y})
+
+
+def test_downsample_frame_numeric_keeps_extremes():
+    df = _series_frame(np.arange(6000))
+
+    result = downsample_frame(df, "x", "y", max_points=300)
+
+    assert len(result) <= 302
+    assert result["y"].max() == 10.0 and result["y"].min() == -10.0
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "ns"])
+def test_downsample_frame_datetime_range_from_slider(unit):
+    dates = pd.date_range("2000-01-01", periods=6000, freq="D").as_unit(unit)
+    df = _series_frame(dates)
+    # st.slider يعيد datetime عادياً (ميكروثانية) بغض النظر عن وحدة العمود
+    x_range = (datetime.datetime(2005, 1, 1), datetime.datetime(2006, 1, 1))
+
+    result = downsample_frame(df, "x", "y", max_points=1000, x_range=x_range)
+
+    assert len(result) == 366
+    assert result["x"].min() == pd.Timestamp("2005-01-01")
+    assert result["x"].max() == pd.Timestamp("2006-01-01")
+
+
+def test_downsample_frame_tz_aware_datetime_range():
+    dates = pd.date_range("2000-01-01", periods=6000, freq="D", tz="Europe/Paris")
+    df = _series_frame(dates)
+    x_range = (dates[100].to_pydatetime(), dates[199].to_pydatetime())
+
+    result = downsample_frame(df, "x", "y", max_points=300, x_range=x_range)
+
+    assert list(result["x"]) == list(dates[100:200])
+
+
+def test_downsample_frame_string_axis_uses_row_position():
+    months = [f"{2000 + i // 12}-{i % 12 + 1:02d}" for i in range(3000)]
+    df = _series_frame(months)
+
+    assert axis_kind(df["x"]) == "position"
+    result = downsample_frame(df, "x", "y", max_points=300, x_range=("2001-01", "2002-01"))
+
+    assert 0 < len(result) <= 302
+    assert result["x"].iloc[0] == months[0] and result["x"].iloc[-1] == months[-1]
+    assert result["y"].max() == 10.0 and result["y"].min() == -10.0
+
+
+def test_downsample_frame_numeric_strings_are_numeric():
+    df = _series_frame([str(year) for year in range(6000)])
+
+    assert axis_kind(df["x"]) == "numeric"
+    result = downsample_frame(df, "x", "y", max_points=300, x_range=("100", "199"))
+
+    assert len(result) == 100
+
+
+def test_downsample_frame_drops_only_missing_rows():
+    df = _series_frame(np.arange(1000, dtype=float))
+    df.loc[[10, 20], "x"] = np.nan
+    df.loc[30, "y"] = np.nan
+
+    result = downsample_frame(df, "x", "y", max_points=5000)
+
+    assert len(result) == 997
+    assert not result[["x", "y"]].isna().any().any()
@@ -0,0 +1,94 @@
+"""اختبارات مجمع المهام عبر مسار إعادة التشغيل الحقيقي لـ Streamlit (AppTest)
+
+تتطلب streamlit وplotly (تُتخطى دونهما). المهام تُرسل إلى مجمع العمليات الفعلي.
+"""
+import io
+import os
+import signal
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("plotly")
+st = pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+from econ_app import jobs
+from econ_app.trendlines import TRENDLINE_METHODS
+
+EXERCISE_5 = "تمرين 5: تحميل وتحليل بيانات حقيقية"
+EXERCISE_APP = Path(__file__).with_name("exercise_app.py")
+
+
+def _upload(*args, **kwargs):
+    # AppTest لا يدعم st.file_uploader: ملف CSV ثابت بدل الرفع
+    content = "x,y\n" + "".join(f"{i},{2 * i + (i % 7)}\n" for i in range(500))
+    upload = io.BytesIO(content.encode())
+    upload.name = "data.csv"
+    return upload
+
+
+def _wait_for_jobs(timeout=30):
+    deadline = time.monotonic() + timeout
+    while jobs.jobs_info()["running"] or jobs.jobs_info()["queued"]:
+        assert time.monotonic() < deadline, jobs.jobs_info()
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def pooled(monkeypatch):
+    """كل مهمة تمر بالمجمع (مهما صغرت البيانات) مع تسجيل الخانة ومفتاح كل إرسال"""
+    submitted = []
+    submit = jobs.submit
+
+    def recording_submit(slot, func, *args, **kwargs):
+        job = submit(slot, func, *args, **kwargs)
+        submitted.append((slot, job["key"]))
+        return job
+
+    monkeypatch.setattr(jobs, "JOB_MIN_ROWS", 0)
+    monkeypatch.setattr(jobs, "submit", recording_submit)
+    monkeypatch.setattr(st, "file_uploader", _upload)
+    return submitted
+
+
+def test_trendline_change_submits_new_job_on_rerun(pooled):
+    at = AppTest.from_file(str(EXERCISE_APP), default_timeout=120)
+    at.run()
+    at.selectbox[0].set_value(EXERCISE_5).run()
+    at.button[0].click().run()
+    assert not at.exception
+
+    # المحددات تبقى بعد إعادة التشغيل التي تلي النقرة، وكل طريقة ترسل مهمة بمفتاح جديد
+    for label in list(TRENDLINE_METHODS)[1:]:
+        at.radio(key="ex5_trendline").set_value(label).run()
+        assert not at.exception
+        assert at.radio(key="ex5_trendline").value == label
+        assert at.selectbox(key="ex5_x").value == "x"
+
+    trendline_keys = [key for slot, key in pooled if slot == "ex5_trendline"]
+    assert len(set(trendline_keys)) == len(TRENDLINE_METHODS)
+
+    # الخانات تُحذف بعد انتهاء مهامها فلا تتراكم مع الجلسات
+    _wait_for_jobs()
+    assert jobs.jobs_info()["slots"] == 0
+
+
+def _kill_worker(progress=None):
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _echo(value, progress=None):
+    return value
+
+
+def test_pool_recovers_after_worker_dies():
+    job = jobs.submit("crash", _kill_worker)
+    with pytest.raises(jobs.BrokenProcessPool):
+        jobs.job_result(job, timeout=60)
+
+    # المهمة التالية تُرسل إلى مجمع جديد بدل فشل كل المهام حتى إعادة تشغيل الخادم
+    job = jobs.submit("crash", _echo, "ok")
+    assert jobs.job_result(job, timeout=60) == "ok"
+    assert jobs.jobs_info()["slots"] == 0
@@ -0,0 +1,80 @@
+"""اختبارات نشر البيانات في الذاكرة المشتركة وقراءتها (econ_app.shared_columns)"""
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_app import shared_columns
+
+
+def _frame():
+    rows = 6
+    return pd.DataFrame({
+        "int": np.arange(rows),
+        "float": np.linspace(0, 1, rows),
+        "bool": np.arange(rows) % 2 == 0,
+        "date": pd.date_range("2020-01-01", periods=rows, freq="D"),
+        "date_tz": pd.date_range("2020-03-29", periods=rows, freq="h", tz="Europe/Paris"),
+        "Int64": pd.array([1, None, 3, 4, None, 6], dtype="Int64"),
+        "Float64": pd.array([0.5, None, 1.5, 2.0, 2.5, None], dtype="Float64"),
+        "boolean": pd.array([True, None, False, True, False, None], dtype="boolean"),
+        "text": ["a", "b", None, "a", "c", "b"]
+    }, index=pd.date_range("2021-06-01", periods=rows, freq="min", tz="UTC", name="id"))
+
+
+def _check_roundtrip(attached, df):
+    # النصوص تصل كـ category (رموز + قيم)، وبقية الأعمدة بنفس نوعها
+    assert isinstance(attached["text"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(attached["text"].astype(df["text"].dtype), df["text"], check_freq=False)
+    pd.testing.assert_frame_equal(attached.drop(columns="text"), df.drop(columns="text"), check_freq=False)
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    monkeypatch.setattr(shared_columns, "_attached", OrderedDict())
+    keys = []
+
+    def publish(df, key):
+        keys.append(key)
+        return shared_columns.publish(df, key=key)
+
+    yield publish
+    for key in keys:
+        shared_columns.release(key)
+
+
+def test_roundtrip_keeps_dtypes(attached):
+    df = _frame()
+    _check_roundtrip(shared_columns.attach(attached(df, "test:roundtrip")), df)
+
+
+def test_rows_view(attached):
+    df = _frame().reset_index(drop=True)
+    descriptor = shared_columns.rows(attached(df, "test:rows"), 2, 5)
+    _check_roundtrip(shared_columns.attach(descriptor), df.iloc[2:5].reset_index(drop=True))
+
+
+def _attach_in_worker(descriptor):
+    return shared_columns.attach(descriptor)
+
+
+def test_roundtrip_in_spawn_worker(attached):
+    df = _frame()
+    descriptor = attached(df, "test:worker")
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        _check_roundtrip(pool.submit(_attach_in_worker, descriptor).result(timeout=120), df)
+
+
+def test_evicted_segment_is_closed(attached, monkeypatch):
+    monkeypatch.setattr(shared_columns, "SHARED_MAX_DATASETS", 1)
+    first = attached(_frame(), "test:evict-1")
+    shared_columns.attach(first)
+    segment = shared_columns._attached[first["shared"]][0]
+
+    shared_columns.attach(attached(_frame().iloc[:3], "test:evict-2"))
+
+    assert first["shared"] not in shared_columns._attached
+    assert segment.buf is None
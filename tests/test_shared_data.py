@@ -0,0 +1,95 @@
+"""اختبارات مخزن الملفات المرفوعة المشترك وذاكرة الجلسات (econ_app.shared_data، econ_app.session_memory)"""
+import io
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+
+from econ_app import session_memory, shared_data
+
+
+class Upload(io.BytesIO):
+    name = "data.csv"
+
+
+def _csv(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.normal(size=(rows, 4)), columns=list("abcd")).to_csv(index=False).encode()
+
+
+@pytest.fixture
+def sessions(monkeypatch, tmp_path):
+    """جلسات منفصلة دون Streamlit: set_session(معرّف) يحدد الجلسة الحالية"""
+    current = {"id": "s0"}
+    monkeypatch.setattr(session_memory, "current_session_id", lambda: current["id"])
+    monkeypatch.setattr(session_memory, "SPILL_DIR", str(tmp_path))
+    monkeypatch.setattr(session_memory, "_sessions", {})
+    shared_data.clear_shared_uploads()
+    yield lambda session_id: current.update(id=session_id)
+    shared_data.clear_shared_uploads()
+
+
+def test_upload_is_stored_once_for_all_sessions(sessions):
+    content = _csv(20000)
+    views = []
+    for i in range(20):
+        sessions(f"s{i}")
+        views.append(shared_data.shared_upload(Upload(content), "CSV"))
+
+    info = shared_data.shared_uploads_info()
+    assert info["uploads"] == 1
+    # البيانات تُحسب مرة واحدة في المخزن، لا في حد ذاكرة كل جلسة
+    assert session_memory.memory_report()["resident"] == 0
+    assert all(np.shares_memory(view["a"].to_numpy(), views[0]["a"].to_numpy()) for view in views)
+
+    # نفس العرض في إعادة التشغيل التالية للجلسة
+    assert shared_data.shared_upload(Upload(content), "CSV") is views[-1]
+
+
+def test_evicted_upload_drops_views_in_every_session(sessions, monkeypatch):
+    monkeypatch.setattr(shared_data, "MAX_SHARED_UPLOADS", 1)
+    first = _csv(100, seed=1)
+    for session_id in ("s1", "s2"):
+        sessions(session_id)
+        shared_data.shared_upload(Upload(first), "CSV")
+
+    shared_data.shared_upload(Upload(_csv(100, seed=2)), "CSV")
+
+    assert shared_data.shared_uploads_info()["uploads"] == 1
+    assert session_memory.session_footprint("s1")["objects"] == 0
+    assert session_memory.session_footprint("s2")["objects"] == 1
+
+
+def test_spill_and_recall_read_outside_lock(sessions, monkeypatch, tmp_path):
+    value = np.arange(100000, dtype=float)
+    session_memory.remember("big", value)
+    session_memory.enforce_cap(max_bytes=0)
+
+    footprint = session_memory.session_footprint()
+    assert footprint["resident"] == 0 and footprint["spilled"] == value.nbytes
+    assert len(list(tmp_path.rglob("*.pkl"))) == 1
+
+    lock_free = []
+    load = pickle.load
+
+    def checking_load(spill_file):
+        # جلسة أخرى تستطيع أخذ القفل أثناء قراءة القرص
+        def probe():
+            acquired = session_memory._lock.acquire(timeout=1)
+            lock_free.append(acquired)
+            if acquired:
+                session_memory._lock.release()
+
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        return load(spill_file)
+
+    monkeypatch.setattr(pickle, "load", checking_load)
+    assert np.array_equal(session_memory.recall("big"), value)
+    assert lock_free == [True]
+    assert not list(tmp_path.rglob("*.pkl"))